@@ -16,7 +16,9 @@ sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
 # Import SQLModel metadata and your database engine
 from sqlmodel import SQLModel
 from src.infrastructure.session import engine
-from src.domain.entity.drowsiness_event import DrowsinessEvent
+from src.domain.entity.drowsiness_event import DrowsinessEvent  # noqa: F401
+from src.domain.entity.drowsiness_event_rollup import DrowsinessEventRollup  # noqa: F401
+from src.domain.entity.pending_upload import PendingUpload  # noqa: F401
 
 # this is the Alembic Config object, which provides
 # access to the values within the .ini file in use.
@@ -0,0 +1,44 @@
+"""create pending_upload table
+
+Revision ID: 5c2f8e1a9d47
+Revises: 0be054e3435f
+Create Date: 2026-10-17 09:12:40.518204
+
+"""
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+import sqlmodel
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = '5c2f8e1a9d47'
+down_revision: Union[str, None] = '0be054e3435f'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table('pendingupload',
+    sa.Column('id', sa.Uuid(), nullable=False),
+    sa.Column('image', sa.String(), nullable=False),
+    sa.Column('event_type', sa.String(), nullable=False),
+    sa.Column('target', sqlmodel.sql.sqltypes.AutoString(), nullable=False),
+    sa.Column('ws_event', sqlmodel.sql.sqltypes.AutoString(), nullable=False),
+    sa.Column('created_at', sa.DateTime(), nullable=False),
+    sa.Column('attempts', sa.Integer(), nullable=False),
+    sa.Column('last_attempt_at', sa.DateTime(), nullable=True),
+    sa.Column('last_error', sqlmodel.sql.sqltypes.AutoString(), nullable=True),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index(op.f('ix_pendingupload_id'), 'pendingupload', ['id'], unique=False)
+    op.create_index(op.f('ix_pendingupload_created_at'), 'pendingupload', ['created_at'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index(op.f('ix_pendingupload_created_at'), table_name='pendingupload')
+    op.drop_index(op.f('ix_pendingupload_id'), table_name='pendingupload')
+    op.drop_table('pendingupload')
@@ -0,0 +1,30 @@
+"""add drowsiness_event query indexes
+
+Revision ID: 8a41d3c7b620
+Revises: 5c2f8e1a9d47
+Create Date: 2026-10-17 10:05:12.307418
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = '8a41d3c7b620'
+down_revision: Union[str, None] = '5c2f8e1a9d47'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index(op.f('ix_drowsinessevent_timestamp'), 'drowsinessevent', ['timestamp'], unique=False)
+    op.create_index('ix_drowsinessevent_event_type_timestamp', 'drowsinessevent', ['event_type', 'timestamp'], unique=False)
+    op.create_index('ix_drowsinessevent_vehicle_identification_timestamp', 'drowsinessevent', ['vehicle_identification', 'timestamp'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_drowsinessevent_vehicle_identification_timestamp', table_name='drowsinessevent')
+    op.drop_index('ix_drowsinessevent_event_type_timestamp', table_name='drowsinessevent')
+    op.drop_index(op.f('ix_drowsinessevent_timestamp'), table_name='drowsinessevent')
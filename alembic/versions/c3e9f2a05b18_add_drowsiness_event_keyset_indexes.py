@@ -0,0 +1,28 @@
+"""add drowsiness_event keyset indexes
+
+Revision ID: c3e9f2a05b18
+Revises: 8a41d3c7b620
+Create Date: 2026-10-17 10:48:33.904126
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = 'c3e9f2a05b18'
+down_revision: Union[str, None] = '8a41d3c7b620'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index('ix_drowsinessevent_event_type_id', 'drowsinessevent', ['event_type', 'id'], unique=False)
+    op.create_index('ix_drowsinessevent_vehicle_identification_id', 'drowsinessevent', ['vehicle_identification', 'id'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_drowsinessevent_vehicle_identification_id', table_name='drowsinessevent')
+    op.drop_index('ix_drowsinessevent_event_type_id', table_name='drowsinessevent')
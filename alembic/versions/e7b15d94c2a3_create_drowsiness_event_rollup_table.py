@@ -0,0 +1,44 @@
+"""create drowsiness_event_rollup table
+
+Revision ID: e7b15d94c2a3
+Revises: c3e9f2a05b18
+Create Date: 2026-10-17 11:31:06.215873
+
+"""
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = 'e7b15d94c2a3'
+down_revision: Union[str, None] = 'c3e9f2a05b18'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table('drowsinesseventrollup',
+    sa.Column('granularity', sa.String(), nullable=False),
+    sa.Column('bucket_start', sa.DateTime(), nullable=False),
+    sa.Column('vehicle_identification', sa.String(), nullable=False),
+    sa.Column('event_type', sa.String(), nullable=False),
+    sa.Column('count', sa.Integer(), nullable=False),
+    sa.PrimaryKeyConstraint('granularity', 'bucket_start', 'vehicle_identification', 'event_type')
+    )
+
+    # Backfill the rollups of the existing events, the bucket format matches how SQLAlchemy stores a DateTime in SQLite
+    for granularity, bucket_format in (('hour', '%Y-%m-%d %H:00:00.000000'), ('day', '%Y-%m-%d 00:00:00.000000')):
+        op.execute(
+            "INSERT INTO drowsinesseventrollup (granularity, bucket_start, vehicle_identification, event_type, count) "
+            f"SELECT '{granularity}', strftime('{bucket_format}', timestamp), vehicle_identification, event_type, COUNT(*) "
+            "FROM drowsinessevent "
+            f"GROUP BY strftime('{bucket_format}', timestamp), vehicle_identification, event_type"
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_table('drowsinesseventrollup')
@@ -4,19 +4,23 @@ from contextlib import asynccontextmanager
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.staticfiles import StaticFiles
-from sqlmodel import Session
 from src.infrastructure.migrate import run_migrations
-from src.services.drowsiness_event_service import DrowsinessEventService
+from src.services.drowsiness_event_writer import DrowsinessEventWriter
+from src.services.pending_upload_service import PendingUploadService
 from src.settings.app_config import settings
 from src.infrastructure.session import init_db, engine
 
 from src.lib.socket_trigger import SocketTrigger
-from src.routers import drowsiness_realtime_router, app_version, buzzer_router, drowsiness_event_router
+from src.lib.event_outbox import EventOutbox
+from src.lib.upload_replayer import UploadReplayer
+from src.routers import drowsiness_realtime_router, app_version, buzzer_router, drowsiness_event_router, pipeline_router
 from src.services.drowsiness_detection_service import DrowsinessDetectionService
 from src.services.phone_detection_service import PhoneDetectionService
 from src.services.hand_detection_service import HandsDetectionService
 
+from src.tasks.alert_scheduler import AlertScheduler
 from src.tasks.detection_task import DetectionTask
+from src.tasks.retention_task import RetentionTask
 from src.utils.frame_buffer import FrameBuffer
 from src.utils.logging import logging_default
 
@@ -27,18 +31,34 @@ from src.hardware.factory_hardware import (
 
 # Building Services and Hardware connection
 logging_default.info("Building services and initiated hardwares")
-socket_trigger = SocketTrigger(settings.ApiSettings)
 camera = get_camera()
 buzzer = get_buzzer()
+alert_scheduler = AlertScheduler(buzzer)
 
 # Apply Alembic migrations
 run_migrations()
 
-# Create a manual DB session and inject service
-db_session = Session(engine)
-drowsiness_event_service = DrowsinessEventService(db_session)
+# The events of the detection loop are written from a dedicated writer thread with its own session
+drowsiness_event_writer = DrowsinessEventWriter(engine)
 
-drowsiness_service = DrowsinessDetectionService(buzzer, socket_trigger, drowsiness_event_service, settings.PipelineSettings.inference_engine)
+pending_upload_service = PendingUploadService(engine)
+socket_trigger = SocketTrigger(settings.ApiSettings, pending_upload_service)
+event_outbox = EventOutbox(socket_trigger, settings.ApiSettings.outbox_max_size, drowsiness_event_writer)
+upload_replayer = UploadReplayer(
+    socket_trigger,
+    pending_upload_service,
+    settings.ApiSettings.upload_replay_batch_size,
+    settings.ApiSettings.upload_replay_batch_interval,
+    settings.ApiSettings.upload_replay_max_per_second,
+)
+
+retention_task = RetentionTask(
+    engine,
+    os.path.join(settings.ApiSettings.static_dir, settings.ApiSettings.image_event_dir),
+    settings.RetentionSettings,
+)
+
+drowsiness_service = DrowsinessDetectionService(alert_scheduler, event_outbox, settings.PipelineSettings.inference_engine)
 phone_detection_service = PhoneDetectionService(socket_trigger, settings.PipelineSettings.inference_engine)
 hand_service = HandsDetectionService(socket_trigger, settings.PipelineSettings.inference_engine)
 
@@ -51,6 +71,12 @@ frame_buffer = FrameBuffer()
 async def lifespan(app: FastAPI):
     # Start detection loop thread that will run the drowsiness service on app startup
     # source = https://stackoverflow.com/questions/70872276/fastapi-python-how-to-run-a-thread-in-the-background 
+    alert_scheduler.start()
+    drowsiness_event_writer.start()
+    socket_trigger.start()
+    event_outbox.start()
+    upload_replayer.start()
+    retention_task.start()
     detection_thread = threading.Thread(
         target=detection_task.detection_loop,
         args=(drowsiness_service, phone_detection_service, hand_service, camera, frame_buffer),
@@ -60,9 +86,15 @@ async def lifespan(app: FastAPI):
     yield
 
     # Event when shutdown the FastAPI
+    detection_task.stop()
+    event_outbox.stop()
+    upload_replayer.stop()
+    retention_task.stop()
+    socket_trigger.close()
     camera.release()
+    alert_scheduler.stop()
     buzzer.cleanup()
-    db_session.close()
+    drowsiness_event_writer.stop()
 
 # Define Fast API App
 logging_default.info("Run webApp")
@@ -87,6 +119,7 @@ app.mount(f"/{settings.ApiSettings.static_dir}", StaticFiles(directory=f"{settin
 # Register router
 logging_default.info("Registering API routers")
 app.include_router(app_version.router, prefix="/version", tags=["Version"])
-app.include_router(buzzer_router.buzzer_router(buzzer), prefix="/buzzer", tags=["Buzzer"])
+app.include_router(buzzer_router.buzzer_router(alert_scheduler), prefix="/buzzer", tags=["Buzzer"])
 app.include_router(drowsiness_realtime_router.drowsiness_realtime_router(frame_buffer), prefix="/realtime", tags=["Realtime Drowsiness"])
-app.include_router(drowsiness_event_router.router, prefix="/drowsinessevent", tags=["Drowsiness Event"])
\ No newline at end of file
+app.include_router(drowsiness_event_router.router, prefix="/drowsinessevent", tags=["Drowsiness Event"])
+app.include_router(pipeline_router.pipeline_router(detection_task, event_outbox, upload_replayer, drowsiness_event_writer, retention_task, drowsiness_service.event_debouncer), prefix="/pipeline", tags=["Pipeline"])
\ No newline at end of file
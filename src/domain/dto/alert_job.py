@@ -0,0 +1,20 @@
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Optional
+
+from uuid6 import uuid7
+
+from src.domain.dto.beep_pattern import BeepPattern
+from src.enum.alert_job_status import AlertJobStatus
+from src.enum.alert_priority import AlertPriority
+
+
+@dataclass
+class AlertJob:
+    pattern: BeepPattern
+    priority: AlertPriority
+    id: str = field(default_factory=lambda: str(uuid7()))
+    status: AlertJobStatus = AlertJobStatus.QUEUED
+    created_at: datetime = field(default_factory=datetime.now)
+    started_at: Optional[datetime] = None
+    finished_at: Optional[datetime] = None
@@ -0,0 +1,21 @@
+from dataclasses import dataclass
+from typing import Optional, Tuple
+
+
+@dataclass(frozen=True)
+class BeepStep:
+    on_ms: int
+    off_ms: int
+    frequency: int = 1000
+
+@dataclass(frozen=True)
+class BeepPattern:
+    name: str
+    steps: Tuple[BeepStep, ...]
+    # How many times the steps are played, forever until preempted or silenced if None
+    times: Optional[int] = None
+
+# The drowsiness stages, the faster the beeps the longer the driver stays drowsy
+FIRST_STAGE_PATTERN = BeepPattern("first_stage", (BeepStep(1000, 1000),))
+SECOND_STAGE_PATTERN = BeepPattern("second_stage", (BeepStep(1000, 500),))
+THIRD_STAGE_PATTERN = BeepPattern("third_stage", (BeepStep(1000, 100),))
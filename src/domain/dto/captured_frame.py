@@ -0,0 +1,10 @@
+from dataclasses import dataclass
+
+import numpy as np
+
+
+@dataclass
+class CapturedFrame:
+    sequence: int
+    timestamp: float
+    frame: np.ndarray
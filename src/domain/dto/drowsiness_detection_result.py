@@ -1,6 +1,8 @@
 from dataclasses import dataclass, field
 from datetime import datetime
-from typing import Any, List, Optional
+from typing import List, Optional
+
+import numpy as np
 
 
 @dataclass
@@ -14,8 +16,10 @@ class FaceDrowsinessState:
     y_angle: Optional[float] = None
     direction_text : str = "Looking Forward"
     timestamp: datetime = field(default_factory=datetime.now)
-    face_landmark: Optional[Any] = None
+    face_landmark: Optional[np.ndarray] = None     # (N, 3) float32 view into the model's Landmarks
 
 @dataclass
 class DrowsinessDetectionResult:
-    faces: List[FaceDrowsinessState] = field(default_factory=list)
\ No newline at end of file
+    faces: List[FaceDrowsinessState] = field(default_factory=list)
+    age_frames: int = 0
+    age_seconds: float = 0.0
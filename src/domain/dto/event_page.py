@@ -0,0 +1,11 @@
+from typing import List, Optional
+
+from pydantic import BaseModel, Field
+
+from src.domain.entity.drowsiness_event import DrowsinessEvent
+
+
+class EventPage(BaseModel):
+    items: List[DrowsinessEvent]
+    next_cursor: Optional[str] = Field(default=None, description="Cursor of the next page, None on the last page")
+    limit: int
@@ -0,0 +1,10 @@
+from datetime import datetime
+
+from pydantic import BaseModel
+
+
+class EventStatsBucket(BaseModel):
+    bucket_start: datetime
+    vehicle_identification: str
+    event_type: str
+    count: int
@@ -0,0 +1,23 @@
+from dataclasses import dataclass
+
+import numpy as np
+
+
+@dataclass
+class FaceMetrics:
+    """
+    The metrics of F faces computed at once, see `compute_face_metrics`. The pixel positions
+    are int64 and the ratios float64.
+    """
+    left_eye: np.ndarray        # (F, 6, 2) pixel positions of the left eye
+    right_eye: np.ndarray       # (F, 6, 2) pixel positions of the right eye
+    mouth: np.ndarray           # (F, 8, 2) pixel positions of the outer lips
+    left_ear: np.ndarray        # (F,)
+    right_ear: np.ndarray       # (F,)
+    ear: np.ndarray             # (F,) mean of the left and right EAR
+    mar: np.ndarray             # (F,)
+    pose_2d: np.ndarray         # (F, 6, 2) image points of the head pose
+    pose_3d: np.ndarray         # (F, 6, 3) object points of the head pose
+
+    def __len__(self) -> int:
+        return len(self.ear)
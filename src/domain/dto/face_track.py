@@ -0,0 +1,13 @@
+from dataclasses import dataclass
+
+import numpy as np
+
+
+@dataclass
+class FaceTrack:
+    track_id: int
+    box: np.ndarray                     # normalized (x_min, y_min, x_max, y_max) of the last detection
+    hits: int = 1
+    missed_frames: int = 0
+    drowsiness_frame_counter: int = 0
+    yawn_frame_counter: int = 0
@@ -1,13 +1,17 @@
 from dataclasses import dataclass, field
 from datetime import datetime
-from typing import Any, List, Optional
+from typing import List, Optional
+
+import numpy as np
 
 
 @dataclass
 class HandState:
     timestamp: Optional[datetime] = datetime.now()
-    hand_landmark: Optional[Any] = None
+    hand_landmark: Optional[np.ndarray] = None     # (N, 3) float32 view into the model's Landmarks
 
 @dataclass
 class HandsDetectionResult:
-    hands: List[HandState] = field(default_factory=list)
\ No newline at end of file
+    hands: List[HandState] = field(default_factory=list)
+    age_frames: int = 0
+    age_seconds: float = 0.0
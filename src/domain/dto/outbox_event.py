@@ -0,0 +1,16 @@
+from dataclasses import dataclass
+
+import numpy as np
+
+from src.domain.entity.drowsiness_event import DrowsinessEvent
+
+
+@dataclass
+class OutboxEvent:
+    image: np.ndarray
+    image_uuid: str
+    event: str
+    target: str = ''
+    ws_event: str = ''
+    record: DrowsinessEvent | None = None
+    enqueued_at: float = 0.0
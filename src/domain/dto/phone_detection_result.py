@@ -1,6 +1,8 @@
 from dataclasses import dataclass, field
 from datetime import datetime
-from typing import Any, List, Optional
+from typing import List, Optional
+
+import numpy as np
 
 
 @dataclass
@@ -8,8 +10,10 @@ class PhoneState:
     is_calling: bool = False
     distance: Optional[float] = None
     timestamp: Optional[datetime] = datetime.now()
-    body_landmark: Optional[Any] = None
+    body_landmark: Optional[np.ndarray] = None     # (N, 3) float32 view into the model's Landmarks
 
 @dataclass
 class PhoneDetectionResult:
-    detection: List[PhoneState] = field(default_factory=list)
\ No newline at end of file
+    detection: List[PhoneState] = field(default_factory=list)
+    age_frames: int = 0
+    age_seconds: float = 0.0
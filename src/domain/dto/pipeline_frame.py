@@ -0,0 +1,23 @@
+from dataclasses import dataclass
+from typing import Optional
+
+import numpy as np
+
+from src.domain.dto.drowsiness_detection_result import DrowsinessDetectionResult
+from src.domain.dto.hands_detection_result import HandsDetectionResult
+from src.domain.dto.phone_detection_result import PhoneDetectionResult
+from src.utils.frame_context import FrameContext
+
+
+@dataclass
+class PipelineFrame:
+    sequence: int
+    capture_timestamp: float
+    frame: np.ndarray
+    context: Optional[FrameContext] = None
+    drowsiness_result: Optional[DrowsinessDetectionResult] = None
+    phone_result: Optional[PhoneDetectionResult] = None
+    hands_result: Optional[HandsDetectionResult] = None
+    fps: float = 0.0
+    processed_frame: Optional[np.ndarray] = None
+    jpeg: Optional[bytes] = None
@@ -1,14 +1,21 @@
 from datetime import datetime
 from uuid import UUID
 
-from sqlmodel import Column, Field, SQLModel, String
+from sqlmodel import Column, Field, Index, SQLModel, String
 from uuid6 import uuid7
 
 
 class DrowsinessEvent(SQLModel, table=True):
+    __table_args__ = (
+        Index("ix_drowsinessevent_event_type_timestamp", "event_type", "timestamp"),
+        Index("ix_drowsinessevent_vehicle_identification_timestamp", "vehicle_identification", "timestamp"),
+        Index("ix_drowsinessevent_event_type_id", "event_type", "id"),
+        Index("ix_drowsinessevent_vehicle_identification_id", "vehicle_identification", "id"),
+    )
+
     id: UUID = Field(default_factory=uuid7, primary_key=True, index=True)
     vehicle_identification: str = Field(..., sa_column=Column(String, nullable=False))
-    timestamp: datetime = Field(default_factory=datetime.now)
+    timestamp: datetime = Field(default_factory=datetime.now, index=True)
     image: str = Field(..., sa_column=Column(String, nullable=False))
     ear: float
     mar: float
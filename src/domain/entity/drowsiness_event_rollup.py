@@ -0,0 +1,11 @@
+from datetime import datetime
+
+from sqlmodel import Column, Field, SQLModel, String
+
+
+class DrowsinessEventRollup(SQLModel, table=True):
+    granularity: str = Field(..., sa_column=Column(String, primary_key=True))
+    bucket_start: datetime = Field(..., primary_key=True)
+    vehicle_identification: str = Field(..., sa_column=Column(String, primary_key=True))
+    event_type: str = Field(..., sa_column=Column(String, primary_key=True))
+    count: int = 0
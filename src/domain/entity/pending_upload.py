@@ -0,0 +1,17 @@
+from datetime import datetime
+from typing import Optional
+from uuid import UUID
+
+from sqlmodel import Column, Field, SQLModel, String
+
+
+class PendingUpload(SQLModel, table=True):
+    id: UUID = Field(..., primary_key=True, index=True)
+    image: str = Field(..., sa_column=Column(String, nullable=False))
+    event_type: str = Field(..., sa_column=Column(String, nullable=False))
+    target: str = ''
+    ws_event: str = ''
+    created_at: datetime = Field(default_factory=datetime.now, index=True)
+    attempts: int = 0
+    last_attempt_at: Optional[datetime] = None
+    last_error: Optional[str] = None
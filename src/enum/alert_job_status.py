@@ -0,0 +1,9 @@
+from enum import Enum
+
+
+class AlertJobStatus(str, Enum):
+    QUEUED = "queued"
+    PLAYING = "playing"
+    COMPLETED = "completed"
+    CANCELLED = "cancelled"
+    PREEMPTED = "preempted"
@@ -0,0 +1,7 @@
+from enum import IntEnum
+
+
+class AlertPriority(IntEnum):
+    # A higher priority preempts a lower one, a drowsiness alarm always cuts a manual beep
+    MANUAL = 0
+    DROWSINESS = 10
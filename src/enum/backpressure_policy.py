@@ -0,0 +1,6 @@
+from enum import Enum
+
+
+class BackpressurePolicy(str, Enum):
+    BLOCK = "block"
+    DROP_OLDEST = "drop_oldest"
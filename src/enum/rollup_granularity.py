@@ -0,0 +1,6 @@
+from enum import Enum
+
+
+class RollupGranularity(str, Enum):
+    HOUR = "hour"
+    DAY = "day"
@@ -0,0 +1,6 @@
+from enum import Enum
+
+
+class UploadProtocol(str, Enum):
+    JSON_BASE64 = "json_base64"
+    BINARY = "binary"
@@ -3,6 +3,18 @@ from abc import ABC, abstractmethod
 
 
 class BaseBuzzer(ABC):
+    @abstractmethod
+    def tone(self, frequency: int, duration: int):
+        """
+        Start sounding the buzzer without blocking, the `AlertScheduler` turns it off with `off()`
+        once `duration` (in miliseconds) is elapsed.
+        """
+        pass
+
+    @abstractmethod
+    def off(self):
+        pass
+
     @abstractmethod
     def beep(self, times: int, duration: int, pause: float, frequency: int = None):
         pass
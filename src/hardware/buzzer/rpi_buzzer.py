@@ -1,19 +1,29 @@
 from time import sleep
 
-from gpiozero import Buzzer, Device
-from gpiozero.pins.lgpio import LGPIOFactory
+from gpiozero import Buzzer, Factory
 
 from src.hardware.buzzer.base_buzzer import BaseBuzzer
 from src.utils.logging import logging_default
 
-# Set the pin factory for Raspberry Pi 5 compatibility
-Device.pin_factory = LGPIOFactory()
 
 class RaspberryBuzzer(BaseBuzzer):
-    def __init__(self, pin: int = 23):
+    def __init__(self, pin: int = 23, pin_factory: Factory = None):
+        if pin_factory is None:
+            # Use lgpio for Raspberry Pi 5 compatibility, imported here so another factory
+            # (e.g. gpiozero's MockFactory in the tests) can be used without lgpio installed
+            from gpiozero.pins.lgpio import LGPIOFactory
+            pin_factory = LGPIOFactory()
+
         self.pin = pin
-        self.buzzer = Buzzer(self.pin)
-        logging_default.info("Setting up Buzzer on Raspberry Pi 5 using lgpio")
+        self.buzzer = Buzzer(self.pin, pin_factory=pin_factory)
+        logging_default.info(f"Setting up Buzzer on Raspberry Pi 5 using {type(pin_factory).__name__}")
+
+    def tone(self, frequency: int, duration: int):
+        # An active buzzer only has one frequency
+        self.buzzer.on()
+
+    def off(self):
+        self.buzzer.off()
 
     def beep(self, times: int, duration: int, pause: float, frequency: int = None):
         for _ in range(times):
@@ -1,3 +1,4 @@
+import threading
 import winsound
 from time import sleep
 
@@ -20,6 +21,16 @@ class WindowsBuzzer(BaseBuzzer):
         winsound.Beep(2000, 200)
     
 
+    def tone(self, frequency : int, duration : int):
+        """
+        Sound the beep from its own thread, since `winsound.Beep` blocks for the whole duration.
+        `winsound` can't stop a beep early, so `off()` does nothing and the beep always lasts `duration`.
+        """
+        threading.Thread(target=winsound.Beep, args=(frequency, duration), daemon=True).start()
+
+    def off(self):
+        pass
+
     def beep(self, times : int, duration : int, pause : int, frequency: int = 1000):
         """
         Beeps the buzzer in a periodic way
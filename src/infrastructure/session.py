@@ -1,11 +1,33 @@
+from sqlalchemy import event
 from sqlmodel import Session, SQLModel, create_engine
 
 from src.settings.app_config import settings
 
 sqlite_file_name = settings.ConnectionStrings.db_connections
 sqlite_url = f"sqlite:///{sqlite_file_name}"
+database_settings = settings.DatabaseSettings
 
-engine = create_engine(sqlite_url)
+# The connections are pooled and used from the API, the detection writer and the upload workers threads
+engine = create_engine(
+    sqlite_url,
+    connect_args={"check_same_thread": False, "timeout": database_settings.busy_timeout_ms / 1000},
+    pool_size=database_settings.pool_size,
+    max_overflow=database_settings.max_overflow,
+    pool_timeout=database_settings.pool_timeout,
+    pool_pre_ping=True,
+)
+
+@event.listens_for(engine, "connect")
+def set_sqlite_pragma(dbapi_connection, connection_record):
+    """
+    Apply the SQLite performance profile on every new connection. With WAL journaling the readers
+    don't block the writer and the other way around, and `synchronous=NORMAL` only syncs at checkpoints.
+    """
+    cursor = dbapi_connection.cursor()
+    cursor.execute(f"PRAGMA journal_mode={database_settings.journal_mode}")
+    cursor.execute(f"PRAGMA synchronous={database_settings.synchronous}")
+    cursor.execute(f"PRAGMA busy_timeout={database_settings.busy_timeout_ms}")
+    cursor.close()
 
 def init_db():
     SQLModel.metadata.create_all(engine)
@@ -8,13 +8,12 @@ from src.domain.dto.drowsiness_detection_result import (
     DrowsinessDetectionResult,
     FaceDrowsinessState,
 )
+from src.domain.dto.face_track import FaceTrack
+from src.lib.face_tracker import FaceTracker
+from src.lib.landmark_metrics import compute_face_metrics
 from src.models.factory_model import get_face_model
-from src.utils.landmark_constants import (
-    HEAD_POSE_POINTS,
-    LEFT_EYE_POINTS,
-    OUTER_LIPS_POINTS,
-    RIGHT_EYE_POINTS,
-)
+from src.utils.frame_context import FrameContext
+from src.utils.landmarks import Landmarks
 from src.utils.logging import logging_default
 
 
@@ -27,9 +26,10 @@ class DrowsinessDetection():
         # Get the model
         self.model = get_face_model(model_settings_path, model_path, inference_engine)
 
-        # Counter for the Yawn and Drowsiness
-        self.drowsiness_frame_counter = 0
-        self.yawn_frame_counter = 0
+        # The Yawn and Drowsiness counters are kept by the track of each face
+        self.face_tracker = FaceTracker(
+            self.face_tracker_iou_threshold, self.face_tracker_max_centroid_distance, self.face_tracker_max_missed_frames
+        )
 
     def load_configuration(self, path : str) -> None:
         """
@@ -51,13 +51,19 @@ class DrowsinessDetection():
         self.mouth_aspect_ratio_threshold = config["mouth_aspect_ration_threshold"]
         self.mouth_aspect_ratio_consec_frames = config["mouth_aspect_ration_consec_frames"]
 
+        # The tracker settings are optional, the older configuration files don't have them
+        self.face_tracker_iou_threshold = config.get("face_tracker_iou_threshold", 0.3)
+        self.face_tracker_max_centroid_distance = config.get("face_tracker_max_centroid_distance", 0.1)
+        self.face_tracker_max_missed_frames = config.get("face_tracker_max_missed_frames", 15)
+
         logging_default.info(
             f"Loaded config - EAR: {self.ear_ratio}, EAR Frames: {self.ear_consec_frames}, " \
-            f"MAR: {self.mouth_aspect_ratio_threshold}, MAR Frames: {self.mouth_aspect_ratio_consec_frames}"
+            f"MAR: {self.mouth_aspect_ratio_threshold}, MAR Frames: {self.mouth_aspect_ratio_consec_frames}, " \
+            f"Face Tracker IoU: {self.face_tracker_iou_threshold}, Max Missed Frames: {self.face_tracker_max_missed_frames}"
         )
         return
 
-    def detect_face_landmarks(self, image: np.ndarray) -> list:
+    def detect_face_landmarks(self, image: np.ndarray | FrameContext) -> Landmarks:
         """
         This function is to process an RGB image and returns the face landmarks on each detected face.
 
@@ -68,24 +74,12 @@ class DrowsinessDetection():
 
         Return
         ----------
-        face_landmarks :
-            A list of lists of face landmark, where each inner list contains the landmarks of a detected face.
-            Each landmark contains the (x, y, z) coordinates. To access the coordinates, simply loop through 
-            the list and use item.x, item.y, or item.z with index array like item[0], item[1], item[2].
-
-            Example:
-            ```
-            [
-                [  # Coordinates for Face 1
-                    (x1, y1, z1), (x2, y2, z2), ..., (x486, y486, z486)  # All 486 landmarks
-                ],
-                [  # Coordinates for Face 2
-                    (x1, y1, z1), (x2, y2, z2), ..., (x486, y486, z486)  # All 486 landmarks
-                ]
-            ]
-            ```
+        Landmarks
+            The landmarks of every detected face, of shape (F, N, 3) of the normalized (x, y, z) coordinates.
+            It behaves like a list of faces, indexing it gives the (N, 3) array of a face, so the coordinates
+            of a landmark are item[0], item[1], item[2]. The whole array is `face_landmarks.points`.
         """
-        processed_image = self.model.preprocess(image)
+        processed_image = self.model.preprocess_context(FrameContext.of(image))
         face_landmarks = self.model.inference(processed_image)
         return face_landmarks
 
@@ -96,8 +90,8 @@ class DrowsinessDetection():
 
         Parameters
         ----------
-        face_landmark : list of tuple(float, float, float)
-            A list of 3D landmarks (x, y, z) for a single detected face. Each landmark is a tuple of normalized coordinates.
+        face_landmark : np.ndarray
+            The (N, 3) normalized landmarks (x, y, z) of a single detected face, or a list of tuples.
         frame_width : int, optional
             The width of the image frame (default is 640).
         frame_height : int, optional
@@ -112,8 +106,8 @@ class DrowsinessDetection():
 
         for idx in mouth_connections:
             landmark = face_landmark[idx]
-            x = int(landmark[0] * frame_width)  
-            y = int(landmark[1] * frame_height)
+            x = int(float(landmark[0]) * frame_width)  
+            y = int(float(landmark[1]) * frame_height)
             mouth_pixels.append((x,y))
         
         return mouth_pixels
@@ -126,8 +120,8 @@ class DrowsinessDetection():
 
         Parameters
         ----------
-        face_landmark : list of tuple(float, float, float)
-            A list of normalized (x, y, z) landmarks for a single detected face.
+        face_landmark : np.ndarray
+            The (N, 3) normalized landmarks (x, y, z) of a single detected face, or a list of tuples.
         frame_width : int, optional
             Width of the image frame in pixels (default is 640).
         frame_height : int, optional
@@ -145,14 +139,14 @@ class DrowsinessDetection():
 
         for idx in left_eye_connections:
             landmark = face_landmark[idx]
-            x = int(landmark[0] * frame_width)
-            y = int(landmark[1] * frame_height)
+            x = int(float(landmark[0]) * frame_width)
+            y = int(float(landmark[1]) * frame_height)
             left_eye_pixels.append((x, y))
 
         for idx in right_eye_connections:
             landmark = face_landmark[idx]
-            x = int(landmark[0] * frame_width)
-            y = int(landmark[1] * frame_height)
+            x = int(float(landmark[0]) * frame_width)
+            y = int(float(landmark[1]) * frame_height)
             right_eye_pixels.append((x, y))
         
         return (left_eye_pixels, right_eye_pixels)
@@ -198,17 +192,36 @@ class DrowsinessDetection():
         # Extract 3D and 2D landmarks for pose estimation
         for idx in connections:
             lm = face_landmark[idx]
-            x, y = int(lm[0] * img_w), int(lm[1] * img_h)
+            x, y = int(float(lm[0]) * img_w), int(float(lm[1]) * img_h)
 
             # 2D Coordinates
             face_2d.append([x, y])
 
             # 3D Coordinates (using the Z value)
-            face_3d.append([x, y, lm[2]])
+            face_3d.append([x, y, float(lm[2])])
 
         face_2d = np.array(face_2d, dtype=np.float64)
         face_3d = np.array(face_3d, dtype=np.float64)
 
+        return self.solve_head_pose(face_2d, face_3d, img_w, img_h)
+
+    def solve_head_pose(self, face_2d : np.ndarray, face_3d : np.ndarray, img_w : int, img_h : int):
+        """
+        Estimate the head pose angles from the image points and object points of a single face,
+        see `estimate_head_pose()`.
+
+        Parameters
+        ----------
+        face_2d : np.ndarray
+            A float64 array of shape (6, 2) of the pixel positions of the head pose landmarks.
+        face_3d : np.ndarray
+            A float64 array of shape (6, 3) of the pixel positions and the z value of the head pose landmarks.
+
+        Return
+        ----------
+        tuple of float
+            The roll, pitch and yaw angles in degrees.
+        """
         # Camera matrix
         focal_length = 1 * img_w
         cam_matrix = np.array([[focal_length, 0             , img_w / 2],
@@ -319,7 +332,7 @@ class DrowsinessDetection():
         """
         return mar > self.mouth_aspect_ratio_threshold
 
-    def check_drowsiness(self, ear : float) -> bool:
+    def check_drowsiness(self, ear : float, track : FaceTrack) -> bool:
         """
         Function to check the drowsiness based on the EAR value. The current default EAR
         threshold is 0.3 stored in the self.ear_ratio
@@ -328,20 +341,22 @@ class DrowsinessDetection():
         ----------
         ear : float
             The EAR value
+        track : FaceTrack
+            The track of the face, holding its own count of consecutive frames
 
         Return
         ----------
             True if EAR ratio is exceed theshold means driver sleepy sign by eye fatigue, False otherwise.  
         """
         if self.check_ear_below_threshold(ear):
-            self.drowsiness_frame_counter += 1
-            if self.drowsiness_frame_counter >= self.ear_consec_frames:
+            track.drowsiness_frame_counter += 1
+            if track.drowsiness_frame_counter >= self.ear_consec_frames:
                 return True
         else:
-            self.drowsiness_frame_counter = 0
+            track.drowsiness_frame_counter = 0
         return False
     
-    def check_yawning(self, mar : float) -> bool:
+    def check_yawning(self, mar : float, track : FaceTrack) -> bool:
         """
         Function to check the yawness based on the MAR value. The current default MAR
         threshold is 1.5 stored in the self.mouth_aspect_ratio_threshold
@@ -350,17 +365,19 @@ class DrowsinessDetection():
         ----------
         mar : float
             The MAR value
+        track : FaceTrack
+            The track of the face, holding its own count of consecutive frames
 
         Return
         ----------
             True if MAR ratio is exceed theshold means driver sleepy sign by yawning, False otherwise.  
         """
         if self.check_mar_exceed_threshold(mar):
-            self.yawn_frame_counter +=1
-            if self.yawn_frame_counter >= self.mouth_aspect_ratio_threshold:
+            track.yawn_frame_counter +=1
+            if track.yawn_frame_counter >= self.mouth_aspect_ratio_consec_frames:
                 return True
         else:
-            self.yawn_frame_counter = 0
+            track.yawn_frame_counter = 0
         return False
 
     def euclidean_distance(self, point1 : list, point2 : list):
@@ -380,7 +397,7 @@ class DrowsinessDetection():
         """
         return math.sqrt((point1[0] - point2[0]) ** 2 + (point1[1] - point2[1]) ** 2)
     
-    def detects(self, original_frame : np.ndarray) -> DrowsinessDetectionResult:
+    def detects(self, original_frame : np.ndarray | FrameContext) -> DrowsinessDetectionResult:
         """
         Calculating the result of the detection and draw the results
         """
@@ -389,14 +406,20 @@ class DrowsinessDetection():
         # Get the landmarks for the face
         face_landmarks = self.detect_face_landmarks(original_frame)
 
+        # Match the faces with the ones of the previous frames, even when there's none so the lost tracks age
+        tracks = self.face_tracker.update(face_landmarks.bounding_boxes())
+
         # Drowsiness and pose detection
         if face_landmarks:
-            face_id = 1
+            # The metrics of every face are computed at once, only solvePnP is done face by face
+            img_h, img_w = original_frame.shape[:2]
+            metrics = compute_face_metrics(face_landmarks.points, img_w, img_h)
 
-            for face_landmark in face_landmarks:
+            for index, face_landmark in enumerate(face_landmarks):
+                track = tracks[index]
                 face_result = FaceDrowsinessState()
 
-                x_angle, y_angle, _ = self.estimate_head_pose(original_frame, face_landmark,HEAD_POSE_POINTS)
+                x_angle, y_angle, _ = self.solve_head_pose(metrics.pose_2d[index], metrics.pose_3d[index], img_w, img_h)
                 face_result.x_angle = x_angle
                 face_result.y_angle = y_angle
                 
@@ -407,28 +430,21 @@ class DrowsinessDetection():
                 elif x_angle > 10: direction_text = "Looking Up"
                 face_result.direction_text = direction_text
 
-                # Get the left-eye and right-eye landmark and mouth landmark
-                left_eye, right_eye = self.extract_eye_landmark(face_landmark, LEFT_EYE_POINTS, RIGHT_EYE_POINTS, original_frame.shape[1], original_frame.shape[0])
-                mouth = self.extract_mouth_landmark(face_landmark, OUTER_LIPS_POINTS, original_frame.shape[1], original_frame.shape[0])
-
-                # Calculate the EAR Ratio and MAR ratio to check drowsiness
-                ear = (self.calculate_ear(left_eye) + self.calculate_ear(right_eye)) / 2.0
-                mar = self.calculate_mar(mouth)
+                # The EAR Ratio and MAR ratio to check drowsiness
+                ear = float(metrics.ear[index])
+                mar = float(metrics.mar[index])
 
                 # Check for drowsines
-                if self.check_drowsiness(ear):
+                if self.check_drowsiness(ear, track):
                     face_result.is_drowsy = True
 
                 # Check for yawning
-                if self.check_yawning(mar):
+                if self.check_yawning(mar, track):
                     face_result.is_yawning = True
 
-                face_result.face_id = face_id
+                face_result.face_id = track.track_id
                 face_result.ear = ear
                 face_result.mar = mar
                 face_result.face_landmark = face_landmark
                 results.faces.append(face_result)
-
-                face_id += 1
         return results
-
@@ -0,0 +1,93 @@
+import threading
+import time
+from dataclasses import dataclass
+
+from src.settings.app_config import EventDebounceRule
+from src.utils.logging import logging_default
+
+
+@dataclass
+class EpisodeState:
+    active : bool = False
+    last_active_at : float = 0.0
+    episode_events : int = 0
+    last_emitted_at : float | None = None
+    episodes : int = 0
+    emitted_events : int = 0
+    suppressed_frames : int = 0
+
+
+class EventDebouncer:
+    """
+    Per event type cooldown and hysteresis between the detection results and the event sinks (image, database and upload).
+
+    The detection state of every frame is grouped into episodes: an episode starts on the first active
+    frame and only ends once the state stays inactive for `rearm_seconds`, so a flickering state or a
+    face lost for a few frames stays in the same episode. An event is emitted at the start of an episode,
+    then again while the episode lasts at most every `min_gap_seconds`, up to `max_events_per_episode`
+    events per episode. `min_gap_seconds` is also kept between the events of two episodes.
+    """
+    def __init__(self, rules : dict[str, EventDebounceRule]):
+        self.rules = rules
+        self.states = {event_type: EpisodeState() for event_type in rules}
+        self.lock = threading.Lock()
+
+    def update(self, event_type : str, active : bool, now : float | None = None) -> bool:
+        """
+        Update the state of an event type with the result of a frame.
+
+        Parameters
+        ----------
+        event_type : str
+            The event type, e.g. DROWSINESS or YAWNING. A type without rule is never debounced.
+        active : bool
+            Whether the state of the event is detected on the frame.
+        now : float, optional
+            The monotonic time of the frame, the current time if None.
+
+        Return
+        ----------
+        bool
+            True if an event should be emitted for this frame.
+        """
+        rule = self.rules.get(event_type)
+        if rule is None:
+            return active
+
+        now = time.monotonic() if now is None else now
+        with self.lock:
+            state = self.states[event_type]
+            if not active:
+                if state.active and now - state.last_active_at >= rule.rearm_seconds:
+                    state.active = False
+                return False
+
+            if not state.active or now - state.last_active_at >= rule.rearm_seconds:
+                state.active = True
+                state.episode_events = 0
+                state.episodes += 1
+            state.last_active_at = now
+
+            if state.episode_events >= rule.max_events_per_episode:
+                return False
+            if state.last_emitted_at is not None and now - state.last_emitted_at < rule.min_gap_seconds:
+                state.suppressed_frames += 1
+                return False
+
+            state.episode_events += 1
+            state.emitted_events += 1
+            state.last_emitted_at = now
+            logging_default.info(f"{event_type} event emitted, {state.episode_events} of the episode")
+            return True
+
+    def get_stats(self) -> dict:
+        with self.lock:
+            return {
+                event_type: {
+                    "active": state.active,
+                    "episodes": state.episodes,
+                    "emitted_events": state.emitted_events,
+                    "suppressed_frames": state.suppressed_frames,
+                }
+                for event_type, state in self.states.items()
+            }
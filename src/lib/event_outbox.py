@@ -0,0 +1,158 @@
+import threading
+import time
+
+import numpy as np
+
+from src.domain.dto.outbox_event import OutboxEvent
+from src.domain.entity.drowsiness_event import DrowsinessEvent
+from src.enum.backpressure_policy import BackpressurePolicy
+from src.lib.socket_trigger import SocketTrigger
+from src.pipeline.service_time_stats import ServiceTimeStats
+from src.pipeline.stage_queue import StageQueue
+from src.services.drowsiness_event_writer import DrowsinessEventWriter
+from src.utils.logging import logging_default
+
+
+class EventOutbox:
+    """
+    In-process outbox of the events to be saved and uploaded by the `SocketTrigger`. Publishing an
+    event only puts it into a bounded queue and returns immediately, a background worker drains the
+    queue, so neither the JPEG encoding nor a slow or unreachable server holds back the detection loop.
+
+    The worker saves the image first and only then submits the event record to the writer, so a
+    record never points to a missing image. When the queue is full, or when the outbox stops with
+    events still queued, the event is saved in the calling thread and its upload is recorded as a
+    pending upload to be replayed later instead of being dropped.
+    """
+    def __init__(self, socket_trigger : SocketTrigger, max_size : int = 16, drowsiness_event_writer : DrowsinessEventWriter | None = None):
+        self.socket_trigger = socket_trigger
+        self.drowsiness_event_writer = drowsiness_event_writer
+        self.queue = StageQueue("event_outbox", max_size, BackpressurePolicy.BLOCK)
+
+        self.upload_time = ServiceTimeStats()
+        self.published_events = 0
+        self.failed_events = 0
+        self.spilled_events = 0
+        self.last_queue_wait = 0.0
+        self.lock = threading.Lock()
+
+        self.worker_thread = None
+        self.stop_event = threading.Event()
+
+    def start(self):
+        """
+        Start the worker draining the outbox in a background thread. Does nothing if it's already running.
+        """
+        if self.worker_thread and self.worker_thread.is_alive():
+            return
+
+        logging_default.info("Starting event outbox worker")
+        self.stop_event.clear()
+        self.worker_thread = threading.Thread(target=self.worker_loop, name="event-outbox", daemon=True)
+        self.worker_thread.start()
+
+    def stop(self, timeout : float = 1.0):
+        """
+        Stop the worker, the events still queued are saved and their uploads recorded as pending uploads.
+        """
+        self.stop_event.set()
+        if self.worker_thread:
+            self.worker_thread.join(timeout)
+
+        while (outbox_event := self.queue.get(timeout=0)) is not None:
+            self.spill(outbox_event, "Event outbox stopped")
+
+    def publish(
+        self,
+        image : np.ndarray,
+        image_uuid : str,
+        event : str,
+        target : str = '',
+        ws_event : str = '',
+        record : DrowsinessEvent | None = None,
+    ):
+        """
+        Queue an event image to be saved and sent to the server by the background worker.
+        Takes the same parameters as `SocketTrigger.save_image()`, but returns immediately.
+
+        Parameters
+        ----------
+        record : DrowsinessEvent, optional
+            The record of the event, submitted to the event writer once its image is saved.
+        """
+        with self.lock:
+            self.published_events += 1
+
+        outbox_event = OutboxEvent(image, image_uuid, event, target, ws_event, record, time.monotonic())
+        if not self.queue.put(outbox_event, timeout=0):
+            self.spill(outbox_event, "Event outbox is full")
+
+    def save(self, outbox_event : OutboxEvent) -> bytes | None:
+        """
+        Save the image of an event, then submit its record. Returns the JPEG bytes, or None if the
+        image couldn't be saved, in which case the record is not submitted either.
+        """
+        jpeg = self.socket_trigger.write_image(outbox_event.image, outbox_event.image_uuid, outbox_event.event)
+        if jpeg is None:
+            with self.lock:
+                self.failed_events += 1
+            return None
+
+        if outbox_event.record is not None and self.drowsiness_event_writer is not None:
+            self.drowsiness_event_writer.submit(outbox_event.record)
+        return jpeg
+
+    def spill(self, outbox_event : OutboxEvent, reason : str):
+        """
+        Save an event that can't go through the queue and record its upload as a pending upload.
+        """
+        logging_default.warning(f"{reason}, saving the {outbox_event.event} event and recording its upload to be replayed later")
+        with self.lock:
+            self.spilled_events += 1
+        if self.save(outbox_event) is None or not self.socket_trigger.send_to_server:
+            return
+
+        self.socket_trigger.record_pending_upload(
+            outbox_event.image_uuid, outbox_event.event, outbox_event.target, outbox_event.ws_event, reason
+        )
+
+    def worker_loop(self):
+        """
+        The loop draining the outbox, intended to be run in a background thread, see `start()`
+        """
+        while not self.stop_event.is_set():
+            outbox_event = self.queue.get(timeout=0.5)
+            if outbox_event is None:
+                continue
+
+            started_at = time.monotonic()
+            with self.lock:
+                self.last_queue_wait = started_at - outbox_event.enqueued_at
+
+            jpeg = self.save(outbox_event)
+            if jpeg is None:
+                continue
+
+            success = self.socket_trigger.upload_image(
+                jpeg, outbox_event.image_uuid, outbox_event.event,
+                outbox_event.target, outbox_event.ws_event
+            )
+            self.upload_time.record(time.monotonic() - started_at)
+            if not success:
+                with self.lock:
+                    self.failed_events += 1
+
+    def get_metrics(self) -> dict:
+        """Get the queue depth, the counters and the upload latency of the outbox and the state of its connection."""
+        queue_stats = self.queue.get_stats()
+        with self.lock:
+            return {
+                "depth": queue_stats["depth"],
+                "capacity": queue_stats["capacity"],
+                "published_events": self.published_events,
+                "spilled_events": self.spilled_events,
+                "failed_events": self.failed_events,
+                "last_queue_wait_ms": self.last_queue_wait * 1000,
+                "upload_latency": self.upload_time.as_dict(),
+                "connection": self.socket_trigger.connection.get_stats(),
+            }
@@ -0,0 +1,126 @@
+import itertools
+
+import numpy as np
+
+from src.domain.dto.face_track import FaceTrack
+
+
+def box_iou(boxes : np.ndarray, other_boxes : np.ndarray) -> np.ndarray:
+    """
+    Intersection over union of every pair of boxes.
+
+    Parameters
+    ----------
+    boxes : np.ndarray
+        An array of shape (D, 4) of (x_min, y_min, x_max, y_max) boxes.
+    other_boxes : np.ndarray
+        An array of shape (T, 4) of (x_min, y_min, x_max, y_max) boxes.
+
+    Return
+    ----------
+    np.ndarray
+        An array of shape (D, T) of the IoU of each box with each of the other boxes.
+    """
+    top_left = np.maximum(boxes[:, None, :2], other_boxes[None, :, :2])
+    bottom_right = np.minimum(boxes[:, None, 2:], other_boxes[None, :, 2:])
+    intersection = np.prod(np.clip(bottom_right - top_left, 0, None), axis=-1)
+
+    areas = np.prod(boxes[:, 2:] - boxes[:, :2], axis=-1)
+    other_areas = np.prod(other_boxes[:, 2:] - other_boxes[:, :2], axis=-1)
+    union = areas[:, None] + other_areas[None, :] - intersection
+    with np.errstate(divide="ignore", invalid="ignore"):
+        return np.where(union > 0, intersection / union, 0.0)
+
+
+class FaceTracker:
+    """
+    Follows the faces across frames so every face keeps the same id and its own drowsiness and yawning
+    counters, instead of a passenger's face advancing or resetting the driver's.
+
+    Each frame, the detected boxes are matched greedily to the tracks of the previous frames, the
+    pairs with the highest IoU first and then, for the faces that moved too fast to overlap, the pairs
+    with the closest centroids. A detection with no match starts a new track and a track with no
+    detection is kept for `max_missed_frames` frames, so a face lost for a few frames keeps its counters.
+    """
+    def __init__(self, iou_threshold : float = 0.3, max_centroid_distance : float = 0.1, max_missed_frames : int = 15):
+        """
+        Parameters
+        ----------
+        iou_threshold : float
+            The minimum IoU of a detection with a track to match it by overlap.
+        max_centroid_distance : float
+            The maximum distance between the centroids of a detection and a track to match them when they
+            don't overlap enough, in normalized image coordinates.
+        max_missed_frames : int
+            The number of frames a track is kept without being matched before it's dropped.
+        """
+        self.iou_threshold = iou_threshold
+        self.max_centroid_distance = max_centroid_distance
+        self.max_missed_frames = max_missed_frames
+
+        self.tracks : list[FaceTrack] = []
+        self.track_ids = itertools.count(1)
+
+    def update(self, boxes : np.ndarray) -> list[FaceTrack]:
+        """
+        Match the faces detected in a frame with the tracks, to be called on every frame, even with no face.
+
+        Parameters
+        ----------
+        boxes : np.ndarray
+            An array of shape (D, 4) of the normalized (x_min, y_min, x_max, y_max) box of every detected face.
+
+        Return
+        ----------
+        list[FaceTrack]
+            The track of every detected face, in the order of the boxes.
+        """
+        boxes = np.asarray(boxes, dtype=np.float64).reshape(-1, 4)
+        matched_tracks : list[FaceTrack | None] = [None] * len(boxes)
+
+        if self.tracks and len(boxes):
+            track_boxes = np.array([track.box for track in self.tracks], dtype=np.float64)
+            scores = self.match_scores(boxes, track_boxes)
+
+            # Greedy assignment, there are only a few faces so the matrix is tiny
+            for _ in range(min(scores.shape)):
+                detection_index, track_index = np.unravel_index(np.argmax(scores), scores.shape)
+                if scores[detection_index, track_index] == -np.inf:
+                    break
+                matched_tracks[detection_index] = self.tracks[track_index]
+                scores[detection_index, :] = -np.inf
+                scores[:, track_index] = -np.inf
+
+        for track in self.tracks:
+            if not any(track is matched for matched in matched_tracks):
+                track.missed_frames += 1
+        self.tracks = [track for track in self.tracks if track.missed_frames <= self.max_missed_frames]
+
+        for index, box in enumerate(boxes):
+            track = matched_tracks[index]
+            if track is None:
+                track = FaceTrack(next(self.track_ids), box)
+                self.tracks.append(track)
+                matched_tracks[index] = track
+            else:
+                track.box = box
+                track.hits += 1
+                track.missed_frames = 0
+        return matched_tracks
+
+    def match_scores(self, boxes : np.ndarray, track_boxes : np.ndarray) -> np.ndarray:
+        """
+        The score of matching every detection with every track, higher is better and -inf can't match.
+        An overlap scores in (1, 2] so it always wins over a centroid match, which scores in [0, 1].
+        """
+        iou = box_iou(boxes, track_boxes)
+
+        centroids = (boxes[:, :2] + boxes[:, 2:]) / 2
+        track_centroids = (track_boxes[:, :2] + track_boxes[:, 2:]) / 2
+        distances = np.linalg.norm(centroids[:, None, :] - track_centroids[None, :, :], axis=-1)
+
+        centroid_scores = np.where(distances <= self.max_centroid_distance, 1 - distances / self.max_centroid_distance, -np.inf)
+        return np.where(iou >= self.iou_threshold, 1 + iou, centroid_scores)
+
+    def reset(self):
+        self.tracks.clear()
@@ -2,9 +2,11 @@ import numpy as np
 
 from src.domain.dto.hands_detection_result import HandsDetectionResult, HandState
 from src.models.factory_model import get_hands_pose_model
+from src.utils.frame_context import FrameContext
 from src.utils.landmark_constants import (
     MIDDLE_POINTS,
 )
+from src.utils.landmarks import Landmarks
 
 
 class HandsDetection():
@@ -13,7 +15,7 @@ class HandsDetection():
         # Get the model
         self.model = get_hands_pose_model(model_settings_path, model_path, inference_engine)
 
-    def detect_hand_landmarks(self, image : np.ndarray) -> list:
+    def detect_hand_landmarks(self, image : np.ndarray | FrameContext) -> Landmarks:
         """
         This function is to process an RGB image and returns the hands landmarks on each detected hand.
 
@@ -27,25 +29,11 @@ class HandsDetection():
             
         Returns
         -------
-        list of list of tuple(float, float, float)
-            A list where each element corresponds to a detected hand.
-            Each inner list contains 21 tuples representing (x, y, z) normalized coordinates of hand landmarks.
-
-            Example:
-            ```
-            [
-                [  # First hand
-                    (0.574, 0.216, 0.012),  # Wrist
-                    (0.596, 0.312, 0.011),  # Thumb base
-                    ...
-                ],
-                [  # Second hand
-                    ...
-                ]
-            ]
-            ```
+        Landmarks
+            The landmarks of every detected hand, of shape (F, 21, 3) of the normalized (x, y, z) coordinates.
+            Indexing it gives the (21, 3) array of a hand.
         """
-        preprocess_image = self.model.preprocess(image)
+        preprocess_image = self.model.preprocess_context(FrameContext.of(image))
         hand_results = self.model.inference(preprocess_image)
         return hand_results
 
@@ -56,8 +44,8 @@ class HandsDetection():
 
         Parameters
         ----------
-        hand_landmark : list of list of tuple(float, float, float)
-            A list where each inner list contains 21 normalized (x, y, z) coordinates of one hand.
+        hand_landmark : np.ndarray
+            The (21, 3) normalized (x, y, z) coordinates of one hand.
         connections: list of index indices of hand landmark
             list of index indices of hand landmark
         frame_width : int, optional
@@ -74,13 +62,13 @@ class HandsDetection():
 
         for idx in hand_connections:
             landmark = hand_landmark[idx]
-            x = int(landmark[0] * frame_width)  
-            y = int(landmark[1] * frame_height)
+            x = int(float(landmark[0]) * frame_width)
+            y = int(float(landmark[1]) * frame_height)
             all_hands.append((x,y))
 
         return all_hands
     
-    def detect(self, original_frame : np.ndarray) -> HandsDetectionResult:
+    def detect(self, original_frame : np.ndarray | FrameContext) -> HandsDetectionResult:
         """
         Calculating the result of the detection and draw the results
         """
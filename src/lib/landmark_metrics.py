@@ -0,0 +1,120 @@
+import numpy as np
+
+from src.domain.dto.face_metrics import FaceMetrics
+from src.utils.landmark_constants import (
+    HEAD_POSE_POINTS,
+    LEFT_EYE_POINTS,
+    OUTER_LIPS_POINTS,
+    RIGHT_EYE_POINTS,
+)
+
+# Every landmark used by the metrics, gathered at once and then split back by these slices
+METRIC_POINTS = np.array(LEFT_EYE_POINTS + RIGHT_EYE_POINTS + OUTER_LIPS_POINTS + HEAD_POSE_POINTS, dtype=np.intp)
+LEFT_EYE_SLICE = slice(0, len(LEFT_EYE_POINTS))
+RIGHT_EYE_SLICE = slice(LEFT_EYE_SLICE.stop, LEFT_EYE_SLICE.stop + len(RIGHT_EYE_POINTS))
+MOUTH_SLICE = slice(RIGHT_EYE_SLICE.stop, RIGHT_EYE_SLICE.stop + len(OUTER_LIPS_POINTS))
+HEAD_POSE_SLICE = slice(MOUTH_SLICE.stop, MOUTH_SLICE.stop + len(HEAD_POSE_POINTS))
+
+
+def to_pixels(points : np.ndarray, frame_width : int, frame_height : int) -> np.ndarray:
+    """
+    Scale normalized (x, y) coordinates to integer pixel positions, truncated toward zero like `int()`.
+
+    Parameters
+    ----------
+    points : np.ndarray
+        An array of shape (..., 2) or more of normalized coordinates, only the first two columns are used.
+
+    Return
+    ----------
+    np.ndarray
+        An int64 array of shape (..., 2) of the (x, y) pixel positions.
+    """
+    # Scaled in float64 whatever the input precision, so the positions are the same as the scalar computation
+    scaled = points[..., :2].astype(np.float64) * np.array([frame_width, frame_height], dtype=np.float64)
+    return scaled.astype(np.int64)
+
+
+def pair_distances(pixels : np.ndarray, first : list[int], second : list[int]) -> np.ndarray:
+    """
+    Euclidean distances between the points at the `first` indexes and the points at the `second` indexes,
+    for every face at once.
+
+    Return
+    ----------
+    np.ndarray
+        A float64 array of shape (F, len(first)).
+    """
+    delta = pixels[:, first] - pixels[:, second]
+    return np.sqrt((delta ** 2).sum(axis=-1).astype(np.float64))
+
+
+def calculate_ears(eyes : np.ndarray) -> np.ndarray:
+    """
+    Vectorized `DrowsinessDetection.calculate_ear` over an (F, 6, 2) array of eye pixel positions.
+    """
+    d1, d2, d3 = pair_distances(eyes, [1, 2, 0], [5, 4, 3]).T
+    return (d1 + d2) / (2.0 * d3)
+
+
+def calculate_mars(mouths : np.ndarray) -> np.ndarray:
+    """
+    Vectorized `DrowsinessDetection.calculate_mar` over an (F, 8, 2) array of mouth pixel positions.
+    """
+    a, b, c, d = pair_distances(mouths, [1, 2, 3, 0], [7, 6, 5, 4]).T
+    return (a + b + c) / (2.0 * d)
+
+
+def compute_face_metrics(landmarks : np.ndarray, frame_width : int, frame_height : int) -> FaceMetrics:
+    """
+    Compute the EAR, MAR and head pose inputs of every detected face at once.
+
+    The values are the same as the ones of `DrowsinessDetection.calculate_ear`, `calculate_mar` and
+    `estimate_head_pose` face by face, except that a degenerate eye or mouth (its horizontal distance
+    is zero) gives inf or nan instead of raising `ZeroDivisionError`.
+
+    Parameters
+    ----------
+    landmarks : np.ndarray
+        An array of shape (F, N, 3) of the normalized (x, y, z) landmarks of F faces.
+    frame_width : int
+        Width of the image frame in pixels.
+    frame_height : int
+        Height of the image frame in pixels.
+
+    Return
+    ----------
+    FaceMetrics
+        The metrics of the faces, every array has F rows in the order of the landmarks.
+    """
+    landmarks = np.asarray(landmarks)
+    if landmarks.ndim != 3 or landmarks.shape[-1] < 3:
+        raise ValueError(f"Expected landmarks of shape (F, N, 3), got {landmarks.shape}")
+
+    # The fancy index doesn't give a C-contiguous array, which cv2.solvePnP needs for each face
+    points = np.ascontiguousarray(landmarks[:, METRIC_POINTS, :3])
+    pixels = to_pixels(points, frame_width, frame_height)
+
+    left_eye = pixels[:, LEFT_EYE_SLICE]
+    right_eye = pixels[:, RIGHT_EYE_SLICE]
+    mouth = pixels[:, MOUTH_SLICE]
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        left_ear = calculate_ears(left_eye)
+        right_ear = calculate_ears(right_eye)
+        mar = calculate_mars(mouth)
+
+    pose_2d = np.ascontiguousarray(pixels[:, HEAD_POSE_SLICE], dtype=np.float64)
+    pose_3d = np.concatenate([pose_2d, points[:, HEAD_POSE_SLICE, 2:3].astype(np.float64)], axis=-1)
+
+    return FaceMetrics(
+        left_eye=left_eye,
+        right_eye=right_eye,
+        mouth=mouth,
+        left_ear=left_ear,
+        right_ear=right_ear,
+        ear=(left_ear + right_ear) / 2.0,
+        mar=mar,
+        pose_2d=pose_2d,
+        pose_3d=pose_3d,
+    )
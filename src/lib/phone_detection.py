@@ -4,6 +4,8 @@ import numpy as np
 
 from src.domain.dto.phone_detection_result import PhoneDetectionResult, PhoneState
 from src.models.factory_model import get_body_pose_model
+from src.utils.frame_context import FrameContext
+from src.utils.landmarks import Landmarks
 
 
 class PhoneDetection():
@@ -15,7 +17,7 @@ class PhoneDetection():
         self.right_hand_landmark = [16, 22, 20, 18]
         self.left_hand_landmark = [15, 21, 19, 17]
 
-    def detect_body_pose(self, image : np.ndarray) -> list:
+    def detect_body_pose(self, image : np.ndarray | FrameContext) -> Landmarks:
         """
         This function is to process an RGB image and
         returns body pose landmarks on each person captured in the frame
@@ -27,20 +29,11 @@ class PhoneDetection():
 
         Return
         ----------
-        list
-            A list of pose landmarks, where each item corresponds to one detected person.
-            Each landmark is a tuple of normalized (x, y, z) coordinates.
-            Example:
-            ```
-                [
-                    (0.574, 0.216, 0.012),  # Landmark 0 (right shoulder)
-                    (0.596, 0.312, 0.011),  # Landmark 1 (right elbow)
-                    (0.621, 0.398, 0.013),  # Landmark 2 (right wrist)
-                    # Other landmarks...
-                ]
-            ```
+        Landmarks
+            The pose landmarks of the detected person, of shape (1, N, 3) of the normalized (x, y, z)
+            coordinates, or empty if nobody is detected.
         """
-        preprocess_image = self.model.preprocess(image)
+        preprocess_image = self.model.preprocess_context(FrameContext.of(image))
         pose_landmark = self.model.inference(preprocess_image)
         return pose_landmark
     
@@ -57,8 +50,8 @@ class PhoneDetection():
 
         Parameters
         ----------
-        pose_landmark : list of tuple(float, float, float)
-            A list of normalized (x, y, z) body pose landmarks (e.g., as returned from MediaPipe Pose).
+        pose_landmark : np.ndarray
+            The (N, 3) normalized (x, y, z) body pose landmarks of a person (e.g., as returned from MediaPipe Pose).
         frame_width : int, optional
             Width of the image frame in pixels (default is 640).
         frame_height : int, optional
@@ -73,12 +66,12 @@ class PhoneDetection():
             - bool: True if phone usage is detected (wrist near ear), False otherwise.
             - float or None: The minimum distance between wrist and ear if phone usage is detected, None otherwise.
         """
-        if not pose_landmark:
+        if pose_landmark is None or len(pose_landmark) == 0:
             return False, None
 
         # Convert normalized coordinates to pixel coordinates
         def to_pixel(index):
-            return int(pose_landmark[index][0] * frame_width), int(pose_landmark[index][1] * frame_height)
+            return int(float(pose_landmark[index][0]) * frame_width), int(float(pose_landmark[index][1]) * frame_height)
 
         left_wrist = to_pixel(15)
         right_wrist = to_pixel(16)
@@ -112,17 +105,18 @@ class PhoneDetection():
         """
         return math.sqrt((point1[0] - point2[0]) ** 2 + (point1[1] - point2[1]) ** 2)
     
-    def detect(self, original_frame : np.ndarray) -> PhoneDetectionResult:
+    def detect(self, original_frame : np.ndarray | FrameContext) -> PhoneDetectionResult:
         """
         Calculating the result of the detection and draw the results
         """
         results = PhoneDetectionResult()
 
         # Get the landmarks for the body
-        body_landmark = self.detect_body_pose(original_frame)
+        body_landmarks = self.detect_body_pose(original_frame)
 
         # Phone usage detection feature get from pose information
-        if body_landmark:
+        if body_landmarks:
+            body_landmark = body_landmarks[0]
             phone_result = PhoneState()
             phone_result.body_landmark = body_landmark
 
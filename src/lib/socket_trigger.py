@@ -2,18 +2,39 @@
 import base64
 import json
 import os
+import struct
+from uuid import UUID
 
 import cv2
 import numpy as np
-from websockets.sync.client import connect
 
+from src.domain.entity.pending_upload import PendingUpload
+from src.enum.upload_protocol import UploadProtocol
+from src.lib.websocket_connection import WebSocketConnection
+from src.services.pending_upload_service import PendingUploadService
 from src.settings.app_config import ApiSettings
+from src.utils.event_image_path import get_event_image_name
 from src.utils.logging import logging_default
 
+# Binary upload frame: a 4 bytes big-endian length of the JSON metadata header, the header, then the JPEG bytes
+BINARY_HEADER_LENGTH = struct.Struct("!I")
+
+
+def pack_binary_frame(metadata : dict, payload : bytes) -> bytes:
+    header = json.dumps(metadata).encode("utf-8")
+    return BINARY_HEADER_LENGTH.pack(len(header)) + header + payload
+
+
+def unpack_binary_frame(frame : bytes) -> tuple[dict, bytes]:
+    (header_length,) = BINARY_HEADER_LENGTH.unpack_from(frame)
+    header_end = BINARY_HEADER_LENGTH.size + header_length
+    return json.loads(frame[BINARY_HEADER_LENGTH.size:header_end]), frame[header_end:]
+
 
 class SocketTrigger:
-    def __init__(self, api_settings_path : str):
-        
+    def __init__(self, api_settings_path : str, pending_upload_service : PendingUploadService | None = None):
+        self.pending_upload_service = pending_upload_service
+
         # Load configurations first
         self.load_configurations(api_settings_path)
 
@@ -34,18 +55,40 @@ class SocketTrigger:
         self.device_name = api_settings.device
         self.send_to_server = api_settings.send_to_server
         self.image_event_path = os.path.join(api_settings.static_dir, api_settings.image_event_dir)
+        self.ack_timeout = api_settings.ws_ack_timeout
+        self.upload_protocol = UploadProtocol(api_settings.upload_protocol)
 
         # Construct the WebSocket URL
         self.ws_url = f"ws://{self.server_ip}?vehicle_id={self.vehicle_id}&device={self.device_name}"
 
+        # One connection is kept open and shared by every upload instead of connecting per event
+        self.connection = WebSocketConnection(
+            self.ws_url,
+            ping_interval=api_settings.ws_ping_interval,
+            ping_timeout=api_settings.ws_ping_timeout,
+            max_backoff=api_settings.ws_max_backoff,
+        )
+
         logging_default.info(
             f"Loaded config - Vehicle ID: {self.vehicle_id}, Server: {self.server_ip}, "\
-            f"Device: {self.device_name}, Send to Server: {self.send_to_server}, WS URL: {self.ws_url}"
+            f"Device: {self.device_name}, Send to Server: {self.send_to_server}, WS URL: {self.ws_url}, "\
+            f"Upload Protocol: {self.upload_protocol.value}"
         )
 
-    def save_image(self, image : np.ndarray, image_uuid : str, event, target : str = '', ws_event : str = '') -> None:
+    def start(self) -> None:
         """
-        Save the image locally, encode it in base64, and send it to the WebSocket server.
+        Open the connection to the server ahead of the first event, so an upload doesn't pay the handshake.
+        """
+        if self.send_to_server:
+            self.connection.start()
+
+    def close(self) -> None:
+        self.connection.stop()
+
+    def save_image(self, image : np.ndarray, image_uuid : str, event, target : str = '', ws_event : str = '') -> bool:
+        """
+        Encode the image to JPEG once, save the bytes locally and send the same bytes to the WebSocket server.
+        When the upload fails and a pending upload store is set, the upload is recorded to be replayed later.
 
         Parameters
         ----------
@@ -61,38 +104,146 @@ class SocketTrigger:
         ws_event : str, optional
             The WebSocket event type (default is '').
 
+        Return
+        ----------
+        bool
+            True if the image was saved (and sent when enabled), False if there was an error
+            during the process (e.g., saving, encoding, or sending), the error is logged.
+        """
+        jpeg = self.write_image(image, image_uuid, event)
+        if jpeg is None:
+            return False
+        return self.upload_image(jpeg, image_uuid, event, target, ws_event)
+
+    def write_image(self, image : np.ndarray, image_uuid : str, event) -> bytes | None:
+        """
+        Encode the image to JPEG and save it locally, the first half of `save_image()`.
+
+        Return
+        ----------
+        bytes | None
+            The JPEG bytes to be sent, or None if the encoding or saving failed, the error is logged.
+        """
+        try:
+            logging_default.info(f"Saving image for event: {event}")
+            image_path = self.get_image_path(image_uuid)
+            os.makedirs(os.path.dirname(image_path), exist_ok=True)
+
+            # Encode once, the same bytes are saved in the local system and sent to the server
+            success, encoded_image = cv2.imencode(".jpg", image)
+            if not success:
+                raise ValueError("JPEG encoding failed")
+            jpeg = encoded_image.tobytes()
+            with open(image_path, "wb") as image_file:
+                image_file.write(jpeg)
+            return jpeg
+        except Exception as e:
+            logging_default.error(f"Error saving image for event: {event}. Error: {e}")
+            return None
+
+    def upload_image(self, jpeg : bytes, image_uuid : str, event, target : str = '', ws_event : str = '') -> bool:
+        """
+        Send a saved image to the server, the second half of `save_image()`. When the upload fails
+        the upload is recorded to be replayed later.
+
+        Return
+        ----------
+        bool
+            True if the image was sent or sending is disabled, False if the upload failed, the error is logged.
+        """
+        if not self.send_to_server:
+            logging_default.info("Will not send any event to server. It's on DEBUG mode!")
+            return True
+
+        try:
+            self.send_image(image_uuid, event, target, ws_event, jpeg)
+            return True
+        except Exception as e:
+            logging_default.error(f"Error sending image for event: {event}. Error: {e}")
+            self.record_pending_upload(image_uuid, event, target, ws_event, str(e))
+            return False
+
+    def get_image_path(self, image_uuid : str) -> str:
+        return f"{self.image_event_path}/{get_event_image_name(image_uuid)}"
+
+    def send_image(self, image_uuid : str, event, target : str = '', ws_event : str = '', jpeg : bytes | None = None) -> None:
+        """
+        Send an image to the WebSocket server with the configured upload protocol and wait for the acknowledgement.
+
+        Parameters
+        ----------
+        image_uuid : str
+            The id of the image.
+
+        event : str
+            The event related to the image.
+
+        target : str, optional
+            The target associated with the event (default is '').
+
+        ws_event : str, optional
+            The WebSocket event type (default is '').
+
+        jpeg : bytes, optional
+            The JPEG encoded image, read back from the saved image if not given.
+
         Raises
         ------
         Exception
-            If there is an error during the process (e.g., saving, encoding, or sending).
+            If the image can't be read or the upload is not acknowledged.
         """
-        try:
-            # Log the beginning of the process
-            logging_default.info(f"Saving image for event: {event}, target: {target}, websocket event: {ws_event}")
-            os.makedirs(self.image_event_path, exist_ok=True)
-
-            # Save the file in the local system
-            cv2.imwrite(f"{self.image_event_path}/{image_uuid}.jpg", image)
-
-            if self.send_to_server:
-                with connect(self.ws_url) as websocket: 
-                    with open(f"{self.image_event_path}/{image_uuid}.jpg", "rb") as image_file:
-                        encoded_string = base64.b64encode(image_file.read())
-                        json_data = {
-                            "event" : ws_event,
-                            "vehicle_id" : self.vehicle_id,
-                            "target" : target,
-                            "data" : {
-                                "message": "Image Upload",
-                                "image": encoded_string.decode("utf-8"),
-                                "behavior_type" : event
-                            }
-                        }
-                        websocket.send(json.dumps(json_data))
-                        message = websocket.recv()
-                        logging_default.info(f"Image saved successfully for event: {event}. Message : {message}")
-            else:
-                logging_default.info("Will not send any event to server. It's on DEBUG mode!")
+        if jpeg is None:
+            with open(self.get_image_path(image_uuid), "rb") as image_file:
+                jpeg = image_file.read()
 
+        message = self.connection.request(self.build_message(jpeg, image_uuid, event, target, ws_event), self.ack_timeout)
+        logging_default.info(f"Image saved successfully for event: {event}. Message : {message}")
+
+    def build_message(self, jpeg : bytes, image_uuid : str, event, target : str = '', ws_event : str = '') -> str | bytes:
+        """
+        Build the upload message of an image.
+
+        With the `binary` protocol, the JPEG bytes are sent as is in a binary frame after a small JSON
+        metadata header, see `pack_binary_frame()`. With the legacy `json_base64` protocol, the image
+        is base64 encoded into a JSON text frame.
+        """
+        if self.upload_protocol == UploadProtocol.BINARY:
+            metadata = {
+                "event" : ws_event,
+                "vehicle_id" : self.vehicle_id,
+                "target" : target,
+                "data" : {
+                    "message": "Image Upload",
+                    "image_id": str(image_uuid),
+                    "content_type": "image/jpeg",
+                    "behavior_type" : event
+                }
+            }
+            return pack_binary_frame(metadata, jpeg)
+
+        json_data = {
+            "event" : ws_event,
+            "vehicle_id" : self.vehicle_id,
+            "target" : target,
+            "data" : {
+                "message": "Image Upload",
+                "image": base64.b64encode(jpeg).decode("utf-8"),
+                "behavior_type" : event
+            }
+        }
+        return json.dumps(json_data)
+
+    def record_pending_upload(self, image_uuid : str, event, target : str, ws_event : str, error : str) -> None:
+        if self.pending_upload_service is None:
+            return
+        try:
+            self.pending_upload_service.add_upload(PendingUpload(
+                id=image_uuid if isinstance(image_uuid, UUID) else UUID(str(image_uuid)),
+                image=self.get_image_path(image_uuid),
+                event_type=event,
+                target=target,
+                ws_event=ws_event,
+                last_error=error,
+            ))
         except Exception as e:
-            logging_default.error(f"Error saving image for event: {event}. Error: {e}")
+            logging_default.error(f"Error recording pending upload for event: {event}. Error: {e}")
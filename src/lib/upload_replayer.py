@@ -0,0 +1,131 @@
+import os
+import threading
+
+from src.lib.socket_trigger import SocketTrigger
+from src.services.pending_upload_service import PendingUploadService
+from src.utils.logging import logging_default
+
+
+class UploadReplayer:
+    """
+    Replays the uploads recorded while the server was unreachable, once the connection is back.
+
+    The uploads are replayed oldest first in batches of `batch_size`, with at most `max_per_second`
+    uploads per second and `batch_interval` seconds between the batches, so a long backlog
+    doesn't flood the uplink when the connection comes back. A batch stops at the first failure,
+    the connection is most likely down again.
+    """
+    def __init__(
+        self,
+        socket_trigger : SocketTrigger,
+        pending_upload_service : PendingUploadService,
+        batch_size : int = 10,
+        batch_interval : float = 5.0,
+        max_per_second : float = 2.0,
+    ):
+        self.socket_trigger = socket_trigger
+        self.pending_upload_service = pending_upload_service
+        self.batch_size = batch_size
+        self.batch_interval = batch_interval
+        self.max_per_second = max_per_second
+
+        self.lock = threading.Lock()
+        self.replayed_uploads = 0
+        self.failed_uploads = 0
+        self.discarded_uploads = 0
+
+        self.replay_thread = None
+        self.stop_event = threading.Event()
+
+    def start(self):
+        """
+        Start the replay worker in a background thread. Does nothing if it's already running or
+        nothing is sent to the server.
+        """
+        if not self.socket_trigger.send_to_server:
+            return
+        if self.replay_thread and self.replay_thread.is_alive():
+            return
+
+        logging_default.info("Starting pending upload replay worker")
+        self.stop_event.clear()
+        self.replay_thread = threading.Thread(target=self.replay_loop, name="upload-replay", daemon=True)
+        self.replay_thread.start()
+
+    def stop(self, timeout : float = 1.0):
+        self.stop_event.set()
+        if self.replay_thread:
+            self.replay_thread.join(timeout)
+
+    def replay_loop(self):
+        """
+        The loop replaying the pending uploads, intended to be run in a background thread, see `start()`
+        """
+        connection = self.socket_trigger.connection
+        while not self.stop_event.is_set():
+            if not connection.connected_event.wait(timeout=1.0):
+                continue
+
+            try:
+                self.replay_batch()
+            except Exception as e:
+                logging_default.error(f"Error while replaying pending uploads: {e}")
+            self.stop_event.wait(self.batch_interval)
+
+    def replay_batch(self) -> int:
+        """
+        Replay one batch of the oldest pending uploads.
+
+        Return
+        ----------
+        int
+            The number of uploads delivered.
+        """
+        uploads = self.pending_upload_service.get_pending_batch(self.batch_size)
+        if not uploads:
+            return 0
+
+        logging_default.info(f"Replaying {len(uploads)} pending uploads")
+        delivered = 0
+        for index, upload in enumerate(uploads):
+            if self.stop_event.is_set():
+                break
+            if index > 0 and self.max_per_second > 0:
+                self.stop_event.wait(1.0 / self.max_per_second)
+
+            if not os.path.exists(upload.image):
+                logging_default.warning(f"Image {upload.image} of pending upload {upload.id} is gone, discarding it")
+                self.pending_upload_service.delete_upload(upload.id)
+                with self.lock:
+                    self.discarded_uploads += 1
+                continue
+
+            try:
+                with open(upload.image, "rb") as image_file:
+                    jpeg = image_file.read()
+                self.socket_trigger.send_image(upload.id, upload.event_type, upload.target, upload.ws_event, jpeg)
+            except Exception as e:
+                logging_default.warning(f"Replay of pending upload {upload.id} failed: {e}")
+                self.pending_upload_service.mark_failed(upload.id, str(e))
+                with self.lock:
+                    self.failed_uploads += 1
+                break
+
+            self.pending_upload_service.delete_upload(upload.id)
+            delivered += 1
+            with self.lock:
+                self.replayed_uploads += 1
+        return delivered
+
+    def get_stats(self) -> dict:
+        pending_uploads = self.pending_upload_service.count_pending()
+        with self.lock:
+            return {
+                "pending_uploads": pending_uploads,
+                "replayed_uploads": self.replayed_uploads,
+                "failed_uploads": self.failed_uploads,
+                "discarded_uploads": self.discarded_uploads,
+                "batch_size": self.batch_size,
+                "batch_interval": self.batch_interval,
+                "max_per_second": self.max_per_second,
+            }
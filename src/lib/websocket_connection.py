@@ -0,0 +1,231 @@
+import threading
+from collections import deque
+from concurrent.futures import Future
+
+from websockets.exceptions import ConnectionClosed
+from websockets.sync.client import ClientConnection, connect
+
+from src.utils.logging import logging_default
+
+
+class WebSocketConnection:
+    """
+    Long-lived WebSocket connection shared by every event upload.
+
+    A background thread keeps the connection open, reconnecting with an exponential backoff when
+    it drops, and the heartbeat is done with the WebSocket ping/pong frames. Every message sent
+    gets a `Future` resolved by the next message received from the server, since the server answers
+    the uploads in the order they were sent over one connection. The pending futures are failed when
+    the connection drops, so the caller can decide whether to retry.
+
+    `lock` guards the state and is never held while sending, so a send blocked on a slow link doesn't
+    stop the acknowledgements or the stats. `send_lock` serializes the senders, so the frames don't
+    interleave and the futures are registered in the order the messages are sent.
+    """
+    def __init__(
+        self,
+        url : str,
+        ping_interval : float = 20.0,
+        ping_timeout : float = 20.0,
+        open_timeout : float = 10.0,
+        min_backoff : float = 0.5,
+        max_backoff : float = 30.0,
+    ):
+        self.url = url
+        self.ping_interval = ping_interval
+        self.ping_timeout = ping_timeout
+        self.open_timeout = open_timeout
+        self.min_backoff = min_backoff
+        self.max_backoff = max_backoff
+
+        self.websocket : ClientConnection | None = None
+        self.in_flight : deque[Future] = deque()
+        self.lock = threading.Lock()
+        self.send_lock = threading.Lock()
+        self.connected_event = threading.Event()
+        self.stop_event = threading.Event()
+        self.connection_thread = None
+
+        self.connections = 0
+        self.sent_messages = 0
+        self.acknowledged_messages = 0
+        self.failed_messages = 0
+
+    @property
+    def is_connected(self) -> bool:
+        return self.connected_event.is_set()
+
+    def start(self):
+        """
+        Start the background thread opening and keeping the connection. Does nothing if it's already running.
+        """
+        with self.lock:
+            if self.connection_thread and self.connection_thread.is_alive():
+                return
+            self.stop_event.clear()
+            self.connection_thread = threading.Thread(target=self.connection_loop, name="websocket-connection", daemon=True)
+            self.connection_thread.start()
+
+    def stop(self, timeout : float = 1.0):
+        self.stop_event.set()
+        self.reset()
+        if self.connection_thread:
+            self.connection_thread.join(timeout)
+
+    def reset(self):
+        """
+        Close the current connection, failing the in-flight messages. The background thread reconnects
+        afterwards unless the connection is stopped.
+        """
+        websocket = self.websocket
+        if websocket is not None:
+            websocket.close()
+
+    def send(self, message : str | bytes, timeout : float | None = None) -> Future:
+        """
+        Send a message over the shared connection.
+
+        Parameters
+        ----------
+        message : str | bytes
+            The message to send, a str is sent as a text frame and bytes as a binary frame.
+        timeout : float, optional
+            How long to wait for the connection to be open, waits forever if None.
+
+        Return
+        ----------
+        Future
+            Resolved with the acknowledgement received from the server, or failed with a `ConnectionError`
+            if the connection is not open in time or drops before the acknowledgement comes.
+        """
+        self.start()
+        future = Future()
+        if not self.connected_event.wait(timeout):
+            future.set_exception(ConnectionError(f"WebSocket {self.url} is not connected"))
+            self.count_failed(1)
+            return future
+
+        with self.send_lock:
+            with self.lock:
+                websocket = self.websocket
+                if websocket is not None:
+                    # Register the future before sending so that a fast acknowledgement can't outrun it
+                    self.in_flight.append(future)
+            if websocket is None:
+                future.set_exception(ConnectionError(f"WebSocket {self.url} is not connected"))
+                self.count_failed(1)
+                return future
+
+            try:
+                websocket.send(message)
+            except Exception as e:
+                with self.lock:
+                    # A dropped connection may already have failed the future in `disconnect()`
+                    registered = future in self.in_flight
+                    if registered:
+                        self.in_flight.remove(future)
+                        self.failed_messages += 1
+                if registered:
+                    future.set_exception(e if isinstance(e, ConnectionError) else ConnectionError(str(e)))
+                return future
+
+        with self.lock:
+            self.sent_messages += 1
+        return future
+
+    def request(self, message : str | bytes, timeout : float = 10.0) -> str | bytes:
+        """
+        Send a message and wait for its acknowledgement.
+
+        When the acknowledgement doesn't come in time, the connection is reset, otherwise a late
+        acknowledgement would be matched with the next message sent.
+
+        Raises
+        ------
+        ConnectionError
+            If the connection is not open or drops before the acknowledgement.
+        TimeoutError
+            If the acknowledgement doesn't come within the timeout.
+        """
+        future = self.send(message, timeout)
+        try:
+            return future.result(timeout)
+        except TimeoutError:
+            logging_default.warning(f"No acknowledgement from {self.url} after {timeout}s, resetting the connection")
+            self.reset()
+            raise
+
+    def connection_loop(self):
+        """
+        The loop opening the connection and reading the acknowledgements, intended to be run in a background
+        thread, see `start()`
+        """
+        backoff = self.min_backoff
+        while not self.stop_event.is_set():
+            try:
+                websocket = connect(
+                    self.url,
+                    open_timeout=self.open_timeout,
+                    ping_interval=self.ping_interval,
+                    ping_timeout=self.ping_timeout,
+                )
+            except Exception as e:
+                logging_default.warning(f"Failed to connect to {self.url}: {e}. Retrying in {backoff:.1f}s")
+                self.stop_event.wait(backoff)
+                backoff = min(backoff * 2, self.max_backoff)
+                continue
+
+            with self.lock:
+                self.websocket = websocket
+                self.connections += 1
+            self.connected_event.set()
+            backoff = self.min_backoff
+            logging_default.info(f"Connected to {self.url}")
+
+            # The connection could have been stopped while connecting
+            if self.stop_event.is_set():
+                websocket.close()
+
+            try:
+                for message in websocket:
+                    self.acknowledge(message)
+            except ConnectionClosed as e:
+                logging_default.warning(f"Connection to {self.url} closed: {e}")
+            finally:
+                self.disconnect()
+
+    def acknowledge(self, message : str | bytes):
+        with self.lock:
+            future = self.in_flight.popleft() if self.in_flight else None
+            if future is not None:
+                self.acknowledged_messages += 1
+        if future is None:
+            logging_default.warning(f"Received a message with no message in flight: {message!r:.100}")
+            return
+        future.set_result(message)
+
+    def disconnect(self):
+        with self.lock:
+            self.connected_event.clear()
+            self.websocket = None
+            pending = list(self.in_flight)
+            self.in_flight.clear()
+            self.failed_messages += len(pending)
+        for future in pending:
+            future.set_exception(ConnectionError(f"Connection to {self.url} closed before the acknowledgement"))
+
+    def count_failed(self, count : int):
+        with self.lock:
+            self.failed_messages += count
+
+    def get_stats(self) -> dict:
+        with self.lock:
+            return {
+                "url": self.url,
+                "connected": self.connected_event.is_set(),
+                "connections": self.connections,
+                "in_flight": len(self.in_flight),
+                "sent_messages": self.sent_messages,
+                "acknowledged_messages": self.acknowledged_messages,
+                "failed_messages": self.failed_messages,
+            }
@@ -2,6 +2,8 @@ from abc import ABC, abstractmethod
 
 import cv2
 
+from src.utils.frame_context import FrameContext
+
 
 class BaseModelInference(ABC):
     """
@@ -40,6 +42,23 @@ class BaseModelInference(ABC):
         """
         pass
 
+    def preprocess_context(self, context : FrameContext):
+        """
+        Preprocess the frame of a shared `FrameContext`. Override this to take the cached views of
+        the context (e.g. `context.rgb`) instead of converting the frame again on every model.
+        The default implementation simply run `preprocess()` on the original frame.
+
+        Parameters
+        ----------
+        context : FrameContext
+            The context of the frame, shared by every model that process the same frame
+
+        Return
+        ----------
+        return: The preprocessed frame, ready for `inference()`.
+        """
+        return self.preprocess(context.frame)
+
     @abstractmethod
     def inference(self, image: cv2.Mat, preprocessed : bool = True):
         """
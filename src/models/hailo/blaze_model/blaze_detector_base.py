@@ -1,8 +1,8 @@
-import cv2
 import numpy as np
 
 from src.models.hailo.blaze_model.box_utils import calculate_scale, overlap_similarity
 from src.models.hailo.blaze_model.utils import get_anchor_options, get_model_config
+from src.utils.frame_context import letterbox_image
 
 
 class BlazeDetectorBase():
@@ -189,29 +189,7 @@ class BlazeDetectorBase():
         pad : int
             pixels of padding in the original image
         """
-
-        size = img.shape
-        if size[0] >= size[1]:
-            h1 = int(self.h_scale)
-            w1 = int(self.w_scale * size[1] // size[0])
-            padh = 0
-            padw = int(self.w_scale - w1)
-            scale = size[1] / w1
-        else:
-            h1 = int(self.h_scale * size[0] // size[1])
-            w1 = int(self.w_scale)
-            padh = int(self.h_scale - h1)
-            padw = 0
-            scale = size[0] / h1
-        
-        padh1 = padh//2
-        padh2 = padh//2 + padh % 2
-        padw1 = padw//2
-        padw2 = padw//2 + padw % 2
-        img = cv2.resize(img, (w1, h1))
-        img = np.pad(img, ((padh1, padh2), (padw1, padw2), (0, 0)), mode='constant')
-        pad = (int(padh1 * scale), int(padw1 * scale))
-        return img, scale, pad
+        return letterbox_image(img, self.w_scale, self.h_scale)
 
     def denormalize_detections(self, detections, scale, pad):
         """ 
@@ -5,6 +5,8 @@ from src.models.base_model import BaseModelInference
 from src.models.hailo.blaze_model.face_mesh.blaze_face_detector import BlazeFaceDetector
 from src.models.hailo.blaze_model.face_mesh.blaze_face_landmark import BlazeFaceLandmark
 from src.models.hailo.hailo_runtime.hailo_inference_engine import HailoInferenceEngine
+from src.utils.frame_context import FrameContext
+from src.utils.landmarks import Landmarks
 
 
 class BlazeFacePipeline(BaseModelInference):
@@ -56,43 +58,54 @@ class BlazeFacePipeline(BaseModelInference):
             The image frame of which want to get the face landmark
         """
         return cv2.cvtColor(image, cv2.COLOR_BGR2RGB)
+
+    def preprocess_context(self, context : FrameContext):
+        """
+        Keep the whole frame context, the pipeline takes both the cached RGB view and the
+        cached detector-sized letterbox of it, see `inference()`.
+        """
+        return context
     
-    def inference(self, image: np.ndarray, preprocessed: bool = True):
+    def inference(self, image: np.ndarray | FrameContext, preprocessed: bool = True):
         """
         Runs the full BlazeFace pipeline: face detection followed by landmark prediction.
 
         Parameters
         ----------
-        image : np.ndarray
+        image : np.ndarray | FrameContext
             Input image (BGR format if preprocessed=False). Expected shape: (H, W, 3).
+            When a `FrameContext` is given, its cached RGB and letterbox views are used.
         preprocessed : bool, optional
             Whether the input image has already been converted to RGB (default is True).
 
         Returns
         -------
-        list[np.ndarray]
-            A list of np.ndarrays, each of shape (N, 3), where N is the number of landmarks per face.
-            If no faces are detected, returns an empty list.
+        Landmarks
+            The landmarks of the faces, of shape (F, N, 3) where N is the number of landmarks per face,
+            with the presence flags of the landmark model as scores. If no faces are detected, the landmarks are empty.
         """
-        if not preprocessed:
-            image = self.preprocess(image)
-
-        img1, scale1, pad1 = self.blaze_face_detector.resize_pad(image)
+        if isinstance(image, FrameContext):
+            img1, scale1, pad1 = image.letterbox(self.blaze_face_detector.w_scale, self.blaze_face_detector.h_scale)
+            image = image.rgb
+        else:
+            if not preprocessed:
+                image = self.preprocess(image)
+            img1, scale1, pad1 = self.blaze_face_detector.resize_pad(image)
         normalized_detections = self.blaze_face_detector.process(img1, False)
 
-        faces_coordinates = []
-        if len(normalized_detections) > 0:
-            detections = self.blaze_face_detector.denormalize_detections(normalized_detections,scale1,pad1)
-            xc, yc, scale, theta = self.blaze_face_detector.detection2roi(detections)
+        image_size = (image.shape[1], image.shape[0])
+        if len(normalized_detections) == 0:
+            return Landmarks.empty(image_size=image_size)
+
+        detections = self.blaze_face_detector.denormalize_detections(normalized_detections,scale1,pad1)
+        xc, yc, scale, theta = self.blaze_face_detector.detection2roi(detections)
 
-            roi_img, roi_affine, roi_box = self.blaze_face_landmark.extract_roi(image, xc, yc, theta, scale)
-            flags, normalized_landmarks = self.blaze_face_landmark.process(roi_img, False)
+        roi_img, roi_affine, roi_box = self.blaze_face_landmark.extract_roi(image, xc, yc, theta, scale)
+        flags, normalized_landmarks = self.blaze_face_landmark.process(roi_img, False)
 
-            landmarks = self.blaze_face_landmark.denormalize_landmarks(normalized_landmarks.copy(), roi_affine.copy())
-            original_normalized_landmarks = self.blaze_face_landmark.normalized_landmark_to_orginal_image_space(landmarks.copy(), image.shape)
+        landmarks = self.blaze_face_landmark.denormalize_landmarks(normalized_landmarks.copy(), roi_affine.copy())
+        original_normalized_landmarks = self.blaze_face_landmark.normalized_landmark_to_orginal_image_space(landmarks.copy(), image.shape)
 
-            for face_landmark in original_normalized_landmarks:
-                face_coords = [tuple(pt) for pt in face_landmark]
-                faces_coordinates.append(face_coords)
-            
-        return faces_coordinates
+        # One presence flag for each ROI
+        scores = flags.reshape(len(flags), -1)[:, 0]
+        return Landmarks(original_normalized_landmarks, image_size, scores)
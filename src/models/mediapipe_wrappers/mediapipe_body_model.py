@@ -5,6 +5,8 @@ import numpy as np
 from mediapipe.python.solutions import pose
 
 from src.models.base_model import BaseModelInference
+from src.utils.frame_context import FrameContext
+from src.utils.landmarks import Landmarks
 from src.utils.logging import logging_default
 
 
@@ -81,11 +83,17 @@ class MediapipeBodyPoseModel(BaseModelInference):
             The image frame of which want to get the face landmark
         """
         return cv2.cvtColor(image, cv2.COLOR_BGR2RGB)
+
+    def preprocess_context(self, context : FrameContext):
+        """
+        Take the RGB view of the frame context, converted only once for every model of the frame.
+        """
+        return context.rgb
     
     def inference(self, image : np.ndarray, preprocessed = True):
         """
         Perform the inference, extract the relevant body pose landmarks, 
-        and return them as a list of tuples.
+        and return them as `Landmarks`.
 
         Parameters
         ----------
@@ -96,28 +104,15 @@ class MediapipeBodyPoseModel(BaseModelInference):
 
         Returns
         -------
-        list
-            A list of body landmarks, where each landmark contains the (x, y, z) coordinates.
-            To use them, simply loop over the list and access the coordinates.
-
-            Example:
-            ```
-                [
-                    (0.574, 0.216, 0.012),  # Landmark 0 (right shoulder)
-                    (0.596, 0.312, 0.011),  # Landmark 1 (right elbow)
-                    (0.621, 0.398, 0.013),  # Landmark 2 (right wrist)
-                    # Other landmarks...
-                ]
-            ```
+        Landmarks
+            The landmarks of the detected person, of shape (1, N, 3) of the normalized (x, y, z) coordinates.
+            If no person is detected, the landmarks are empty.
         """
         if not preprocessed:
             image = self.preprocess(image)
             
         inference_result = self.body_pose.process(image)
 
-        body_landmarks = []
-        if inference_result.pose_landmarks:
-            body_landmarks = [
-                (lm.x, lm.y, lm.z) for lm in inference_result.pose_landmarks.landmark
-            ]
-        return body_landmarks
\ No newline at end of file
+        # Mediapipe Pose detects a single person
+        pose_landmarks = [inference_result.pose_landmarks] if inference_result.pose_landmarks else []
+        return Landmarks.from_mediapipe(pose_landmarks, (image.shape[1], image.shape[0]))
\ No newline at end of file
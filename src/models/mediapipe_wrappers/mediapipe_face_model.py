@@ -5,6 +5,8 @@ import numpy as np
 from mediapipe.python.solutions import face_mesh
 
 from src.models.base_model import BaseModelInference
+from src.utils.frame_context import FrameContext
+from src.utils.landmarks import Landmarks
 from src.utils.logging import logging_default
 
 
@@ -79,6 +81,12 @@ class MediapipeFaceMeshModel(BaseModelInference):
         """
         return cv2.cvtColor(image, cv2.COLOR_BGR2RGB)
 
+    def preprocess_context(self, context : FrameContext):
+        """
+        Take the RGB view of the frame context, converted only once for every model of the frame.
+        """
+        return context.rgb
+
     def inference(self, image : np.ndarray, preprocessed: bool = True):
         """
         Runs the face mesh detection by Mediapipe Library
@@ -92,21 +100,13 @@ class MediapipeFaceMeshModel(BaseModelInference):
 
         Returns
         -------
-        list[np.ndarray]
-            A list of np.ndarrays, each of shape (N, 3), where N is the number of landmarks per face.
-            If no faces are detected, returns an empty list.
+        Landmarks
+            The landmarks of the faces, of shape (F, N, 3) where N is the number of landmarks per face.
+            If no faces are detected, the landmarks are empty.
         """
         if not preprocessed:
             image = self.preprocess(image)
 
         inference_result = self.face_mesh.process(image)
 
-        faces_coordinates = []
-        if inference_result.multi_face_landmarks:
-            for face_landmarks in inference_result.multi_face_landmarks:
-                face_coordinates = [
-                    (lm.x, lm.y, lm.z) for lm in face_landmarks.landmark
-                ]
-                faces_coordinates.append(face_coordinates)
-
-        return faces_coordinates
+        return Landmarks.from_mediapipe(inference_result.multi_face_landmarks, (image.shape[1], image.shape[0]))
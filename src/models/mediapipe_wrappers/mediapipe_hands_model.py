@@ -5,6 +5,8 @@ import numpy as np
 from mediapipe.python.solutions import hands
 
 from src.models.base_model import BaseModelInference
+from src.utils.frame_context import FrameContext
+from src.utils.landmarks import Landmarks
 from src.utils.logging import logging_default
 
 
@@ -64,11 +66,17 @@ class MediapipeHandsModel(BaseModelInference):
             The image frame of which want to get the face landmark
         """
         return cv2.cvtColor(image, cv2.COLOR_BGR2RGB)
+
+    def preprocess_context(self, context : FrameContext):
+        """
+        Take the RGB view of the frame context, converted only once for every model of the frame.
+        """
+        return context.rgb
     
     def inference(self, image : np.ndarray, preprocessed : bool = True):
         """
         Perform inference using the MediaPipe Hands model, extract the relevant hand landmarks,
-        and return them as a list of tuples.
+        and return them as `Landmarks`.
 
         Parameters
         ----------
@@ -77,39 +85,12 @@ class MediapipeHandsModel(BaseModelInference):
 
         Returns
         -------
-        list
-            A list of lists of hand landmarks, where each inner list contains landmarks of one hand.
-            Each landmark contains the (x, y, z) coordinates. To use them, simply loop over the list 
-            and access the coordinates.
-
-            Example:
-            ```
-                [
-                    [
-                        (0.574, 0.216, 0.012),  # Landmark 0 (wrist)
-                        (0.596, 0.312, 0.011),  # Landmark 1 (thumb base)
-                        (0.621, 0.398, 0.013),  # Landmark 2 (thumb tip)
-                        # Other landmarks...
-                    ],  # First hand (e.g., left hand)
-                    
-                    [
-                        (0.486, 0.239, 0.014),  # Landmark 0 (wrist)
-                        (0.505, 0.297, 0.018),  # Landmark 1 (thumb base)
-                        (0.523, 0.349, 0.016),  # Landmark 2 (thumb tip)
-                        # Other landmarks...
-                    ]  # Second hand (e.g., right hand)
-                ]
-            ```
+        Landmarks
+            The landmarks of the hands, of shape (F, 21, 3) of the normalized (x, y, z) coordinates.
+            If no hands are detected, the landmarks are empty.
         """
         if not preprocessed:
             image = self.preprocess(image)
         inference_result = self.hands_pose.process(image)
         
-        hand_landmarks = []
-        if inference_result.multi_hand_landmarks:
-            for hand_landmark in inference_result.multi_hand_landmarks:
-                hand_landmarks.append([
-                    (lm.x, lm.y, lm.z) for lm in hand_landmark.landmark
-                ])
-
-        return hand_landmarks
\ No newline at end of file
+        return Landmarks.from_mediapipe(inference_result.multi_hand_landmarks, (image.shape[1], image.shape[0]))
\ No newline at end of file
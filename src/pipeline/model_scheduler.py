@@ -0,0 +1,116 @@
+import dataclasses
+from typing import Any
+
+from src.settings.app_config import ModelCadence
+from src.utils.logging import logging_default
+
+
+class ModelCadenceScheduler:
+    """
+    Decide on which frames each model is run. A model either runs every Nth frame
+    (`every_n_frames`) or at a target rate (`target_hz`); on the skipped frames the last
+    result of the model is reused with its age attached.
+
+    Every model that does not run on every frame is considered heavy. The scheduler staggers
+    them so no two heavy models land on the same frame, when more than one of them is due
+    only the most overdue one runs and the others wait for the next frames.
+    """
+    def __init__(self, cadences : dict[str, ModelCadence]):
+        self.cadences = cadences
+        self.frame_index = 0
+
+        self.next_due_frame : dict[str, int] = {}
+        self.next_due_time : dict[str, float] = {}
+        self.last_results : dict[str, tuple[Any, int, float]] = {}
+
+        phase = 0
+        for name, cadence in cadences.items():
+            if cadence.target_hz:
+                self.next_due_time[name] = 0.0
+            elif cadence.every_n_frames > 1:
+                # Stagger the phase so models with the same divisor do not collide
+                self.next_due_frame[name] = phase
+                phase += 1
+
+        logging_default.info(f"Model cadence - {', '.join(f'{name}: {self.describe(cadence)}' for name, cadence in cadences.items())}")
+
+    @staticmethod
+    def describe(cadence : ModelCadence) -> str:
+        if cadence.target_hz:
+            return f"{cadence.target_hz} Hz"
+        return f"every {cadence.every_n_frames} frame(s)"
+
+    def select(self, now : float) -> set[str]:
+        """
+        Select the models that have to run on the next frame
+
+        Parameters
+        ----------
+        now : float
+            The capture timestamp of the frame (`time.monotonic()`)
+
+        Return
+        ----------
+        set[str]
+            The name of the models to run on this frame
+        """
+        frame_index = self.frame_index
+        self.frame_index += 1
+
+        selected = {
+            name for name in self.cadences
+            if name not in self.next_due_frame and name not in self.next_due_time
+        }
+
+        overdue = {}
+        for name, due_frame in self.next_due_frame.items():
+            if frame_index >= due_frame:
+                overdue[name] = (frame_index - due_frame) / self.cadences[name].every_n_frames
+        for name, due_time in self.next_due_time.items():
+            if now >= due_time:
+                overdue[name] = (now - due_time) * self.cadences[name].target_hz
+
+        if overdue:
+            name = max(overdue, key=overdue.get)
+            selected.add(name)
+            if name in self.next_due_frame:
+                self.next_due_frame[name] = frame_index + self.cadences[name].every_n_frames
+            else:
+                self.next_due_time[name] = now + 1.0 / self.cadences[name].target_hz
+
+        return selected
+
+    def resolve(self, name : str, result : Any, sequence : int, timestamp : float) -> Any:
+        """
+        Keep the result of a model that has just run, or when the model did not run on this frame
+        (or did not return a result) reuse its last result with the age of it attached.
+
+        Parameters
+        ----------
+        name : str
+            The name of the model
+        result : Any
+            The result of the model on this frame, None if the model did not run
+        sequence : int
+            The sequence number of the frame
+        timestamp : float
+            The capture timestamp of the frame
+
+        Return
+        ----------
+        Any
+            The result to use for this frame, None if the model never produced a result
+        """
+        if result is not None:
+            self.last_results[name] = (result, sequence, timestamp)
+            return result
+
+        if name not in self.last_results:
+            return None
+
+        last_result, last_sequence, last_timestamp = self.last_results[name]
+        return dataclasses.replace(
+            last_result,
+            age_frames=sequence - last_sequence,
+            age_seconds=timestamp - last_timestamp
+        )
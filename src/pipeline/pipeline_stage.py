@@ -0,0 +1,73 @@
+import threading
+import time
+from typing import Any, Callable
+
+from src.pipeline.service_time_stats import ServiceTimeStats
+from src.pipeline.stage_queue import StageQueue
+from src.utils.logging import logging_default
+
+
+class PipelineStage:
+    """
+    A single stage of the pipeline running on its own thread. It takes an item from its input,
+    runs the process function on it and hands the result to every output queue. Returning None
+    from the process function means the item does not go any further.
+    """
+    def __init__(self, name : str, process_function : Callable[[Any], Any], input_queue,
+                 output_queues : list[StageQueue] = None):
+        self.name = name
+        self.process_function = process_function
+        self.input_queue = input_queue
+        self.output_queues = output_queues or []
+
+        self.service_time = ServiceTimeStats()
+        self.error_count = 0
+        self.thread = None
+        self.stop_event = threading.Event()
+
+    def start(self):
+        if self.thread and self.thread.is_alive():
+            return
+
+        self.stop_event.clear()
+        self.thread = threading.Thread(target=self.run, name=f"stage-{self.name}", daemon=True)
+        self.thread.start()
+
+    def stop(self, timeout : float = 1.0):
+        self.stop_event.set()
+        if self.thread:
+            self.thread.join(timeout)
+
+    def run(self):
+        """
+        The loop of the stage, intended to be run in a background thread, see `start()`
+        """
+        while not self.stop_event.is_set():
+            item = self.input_queue.get(timeout=0.5)
+            if item is None:
+                continue
+
+            started_at = time.perf_counter()
+            try:
+                result = self.process_function(item)
+            except Exception as e:
+                self.error_count += 1
+                logging_default.error(f"Pipeline stage {self.name} failed to process an item. Error: {e}")
+                continue
+            finally:
+                self.service_time.record(time.perf_counter() - started_at)
+
+            if result is None:
+                continue
+
+            for output_queue in self.output_queues:
+                # Keep retrying so a blocking queue still let the stage be stopped
+                while not output_queue.put(result, timeout=0.5):
+                    if self.stop_event.is_set():
+                        return
+
+    def get_stats(self) -> dict:
+        stats = {"name": self.name, "errors": self.error_count}
+        stats.update(self.service_time.as_dict())
+        stats["input_queue"] = self.input_queue.get_stats()
+        return stats
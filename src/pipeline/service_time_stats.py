@@ -0,0 +1,30 @@
+from threading import Lock
+
+
+class ServiceTimeStats:
+    """
+    Thread-safe accumulator of how long a stage takes to process a single item
+    """
+    def __init__(self):
+        self.lock = Lock()
+        self.count = 0
+        self.total_time = 0.0
+        self.last_time = 0.0
+        self.max_time = 0.0
+
+    def record(self, seconds : float):
+        with self.lock:
+            self.count += 1
+            self.total_time += seconds
+            self.last_time = seconds
+            self.max_time = max(self.max_time, seconds)
+
+    def as_dict(self) -> dict:
+        with self.lock:
+            average_time = self.total_time / self.count if self.count else 0.0
+            return {
+                "processed": self.count,
+                "last_ms": self.last_time * 1000,
+                "average_ms": average_time * 1000,
+                "max_ms": self.max_time * 1000,
+            }
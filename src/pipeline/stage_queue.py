@@ -0,0 +1,75 @@
+from collections import deque
+from threading import Condition
+from typing import Any
+
+from src.enum.backpressure_policy import BackpressurePolicy
+
+
+class StageQueue:
+    """
+    Bounded queue connecting two stages of the pipeline. When the queue is full the producer
+    either waits for a free slot (`BLOCK`) or the oldest item is dropped (`DROP_OLDEST`).
+    """
+    def __init__(self, name : str, maxsize : int = 2, policy : BackpressurePolicy = BackpressurePolicy.BLOCK):
+        self.name = name
+        self.maxsize = max(1, maxsize)
+        self.policy = BackpressurePolicy(policy)
+
+        self.items = deque()
+        self.condition = Condition()
+        self.dropped_items = 0
+
+    def put(self, item : Any, timeout : float = None) -> bool:
+        """
+        Put an item into the queue according to the backpressure policy.
+
+        Parameters
+        ----------
+        item : Any
+            The item to pass to the next stage
+        timeout : float, optional
+            Only used on the `BLOCK` policy, maximum time in seconds to wait for a free slot
+
+        Return
+        ----------
+        bool
+            True if the item was put into the queue, False if it timed out waiting for a free slot
+        """
+        with self.condition:
+            if len(self.items) >= self.maxsize:
+                if self.policy == BackpressurePolicy.DROP_OLDEST:
+                    self.items.popleft()
+                    self.dropped_items += 1
+                elif not self.condition.wait_for(lambda: len(self.items) < self.maxsize, timeout):
+                    return False
+
+            self.items.append(item)
+            self.condition.notify_all()
+            return True
+
+    def get(self, timeout : float = None) -> Any | None:
+        """
+        Take the oldest item of the queue, waiting for one if the queue is empty.
+
+        Return
+        ----------
+        Any | None
+            The item, or None if nothing arrived before the timeout
+        """
+        with self.condition:
+            if not self.condition.wait_for(lambda: self.items, timeout):
+                return None
+
+            item = self.items.popleft()
+            self.condition.notify_all()
+            return item
+
+    def get_stats(self) -> dict:
+        with self.condition:
+            return {
+                "name": self.name,
+                "policy": self.policy.value,
+                "depth": len(self.items),
+                "capacity": self.maxsize,
+                "dropped_items": self.dropped_items,
+            }
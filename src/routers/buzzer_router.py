@@ -1,11 +1,13 @@
 from fastapi import APIRouter, HTTPException
 
 from src.domain.dto.base_response import StandardResponse
+from src.domain.dto.beep_pattern import BeepPattern, BeepStep
 from src.domain.dto.buzzer_dto import BeepRequest
-from src.hardware.buzzer.base_buzzer import BaseBuzzer
+from src.enum.alert_priority import AlertPriority
+from src.tasks.alert_scheduler import AlertScheduler
 
 
-def buzzer_router(buzzer: BaseBuzzer):
+def buzzer_router(alert_scheduler: AlertScheduler):
     router = APIRouter()
 
     @router.post(
@@ -15,16 +17,58 @@ def buzzer_router(buzzer: BaseBuzzer):
         description="""
         Triggers the buzzer to beep a specified number of times, each with a defined 
         duration, frequency, and pause interval between beeps.
+
+        The beeps are queued as a job on the alert scheduler and the job is returned right away,
+        use its id to follow its status or cancel it. A manual beep has a lower priority than the
+        drowsiness alarm: it waits while the alarm plays and is preempted if the alarm starts.
+        Returns 429 when too many beep jobs are already waiting.
         """
     )
     def trigger_beep(req: BeepRequest):
         try:
-            buzzer.beep(req.times, req.duration, req.pause, req.frequency)
-            return StandardResponse(
-                status="success",
-                message=f"Beeped {req.times} time(s)."
+            pattern = BeepPattern(
+                "manual",
+                (BeepStep(req.duration, int(req.pause * 1000), req.frequency),),
+                times=req.times
             )
+            job = alert_scheduler.play(pattern, AlertPriority.MANUAL)
         except Exception as e:
             raise HTTPException(status_code=500, detail=f"Buzzer failed: {str(e)}")
 
+        if job is None:
+            raise HTTPException(status_code=429, detail="Too many beep jobs are waiting, try again later")
+        return StandardResponse(
+            status="success",
+            message=f"Beep job {job.id} of {req.times} time(s) is {job.status.value}.",
+            data=job
+        )
+
+    @router.get(
+        "/beep/{job_id}",
+        summary="Get the status of a beep job",
+        response_model=StandardResponse,
+        description="""
+        Returns the beep job with its status: queued, playing, completed, cancelled or preempted.
+        """
+    )
+    def get_beep_job(job_id: str):
+        job = alert_scheduler.get_job(job_id)
+        if job is None:
+            raise HTTPException(status_code=404, detail="Beep job not found")
+        return StandardResponse(status="success", message=f"Beep job is {job.status.value}.", data=job)
+
+    @router.delete(
+        "/beep/{job_id}",
+        summary="Cancel a beep job",
+        response_model=StandardResponse,
+        description="""
+        Cancels a beep job, removing it from the queue or stopping the buzzer right away if it's playing.
+        """
+    )
+    def cancel_beep_job(job_id: str):
+        job = alert_scheduler.cancel(job_id)
+        if job is None:
+            raise HTTPException(status_code=404, detail="Beep job not found")
+        return StandardResponse(status="success", message=f"Beep job is {job.status.value}.", data=job)
+
     return router
@@ -1,28 +1,115 @@
-from typing import List
+import datetime
+from typing import List, Optional
+from uuid import UUID
 
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi.responses import StreamingResponse
 
+from src.domain.dto.event_page import EventPage
+from src.domain.dto.event_stats_bucket import EventStatsBucket
 from src.domain.entity.drowsiness_event import DrowsinessEvent
-from src.services.dependencies import get_drowsiness_event_service
+from src.enum.export_format import ExportFormat
+from src.enum.rollup_granularity import RollupGranularity
+from src.services.dependencies import (
+    get_drowsiness_event_export_service,
+    get_drowsiness_event_service,
+)
+from src.services.drowsiness_event_export_service import DrowsinessEventExportService
 from src.services.drowsiness_event_service import DrowsinessEventService
 
 router = APIRouter()
 
 @router.get(
     "/",
-    description="Retrieve all drowsiness events, sorted by timestamp.",
-    response_model=List[DrowsinessEvent]
+    description="""
+    Retrieve one page of drowsiness events, most recent first. Pass the returned `next_cursor`
+    as `cursor` to get the next page, it's None on the last page.
+    """,
+    response_model=EventPage
     )
-def list_events(service: DrowsinessEventService = Depends(get_drowsiness_event_service)):
+def list_events(
+    limit: int = Query(default=50, ge=1, le=500, description="Maximum number of events of the page"),
+    cursor: Optional[str] = Query(default=None, description="The next_cursor of the previous page"),
+    event_type: Optional[str] = Query(default=None, description="Only return the events of this type"),
+    vehicle_identification: Optional[str] = Query(default=None, description="Only return the events of this vehicle"),
+    start_time: Optional[datetime.datetime] = Query(default=None, description="Only return the events at or after this time"),
+    end_time: Optional[datetime.datetime] = Query(default=None, description="Only return the events before this time"),
+    service: DrowsinessEventService = Depends(get_drowsiness_event_service)
+):
+    try:
+        cursor_id = UUID(cursor) if cursor is not None else None
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Invalid cursor: {str(e)}"
+        )
+
     try:
-        events = service.get_all_events()  # Assuming the service method is async
-        return events
+        events, next_cursor = service.get_events_page(
+            limit, cursor_id, event_type, vehicle_identification, start_time, end_time
+        )
+        return EventPage(items=events, next_cursor=next_cursor, limit=limit)
     except Exception as e:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"An error occurred while fetching the events: {str(e)}"
         )
     
+# Declared before "/{event_id}" so that "stats" and "export" are not taken as an event ID
+@router.get(
+    "/stats",
+    description="""
+    Retrieve the number of events per hour or per day, vehicle and event type. The counts are read
+    from rollups kept up to date as the events are created and deleted, not computed from the events.
+    """,
+    response_model=List[EventStatsBucket]
+)
+def get_event_stats(
+    granularity: RollupGranularity = Query(default=RollupGranularity.HOUR, description="Size of the buckets"),
+    event_type: Optional[str] = Query(default=None, description="Only count the events of this type"),
+    vehicle_identification: Optional[str] = Query(default=None, description="Only count the events of this vehicle"),
+    start_time: Optional[datetime.datetime] = Query(default=None, description="Only return the buckets starting at or after this time"),
+    end_time: Optional[datetime.datetime] = Query(default=None, description="Only return the buckets starting before this time"),
+    service: DrowsinessEventService = Depends(get_drowsiness_event_service)
+):
+    try:
+        return service.get_event_stats(granularity, event_type, vehicle_identification, start_time, end_time)
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"An error occurred while fetching the event stats: {str(e)}"
+        )
+
+@router.get(
+    "/export",
+    description="""
+    Export the drowsiness events, oldest first, as NDJSON (one JSON object per line) or CSV.
+    The rows are streamed from the database as they are read, so any number of events can be exported.
+    """,
+    response_class=StreamingResponse
+)
+def export_events(
+    format: ExportFormat = Query(default=ExportFormat.NDJSON, description="Format of the export"),
+    event_type: Optional[str] = Query(default=None, description="Only export the events of this type"),
+    vehicle_identification: Optional[str] = Query(default=None, description="Only export the events of this vehicle"),
+    start_time: Optional[datetime.datetime] = Query(default=None, description="Only export the events at or after this time"),
+    end_time: Optional[datetime.datetime] = Query(default=None, description="Only export the events before this time"),
+    service: DrowsinessEventExportService = Depends(get_drowsiness_event_export_service)
+):
+    media_type = "text/csv" if format == ExportFormat.CSV else "application/x-ndjson"
+    content = service.export(
+        format,
+        event_type=event_type,
+        vehicle_identification=vehicle_identification,
+        start_time=start_time,
+        end_time=end_time,
+    )
+    return StreamingResponse(
+        content,
+        media_type=media_type,
+        headers={"Content-Disposition": f"attachment; filename=drowsiness_events.{format.value}"}
+    )
+
 @router.get(
     "/{event_id}",
     description="Retrieve a drowsiness event by ID.",
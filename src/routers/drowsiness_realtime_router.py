@@ -5,20 +5,25 @@ from src.streaming.drowsiness_streaming import (
     stream_processed_drowsiness_feed,
     stream_raw_camera_feed,
 )
+from src.streaming.mjpeg_encoder import MjpegStreamEncoder
 from src.utils.frame_buffer import FrameBuffer
 
 
 def drowsiness_realtime_router(frame_buffer : FrameBuffer):
     router = APIRouter()
 
+    # One shared encoder per stream, every client of the stream get the same encoded bytes
+    raw_stream_encoder = MjpegStreamEncoder(frame_buffer, FrameBuffer.RAW)
+    processed_stream_encoder = MjpegStreamEncoder(frame_buffer, FrameBuffer.PROCESSED_JPEG, encode=False)
+
     @router.get(
         "/video/raw",
         summary="Live un-edit and raw data of video feed from the camera",
         description="Returns a live video stream (MJPEG). Use a browser instead of Swagger to view."
     )
-    def video_feed():
+    async def video_feed():
         return StreamingResponse(
-            stream_raw_camera_feed(frame_buffer),
+            stream_raw_camera_feed(raw_stream_encoder),
             media_type="multipart/x-mixed-replace; boundary=frame"
         )
 
@@ -27,9 +32,9 @@ def drowsiness_realtime_router(frame_buffer : FrameBuffer):
         summary="Live of processed detection result frame of video feed from the camera",
         description="Returns a live video stream (MJPEG). Use a browser instead of Swagger to view."
     )
-    def video_drowsiness_feed():
+    async def video_drowsiness_feed():
         return StreamingResponse(
-            stream_processed_drowsiness_feed(frame_buffer),
+            stream_processed_drowsiness_feed(frame_buffer, processed_stream_encoder),
             media_type="multipart/x-mixed-replace; boundary=frame"
         )
     return router
\ No newline at end of file
@@ -0,0 +1,81 @@
+from fastapi import APIRouter
+
+from src.lib.event_debouncer import EventDebouncer
+from src.lib.event_outbox import EventOutbox
+from src.lib.upload_replayer import UploadReplayer
+from src.services.drowsiness_event_writer import DrowsinessEventWriter
+from src.tasks.detection_task import DetectionTask
+from src.tasks.retention_task import RetentionTask
+
+
+def pipeline_router(detection_task : DetectionTask, event_outbox : EventOutbox, upload_replayer : UploadReplayer, drowsiness_event_writer : DrowsinessEventWriter, retention_task : RetentionTask, event_debouncer : EventDebouncer):
+    router = APIRouter()
+
+    @router.get(
+        "/stats",
+        summary="Runtime statistics of the detection pipeline",
+        description="""
+        Returns the queue depth, dropped items and service time of every stage of the
+        detection pipeline (capture, preprocess, inference, alert, render and encode).
+        """
+    )
+    def get_pipeline_stats():
+        return detection_task.get_pipeline_stats()
+
+    @router.get(
+        "/outbox",
+        summary="Metrics of the event upload outbox",
+        description="""
+        Returns the queue depth, the published, spilled and failed event counters and the
+        upload latency of the background outbox saving and sending the event images,
+        and the state of the WebSocket connection shared by the uploads.
+        """
+    )
+    def get_outbox_metrics():
+        return event_outbox.get_metrics()
+
+    @router.get(
+        "/uploads",
+        summary="State of the pending upload replay",
+        description="""
+        Returns the number of uploads waiting to be replayed after a connectivity loss,
+        the replay counters and the batch size and rate limits of the replay.
+        """
+    )
+    def get_upload_replay_stats():
+        return upload_replayer.get_stats()
+
+    @router.get(
+        "/event_writer",
+        summary="Metrics of the drowsiness event writer",
+        description="""
+        Returns the queue depth, the written and failed event counters, the number of batches
+        and the commit latency of the background writer storing the drowsiness events.
+        """
+    )
+    def get_event_writer_stats():
+        return drowsiness_event_writer.get_stats()
+
+    @router.get(
+        "/retention",
+        summary="State of the event retention",
+        description="""
+        Returns the retention limits, the bytes taken by the event images and the number of
+        events, images and bytes evicted by the background retention job.
+        """
+    )
+    def get_retention_stats():
+        return retention_task.get_stats()
+
+    @router.get(
+        "/event_debounce",
+        summary="State of the drowsiness and yawning event debounce",
+        description="""
+        Returns, for every event type, whether an episode is active, the number of episodes,
+        the events emitted and the active frames suppressed by the minimum gap between events.
+        """
+    )
+    def get_event_debounce_stats():
+        return event_debouncer.get_stats()
+
+    return router
@@ -1,9 +1,13 @@
 from fastapi import Depends
 from sqlmodel import Session
 
-from src.infrastructure.session import get_session
+from src.infrastructure.session import engine, get_session
+from src.services.drowsiness_event_export_service import DrowsinessEventExportService
 from src.services.drowsiness_event_service import DrowsinessEventService
 
 
 def get_drowsiness_event_service(session: Session = Depends(get_session)) -> DrowsinessEventService:
-    return DrowsinessEventService(session)
\ No newline at end of file
+    return DrowsinessEventService(session)
+
+def get_drowsiness_event_export_service() -> DrowsinessEventExportService:
+    return DrowsinessEventExportService(engine)
@@ -1,95 +1,68 @@
 import datetime
-import threading
 import time
 
 import numpy as np
 from uuid6 import uuid7
 
-from src.domain.dto.drowsiness_detection_result import DrowsinessDetectionResult
+from src.domain.dto.beep_pattern import (
+    FIRST_STAGE_PATTERN,
+    SECOND_STAGE_PATTERN,
+    THIRD_STAGE_PATTERN,
+    BeepPattern,
+)
+from src.domain.dto.drowsiness_detection_result import (
+    DrowsinessDetectionResult,
+    FaceDrowsinessState,
+)
 from src.domain.entity.drowsiness_event import DrowsinessEvent
-from src.hardware.buzzer.base_buzzer import BaseBuzzer
+from src.enum.alert_priority import AlertPriority
 from src.lib.drowsiness_detection import DrowsinessDetection
-from src.lib.socket_trigger import SocketTrigger
-from src.services.drowsiness_event_service import DrowsinessEventService
+from src.lib.event_debouncer import EventDebouncer
+from src.lib.event_outbox import EventOutbox
 from src.settings.app_config import settings
+from src.tasks.alert_scheduler import AlertScheduler
+from src.utils.event_image_path import get_event_image_name
+from src.utils.frame_context import FrameContext
 from src.utils.logging import logging_default
 
 
 class DrowsinessDetectionService:
-    def __init__(self, buzzer : BaseBuzzer, socket_trigger : SocketTrigger, drowsiness_event_service: DrowsinessEventService, inference_engine : str = None):
+    def __init__(self, alert_scheduler : AlertScheduler, event_outbox : EventOutbox, inference_engine : str = None):
         logging_default.info("Initiated Drowsiness Services")
 
-        self.buzzer = buzzer
-        self.socket_trigger = socket_trigger
+        self.alert_scheduler = alert_scheduler
+        self.event_outbox = event_outbox
         self.drowsiness_detector = DrowsinessDetection("config/drowsiness_detection_settings.json", inference_engine=inference_engine)
-        self.drowsiness_event_service = drowsiness_event_service
 
         self.drowsiness_start_time = None
         self.yawning_start_time = None
 
-        self.buzzer_thread = None
-        self.buzzer_function = None
-        self.keep_beeping = False
+        # Group the flickering states into episodes, so one episode doesn't produce an event storm
+        self.event_debouncer = EventDebouncer({
+            "DROWSINESS": settings.PipelineSettings.drowsiness_event_debounce,
+            "YAWNING": settings.PipelineSettings.yawning_event_debounce,
+        })
 
-        self.drowsiness_notification_flag_sent = False
-        self.yawning_notification_flag_sent = False
-
-    def start_buzzer(self, buzzer_function : callable):
+    def start_buzzer(self, pattern : BeepPattern):
         """
-        This function starts the buzzer function in a new thread, allowing the buzzer
-        to run concurrently with the rest of the application without blocking the main thread.
-        
-        If there is already an active buzzer thread running, it will check if the 
-        requested buzzer function is different from the currently active function. 
-        If it is, the new function will replace the old one. Otherwise, the function will 
-        not restart the thread.
+        Play the beep pattern of the drowsiness stage on the alert scheduler with the drowsiness priority.
+        A different pattern preempts the one playing right away, the same pattern keeps playing without restarting.
 
         Parameters
         ----------
-        buzzer_function : function
-            A function that handles the buzzer behavior (such as calling `beep()` 
-            or any other logic for controlling the buzzer). The function will be executed 
-            repeatedly in the background thread.
-
-        Notes
-        -----
-        - The buzzer function is expected to run continuously or in a loop until the
-          `stop_buzzer()` method is called.
-        - The `start_buzzer()` method prevents multiple threads from being created for
-          the same buzzer function. If a thread is already running with the same function,
-          it won't create a new thread.
+        pattern : BeepPattern
+            The beep pattern of the drowsiness stage
         """
-        if self.buzzer_thread and self.buzzer_thread.is_alive():
-            if self.buzzer_function != buzzer_function:
-                self.buzzer_function = buzzer_function
-            return
-
-        self.keep_beeping = True
-        self.buzzer_function = buzzer_function
-        self.buzzer_thread = threading.Thread(target=self.buzzer_loop, daemon=True)
-        self.buzzer_thread.start()
+        self.alert_scheduler.play(pattern, AlertPriority.DROWSINESS)
 
     def stop_buzzer(self):
         """
-        This function stops the buzzer function by setting the `keep_beeping` flag to `False`
-        and clearing the `buzzer_function` and `drowsiness_stage`. So the actuall function that
-        was running the "pseudo-function" of the beep can be putted down without clearing the Thread
-        """
-        self.keep_beeping = False
-        self.buzzer_function = None
-        self.drowsiness_stage = None
-        self.buzzer.cleanup()
-    
-    def buzzer_loop(self):
+        Silence the drowsiness alarm right away, does nothing if no alarm is playing. A manual beep
+        playing is left untouched.
         """
-        This is the background loop that continuously executes the `buzzer_function` 
-        while `keep_beeping` is `True` and a valid `buzzer_function` is set. The function
-        is run repeatedly until `stop_buzzer()` is called, which sets `keep_beeping` to `False`.
-        """
-        while self.keep_beeping and self.buzzer_function:
-            self.buzzer_function()
+        self.alert_scheduler.silence(AlertPriority.DROWSINESS)
 
-    def process_frame(self, frame : np.ndarray) -> DrowsinessDetectionResult:
+    def process_frame(self, frame : np.ndarray | FrameContext) -> DrowsinessDetectionResult:
         """
         This function is to process the frame and run models to achieve the
         drowsiness detection. This class service will also hold the logic to count
@@ -105,8 +78,8 @@ class DrowsinessDetectionService:
 
         Parameters
         ----------
-        frame : np.ndarray
-            The image frame of which want to get drowsiness detection service result
+        frame : np.ndarray | FrameContext
+            The image frame (or the shared context of it) of which want to get drowsiness detection service result
         processed_frame : np.ndarray
             The image frame of which we want the draw happens
 
@@ -116,11 +89,44 @@ class DrowsinessDetectionService:
             An Image that has been process by the model, with landmark's draw has been
             draw directly to the image
         """
-        detection_result = self.drowsiness_detector.detects(frame)
-        
+        context = FrameContext.of(frame)
+        detection_result = self.detect(context)
+        self.handle_alerts(context.frame, detection_result)
+        return detection_result
+
+    def detect(self, frame : np.ndarray | FrameContext) -> DrowsinessDetectionResult:
+        """
+        Run the drowsiness detection model on the frame, without running any of the alert logic.
+        The pipeline use this on the inference stage and run `handle_alerts()` on its own stage.
+
+        Parameters
+        ----------
+        frame : np.ndarray | FrameContext
+            The image frame (or the shared context of it) of which want to get drowsiness detection result
+
+        Return
+        ----------
+        DrowsinessDetectionResult
+            The detection result of every face in the frame
+        """
+        return self.drowsiness_detector.detects(frame)
+
+    def handle_alerts(self, frame : np.ndarray, detection_result : DrowsinessDetectionResult) -> None:
+        """
+        Hold the logic to count how much time passed for the result of the model, trigger the buzzer
+        by the drowsiness stage, and save/send the drowsiness and yawning events.
+
+        Parameters
+        ----------
+        frame : np.ndarray
+            The image frame of the detection result, saved as the image of the event
+        detection_result : DrowsinessDetectionResult
+            The result of `detect()` for the frame
+        """
         if detection_result.faces:
-            # I'll just only buzzer the first face detected index for easier buzzer
-            face_state = detection_result.faces[0]
+            # Only the driver triggers the buzzer, taken as the face tracked the longest (the lowest track id)
+            # since the order of the detected faces can change from a frame to the next
+            face_state = min(detection_result.faces, key=lambda face: face.face_id)
         
             # Handle drowsiness logic
             if face_state.is_drowsy:
@@ -130,53 +136,54 @@ class DrowsinessDetectionService:
                 duration = time.time() - self.drowsiness_start_time
 
                 if 2 <= duration < 5:
-                    self.start_buzzer(self.buzzer.beep_first_stage)
+                    self.start_buzzer(FIRST_STAGE_PATTERN)
                 elif 5 <= duration < 10:
-                    self.start_buzzer(self.buzzer.beep_second_stage)
+                    self.start_buzzer(SECOND_STAGE_PATTERN)
                 elif duration >= 10:
-                    self.start_buzzer(self.buzzer.beep_third_stage)
-
-                if not self.drowsiness_notification_flag_sent:
-                    image_uuid = uuid7()
-                    self.socket_trigger.save_image(frame, image_uuid, 'DROWSINESS', '', 'UPLOAD_IMAGE')
-                    event = DrowsinessEvent(
-                        id=image_uuid,
-                        vehicle_identification=settings.ApiSettings.vehicle_id,
-                        image=f"{settings.ApiSettings.static_dir}/{settings.ApiSettings.image_event_dir}/{image_uuid}.jpg",
-                        ear=face_state.ear,
-                        mar=face_state.mar,
-                        event_type="DROWSINESS",
-                        timestamp=datetime.datetime.now()
-                    )
-                    self.drowsiness_event_service.create_event(event)
-                    self.drowsiness_notification_flag_sent = True
+                    self.start_buzzer(THIRD_STAGE_PATTERN)
+
+                if self.event_debouncer.update("DROWSINESS", True):
+                    self.save_event(frame, face_state, "DROWSINESS")
             else:
                 if self.drowsiness_start_time is not None:
                     duration = time.time() - self.drowsiness_start_time
                     logging_default.info(f"Driver regained alertness after {duration:.2f} seconds of drowsiness.")
 
                 self.drowsiness_start_time = None
-                self.drowsiness_notification_flag_sent = False
                 self.stop_buzzer()
+                self.event_debouncer.update("DROWSINESS", False)
 
             # Handle yawning logic
-            if face_state.is_yawning:
-                if not self.yawning_notification_flag_sent:
-                    image_uuid = uuid7()
-                    logging_default.info("Driver appears to be yawning. Triggering notification.")
-                    self.socket_trigger.save_image(frame, image_uuid, 'YAWNING', '', 'UPLOAD_IMAGE')
-                    event = DrowsinessEvent(
-                        id=image_uuid,
-                        vehicle_identification=settings.ApiSettings.vehicle_id,
-                        image=f"{settings.ApiSettings.static_dir}/{settings.ApiSettings.image_event_dir}/{image_uuid}.jpg",
-                        ear=face_state.ear,
-                        mar=face_state.mar,
-                        event_type="YAWNING",
-                        timestamp=datetime.datetime.now()
-                    )
-                    self.drowsiness_event_service.create_event(event)
-                    self.yawning_notification_flag_sent = True
-            else:
-                self.yawning_notification_flag_sent = False
+            if self.event_debouncer.update("YAWNING", face_state.is_yawning):
+                logging_default.info("Driver appears to be yawning. Triggering notification.")
+                self.save_event(frame, face_state, "YAWNING")
+        else:
+            # A lost face only ends the episodes once it's lost for the re-arm time
+            self.event_debouncer.update("DROWSINESS", False)
+            self.event_debouncer.update("YAWNING", False)
+
+    def save_event(self, frame : np.ndarray, face_state : FaceDrowsinessState, event_type : str) -> None:
+        """
+        Send the event to the sinks, and its image and record to the outbox to be saved, stored and uploaded.
 
-        return detection_result        
\ No newline at end of file
+        Parameters
+        ----------
+        frame : np.ndarray
+            The image frame of the event
+        face_state : FaceDrowsinessState
+            The metrics of the face that triggered the event
+        event_type : str
+            The type of the event, DROWSINESS or YAWNING
+        """
+        image_uuid = uuid7()
+        event = DrowsinessEvent(
+            id=image_uuid,
+            vehicle_identification=settings.ApiSettings.vehicle_id,
+            image=f"{settings.ApiSettings.static_dir}/{settings.ApiSettings.image_event_dir}/{get_event_image_name(image_uuid)}",
+            ear=face_state.ear,
+            mar=face_state.mar,
+            event_type=event_type,
+            timestamp=datetime.datetime.now()
+        )
+        # The outbox submits the record to the writer once the image is saved
+        self.event_outbox.publish(frame, image_uuid, event_type, '', 'UPLOAD_IMAGE', record=event)
@@ -0,0 +1,99 @@
+import csv
+import datetime
+import io
+import json
+from typing import Iterator, Optional
+
+from sqlalchemy import Engine, select
+from sqlmodel import Session
+
+from src.domain.entity.drowsiness_event import DrowsinessEvent
+from src.enum.export_format import ExportFormat
+from src.utils.logging import logging_default
+
+EXPORT_COLUMNS = ["id", "vehicle_identification", "timestamp", "image", "ear", "mar", "event_type"]
+
+
+class DrowsinessEventExportService:
+    """
+    Service class streaming the DrowsinessEvent records out of the database for export.
+
+    The rows are read from a server-side cursor in chunks of `batch_size` as plain rows instead of
+    ORM entities and serialized chunk by chunk, so the memory stays constant whatever the number of events.
+    The export opens its own session, since it outlives the request handler while it's streamed.
+    """
+
+    def __init__(self, engine: Engine, batch_size: int = 500):
+        """
+        Initializes the service with the database engine.
+
+        Args:
+            engine (Engine): The SQLAlchemy engine to open the export session from.
+            batch_size (int): The number of rows fetched and serialized at once.
+        """
+        self.engine = engine
+        self.batch_size = batch_size
+
+    def iter_rows(
+        self,
+        event_type: Optional[str] = None,
+        vehicle_identification: Optional[str] = None,
+        start_time: Optional[datetime.datetime] = None,
+        end_time: Optional[datetime.datetime] = None,
+    ) -> Iterator[list[dict]]:
+        """
+        Iterates over the events matching the filters, oldest first, in chunks of `batch_size` rows.
+
+        Yields:
+            list[dict]: The next chunk of rows, keyed by the `EXPORT_COLUMNS`.
+        """
+        table = DrowsinessEvent.__table__
+        statement = select(*(table.c[column] for column in EXPORT_COLUMNS))
+        if event_type is not None:
+            statement = statement.where(table.c.event_type == event_type)
+        if vehicle_identification is not None:
+            statement = statement.where(table.c.vehicle_identification == vehicle_identification)
+        if start_time is not None:
+            statement = statement.where(table.c.timestamp >= start_time)
+        if end_time is not None:
+            statement = statement.where(table.c.timestamp < end_time)
+        statement = statement.order_by(table.c.id).execution_options(yield_per=self.batch_size)
+
+        logging_default.info(f"Exporting DrowsinessEvent: event type: {event_type}, vehicle: {vehicle_identification}, "
+                             f"from: {start_time}, to: {end_time}")
+        with Session(self.engine) as session:
+            result = session.execute(statement)
+            for partition in result.mappings().partitions():
+                yield [dict(row) for row in partition]
+
+    def export(self, export_format: ExportFormat, **filters) -> Iterator[str]:
+        """
+        Streams the events matching the filters serialized in the given format, see `iter_rows()` for the filters.
+
+        Yields:
+            str: The next chunk of the export.
+        """
+        if export_format == ExportFormat.CSV:
+            return self.export_csv(**filters)
+        return self.export_ndjson(**filters)
+
+    def export_ndjson(self, **filters) -> Iterator[str]:
+        for rows in self.iter_rows(**filters):
+            yield "".join(json.dumps(row, default=str) + "\n" for row in rows)
+
+    def export_csv(self, **filters) -> Iterator[str]:
+        buffer = io.StringIO()
+        writer = csv.DictWriter(buffer, fieldnames=EXPORT_COLUMNS)
+        writer.writeheader()
+        yield self.flush(buffer)
+
+        for rows in self.iter_rows(**filters):
+            writer.writerows(rows)
+            yield self.flush(buffer)
+
+    @staticmethod
+    def flush(buffer: io.StringIO) -> str:
+        chunk = buffer.getvalue()
+        buffer.seek(0)
+        buffer.truncate()
+        return chunk
@@ -1,10 +1,16 @@
 import datetime
-from typing import List
+from collections import Counter
+from typing import List, Optional
 from uuid import UUID
 
+from sqlalchemy import delete
+from sqlalchemy.dialects.sqlite import insert
 from sqlmodel import Session, select
 
+from src.domain.dto.event_stats_bucket import EventStatsBucket
 from src.domain.entity.drowsiness_event import DrowsinessEvent
+from src.domain.entity.drowsiness_event_rollup import DrowsinessEventRollup
+from src.enum.rollup_granularity import RollupGranularity
 from src.utils.logging import logging_default
 
 
@@ -43,6 +49,7 @@ class DrowsinessEventService:
                 event.timestamp = datetime.datetime.fromisoformat(event.timestamp)
 
             self.session.add(event)
+            self.update_rollups([event], 1)
             self.session.commit()
             self.session.refresh(event)
             return event
@@ -50,6 +57,34 @@ class DrowsinessEventService:
             logging_default.error(f"Error while creating DrowsinessEvent: {str(e)}")
             raise
 
+    def create_events(self, events: List[DrowsinessEvent]) -> List[DrowsinessEvent]:
+        """
+        Creates and saves several DrowsinessEvent in a single transaction.
+
+        Args:
+            events (List[DrowsinessEvent]): The events to create and store.
+
+        Returns:
+            List[DrowsinessEvent]: The created events.
+        """
+        try:
+            logging_default.info(f"Creating {len(events)} new DrowsinessEvent in one transaction")
+            for event in events:
+                if isinstance(event.id, str):
+                    event.id = UUID(event.id)
+                if isinstance(event.timestamp, str):
+                    event.timestamp = datetime.datetime.fromisoformat(event.timestamp)
+
+            self.session.add_all(events)
+            self.update_rollups(events, 1)
+            self.session.commit()
+            for event in events:
+                self.session.refresh(event)
+            return events
+        except Exception as e:
+            logging_default.error(f"Error while creating DrowsinessEvent batch: {str(e)}")
+            raise
+
     def get_event_by_id(self, event_id : str) -> DrowsinessEvent | None:
         """
         Retrieves a DrowsinessEvent by its ID.
@@ -90,6 +125,60 @@ class DrowsinessEventService:
             logging_default.error(f"Error while fetching all DrowsinessEvent records: {str(e)}")
             raise
 
+    def get_events_page(
+        self,
+        limit: int = 50,
+        cursor: Optional[UUID] = None,
+        event_type: Optional[str] = None,
+        vehicle_identification: Optional[str] = None,
+        start_time: Optional[datetime.datetime] = None,
+        end_time: Optional[datetime.datetime] = None,
+    ) -> tuple[List[DrowsinessEvent], Optional[str]]:
+        """
+        Retrieves one page of DrowsinessEvent, most recent first, with keyset pagination over the
+        time-ordered uuid7 ID, so each page is a bounded index range scan whatever the page depth.
+
+        Args:
+            limit (int): The maximum number of events of the page.
+            cursor (UUID, optional): The event ID of the `next_cursor` returned with the previous page, None for the first page.
+            event_type (str, optional): Only return the events of this type.
+            vehicle_identification (str, optional): Only return the events of this vehicle.
+            start_time (datetime, optional): Only return the events at or after this time.
+            end_time (datetime, optional): Only return the events before this time.
+
+        Returns:
+            tuple[List[DrowsinessEvent], Optional[str]]: The events of the page and the cursor of the
+            next page, None if it's the last page.
+        """
+        try:
+            logging_default.info(f"Getting DrowsinessEvent page: limit: {limit}, cursor: {cursor}, "
+                                 f"event type: {event_type}, vehicle: {vehicle_identification}, "
+                                 f"from: {start_time}, to: {end_time}")
+            statement = select(DrowsinessEvent)
+            if cursor is not None:
+                statement = statement.where(DrowsinessEvent.id < cursor)
+            if event_type is not None:
+                statement = statement.where(DrowsinessEvent.event_type == event_type)
+            if vehicle_identification is not None:
+                statement = statement.where(DrowsinessEvent.vehicle_identification == vehicle_identification)
+            if start_time is not None:
+                statement = statement.where(DrowsinessEvent.timestamp >= start_time)
+            if end_time is not None:
+                statement = statement.where(DrowsinessEvent.timestamp < end_time)
+
+            # Fetch one more row than the limit to know if there's a next page
+            statement = statement.order_by(DrowsinessEvent.id.desc()).limit(limit + 1)
+            events = list(self.session.exec(statement).all())
+
+            next_cursor = None
+            if len(events) > limit:
+                events = events[:limit]
+                next_cursor = str(events[-1].id)
+            return events, next_cursor
+        except Exception as e:
+            logging_default.error(f"Error while fetching DrowsinessEvent page: {str(e)}")
+            raise
+
     def delete_event(self, event_id : str) -> bool:
         """
         Deletes a DrowsinessEvent by its ID.
@@ -106,6 +195,7 @@ class DrowsinessEventService:
             event = self.session.get(DrowsinessEvent, UUID(event_id))
             if event:
                 self.session.delete(event)
+                self.update_rollups([event], -1)
                 self.session.commit()
                 logging_default.info(f"DrowsinessEvent deleted successfully: ID: {event.id}")
                 return True
@@ -113,4 +203,140 @@ class DrowsinessEventService:
             return False
         except Exception as e:
             logging_default.error(f"Error while deleting DrowsinessEvent with ID {event_id}: {str(e)}")
-            raise
\ No newline at end of file
+            raise
+
+    def get_expired_events(self, older_than: datetime.datetime, limit: int) -> List[DrowsinessEvent]:
+        """
+        Retrieves the oldest events with a timestamp before the given time.
+
+        Args:
+            older_than (datetime): The events before this time are expired.
+            limit (int): The maximum number of events to retrieve.
+
+        Returns:
+            List[DrowsinessEvent]: The expired events, oldest first.
+        """
+        statement = (
+            select(DrowsinessEvent)
+            .where(DrowsinessEvent.timestamp < older_than)
+            .order_by(DrowsinessEvent.timestamp)
+            .limit(limit)
+        )
+        return list(self.session.exec(statement).all())
+
+    def delete_events(self, event_ids: List[UUID]) -> List[DrowsinessEvent]:
+        """
+        Deletes several DrowsinessEvent in a single transaction, updating the rollups. The IDs without an event are ignored.
+
+        Args:
+            event_ids (List[UUID]): The IDs of the events to delete.
+
+        Returns:
+            List[DrowsinessEvent]: The deleted events.
+        """
+        try:
+            events = list(self.session.exec(select(DrowsinessEvent).where(DrowsinessEvent.id.in_(event_ids))).all())
+            if not events:
+                return []
+
+            logging_default.info(f"Deleting {len(events)} DrowsinessEvent in one transaction")
+            self.session.execute(delete(DrowsinessEvent).where(DrowsinessEvent.id.in_([event.id for event in events])))
+            self.update_rollups(events, -1)
+            self.session.commit()
+            return events
+        except Exception as e:
+            self.session.rollback()
+            logging_default.error(f"Error while deleting DrowsinessEvent batch: {str(e)}")
+            raise
+
+    def update_rollups(self, events: List[DrowsinessEvent], delta: int) -> None:
+        """
+        Adds `delta` to the hourly and daily rollup counts of the given events, in the current transaction.
+        The buckets whose count drops to zero are removed.
+
+        Args:
+            events (List[DrowsinessEvent]): The events created (delta 1) or deleted (delta -1).
+            delta (int): The change of the count per event.
+        """
+        counts = Counter()
+        for event in events:
+            for granularity in RollupGranularity:
+                bucket_start = get_bucket_start(event.timestamp, granularity)
+                counts[(granularity.value, bucket_start, event.vehicle_identification, event.event_type)] += delta
+        if not counts:
+            return
+
+        rollup_table = DrowsinessEventRollup.__table__
+        for (granularity, bucket_start, vehicle_identification, event_type), count in counts.items():
+            statement = insert(rollup_table).values(
+                granularity=granularity,
+                bucket_start=bucket_start,
+                vehicle_identification=vehicle_identification,
+                event_type=event_type,
+                count=count,
+            )
+            statement = statement.on_conflict_do_update(
+                index_elements=[rollup_table.c.granularity, rollup_table.c.bucket_start,
+                                rollup_table.c.vehicle_identification, rollup_table.c.event_type],
+                set_={"count": rollup_table.c.count + statement.excluded.count},
+            )
+            self.session.execute(statement)
+
+        if delta < 0:
+            self.session.execute(delete(rollup_table).where(rollup_table.c.count <= 0))
+
+    def get_event_stats(
+        self,
+        granularity: RollupGranularity = RollupGranularity.HOUR,
+        event_type: Optional[str] = None,
+        vehicle_identification: Optional[str] = None,
+        start_time: Optional[datetime.datetime] = None,
+        end_time: Optional[datetime.datetime] = None,
+    ) -> List[EventStatsBucket]:
+        """
+        Retrieves the event counts per bucket, vehicle and event type from the rollups, without scanning the events.
+
+        Args:
+            granularity (RollupGranularity): The size of the buckets, an hour or a day.
+            event_type (str, optional): Only count the events of this type.
+            vehicle_identification (str, optional): Only count the events of this vehicle.
+            start_time (datetime, optional): Only return the buckets starting at or after this time.
+            end_time (datetime, optional): Only return the buckets starting before this time.
+
+        Returns:
+            List[EventStatsBucket]: The buckets, oldest first.
+        """
+        try:
+            logging_default.info(f"Getting DrowsinessEvent stats per {granularity.value}")
+            statement = select(DrowsinessEventRollup).where(DrowsinessEventRollup.granularity == granularity.value)
+            if event_type is not None:
+                statement = statement.where(DrowsinessEventRollup.event_type == event_type)
+            if vehicle_identification is not None:
+                statement = statement.where(DrowsinessEventRollup.vehicle_identification == vehicle_identification)
+            if start_time is not None:
+                statement = statement.where(DrowsinessEventRollup.bucket_start >= start_time)
+            if end_time is not None:
+                statement = statement.where(DrowsinessEventRollup.bucket_start < end_time)
+            statement = statement.order_by(DrowsinessEventRollup.bucket_start)
+
+            return [
+                EventStatsBucket(
+                    bucket_start=rollup.bucket_start,
+                    vehicle_identification=rollup.vehicle_identification,
+                    event_type=rollup.event_type,
+                    count=rollup.count,
+                )
+                for rollup in self.session.exec(statement).all()
+            ]
+        except Exception as e:
+            logging_default.error(f"Error while fetching DrowsinessEvent stats: {str(e)}")
+            raise
+
+
+def get_bucket_start(timestamp: datetime.datetime, granularity: RollupGranularity) -> datetime.datetime:
+    """
+    Returns the start of the rollup bucket the timestamp falls in.
+    """
+    if granularity == RollupGranularity.DAY:
+        return timestamp.replace(hour=0, minute=0, second=0, microsecond=0)
+    return timestamp.replace(minute=0, second=0, microsecond=0)
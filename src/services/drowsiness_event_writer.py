@@ -0,0 +1,162 @@
+import queue
+import threading
+import time
+from concurrent.futures import Future
+
+from sqlalchemy import Engine
+from sqlmodel import Session
+
+from src.domain.entity.drowsiness_event import DrowsinessEvent
+from src.pipeline.service_time_stats import ServiceTimeStats
+from src.services.drowsiness_event_service import DrowsinessEventService
+from src.utils.logging import logging_default
+
+
+class DrowsinessEventWriter:
+    """
+    Write-behind writer of the DrowsinessEvent records.
+
+    The events are submitted from any thread and written by one dedicated thread owning its own
+    session, so the commit (and its fsync) never runs on the detection thread and no session is shared
+    across threads. The events waiting in the queue are committed together in small batches, each
+    caller gets back a `Future` resolved with the persisted event.
+    """
+    def __init__(self, engine : Engine, max_batch_size : int = 16, max_batch_delay : float = 0.05, max_queue_size : int = 256):
+        """
+        Parameters
+        ----------
+        engine : Engine
+            The SQLAlchemy engine the writer opens its session from.
+        max_batch_size : int
+            Maximum number of events committed in one transaction.
+        max_batch_delay : float
+            How long to wait, in seconds, for more events to join a batch once the first one is taken.
+        max_queue_size : int
+            Maximum number of events waiting to be written, an event submitted when it's full fails.
+        """
+        self.engine = engine
+        self.max_batch_size = max_batch_size
+        self.max_batch_delay = max_batch_delay
+        self.queue : queue.Queue[tuple[DrowsinessEvent, Future]] = queue.Queue(max_queue_size)
+
+        self.commit_time = ServiceTimeStats()
+        self.lock = threading.Lock()
+        self.written_events = 0
+        self.failed_events = 0
+        self.batches = 0
+
+        self.writer_thread = None
+        self.stop_event = threading.Event()
+
+    def start(self):
+        """
+        Start the writer in a background thread. Does nothing if it's already running.
+        """
+        if self.writer_thread and self.writer_thread.is_alive():
+            return
+
+        logging_default.info("Starting DrowsinessEvent writer")
+        self.stop_event.clear()
+        self.writer_thread = threading.Thread(target=self.writer_loop, name="drowsiness-event-writer", daemon=True)
+        self.writer_thread.start()
+
+    def stop(self, timeout : float = 5.0):
+        """
+        Stop the writer once the events already submitted are written.
+        """
+        self.stop_event.set()
+        if self.writer_thread:
+            self.writer_thread.join(timeout)
+
+    def submit(self, event : DrowsinessEvent) -> Future:
+        """
+        Queue an event to be written, returns immediately.
+
+        Parameters
+        ----------
+        event : DrowsinessEvent
+            The event to create and store.
+
+        Return
+        ----------
+        Future
+            Resolved with the persisted event, or failed with the error of the write.
+        """
+        future = Future()
+        try:
+            self.queue.put_nowait((event, future))
+        except queue.Full:
+            logging_default.error(f"DrowsinessEvent writer queue is full, dropping event {event.id}")
+            with self.lock:
+                self.failed_events += 1
+            future.set_exception(RuntimeError("DrowsinessEvent writer queue is full"))
+        return future
+
+    def writer_loop(self):
+        """
+        The loop writing the events, intended to be run in a background thread, see `start()`
+        """
+        with Session(self.engine, expire_on_commit=False) as session:
+            event_service = DrowsinessEventService(session)
+            # Keep draining after stop is requested so the events already submitted are not lost
+            while not self.stop_event.is_set() or not self.queue.empty():
+                batch = self.take_batch()
+                if batch:
+                    self.write_batch(event_service, batch)
+
+    def take_batch(self) -> list[tuple[DrowsinessEvent, Future]]:
+        try:
+            batch = [self.queue.get(timeout=0.5)]
+        except queue.Empty:
+            return []
+
+        deadline = time.monotonic() + self.max_batch_delay
+        while len(batch) < self.max_batch_size:
+            remaining = deadline - time.monotonic()
+            try:
+                batch.append(self.queue.get(timeout=remaining) if remaining > 0 else self.queue.get_nowait())
+            except queue.Empty:
+                break
+        return batch
+
+    def write_batch(self, event_service : DrowsinessEventService, batch : list[tuple[DrowsinessEvent, Future]]):
+        started_at = time.monotonic()
+        try:
+            events = event_service.create_events([event for event, _ in batch])
+            # The events are handed to other threads, detach them from the writer session
+            event_service.session.expunge_all()
+            for event, (_, future) in zip(events, batch):
+                future.set_result(event)
+            written, failed = len(batch), 0
+        except Exception:
+            # Write the events one by one, so one invalid event doesn't fail the whole batch
+            event_service.session.rollback()
+            written, failed = 0, 0
+            for event, future in batch:
+                try:
+                    created_event = event_service.create_event(event)
+                    # Detach it right away, a later rollback would expire it
+                    event_service.session.expunge(created_event)
+                    future.set_result(created_event)
+                    written += 1
+                except Exception as e:
+                    event_service.session.rollback()
+                    future.set_exception(e)
+                    failed += 1
+        self.commit_time.record(time.monotonic() - started_at)
+
+        with self.lock:
+            self.batches += 1
+            self.written_events += written
+            self.failed_events += failed
+
+    def get_stats(self) -> dict:
+        with self.lock:
+            return {
+                "depth": self.queue.qsize(),
+                "capacity": self.queue.maxsize,
+                "written_events": self.written_events,
+                "failed_events": self.failed_events,
+                "batches": self.batches,
+                "commit_latency": self.commit_time.as_dict(),
+            }
@@ -4,6 +4,7 @@ import numpy as np
 from src.domain.dto.hands_detection_result import HandsDetectionResult
 from src.lib.hands_detection import HandsDetection
 from src.lib.socket_trigger import SocketTrigger
+from src.utils.frame_context import FrameContext
 from src.utils.logging import logging_default
 
 
@@ -14,7 +15,7 @@ class HandsDetectionService:
         self.hand_detector = HandsDetection("config/pose_detection_settings.json", inference_engine=inference_engine)
         self.socket_trigger = socket_trigger
     
-    def process_frame(self, frame : np.ndarray) -> HandsDetectionResult:
+    def process_frame(self, frame : np.ndarray | FrameContext) -> HandsDetectionResult:
         """
         This function is to process the frame and run models to achieve the
         hands detection. This class service will also hold the logic to count
@@ -30,8 +31,8 @@ class HandsDetectionService:
 
         Parameters
         ----------
-        frame : np.ndarray
-            The image frame of which want to get hands detection service result
+        frame : np.ndarray | FrameContext
+            The image frame (or the shared context of it) of which want to get hands detection service result
         processed_frame : np.ndarray
             The image frame of which we want the draw happens
 
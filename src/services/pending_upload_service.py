@@ -0,0 +1,104 @@
+import datetime
+from typing import List
+from uuid import UUID
+
+from sqlalchemy import Engine, func
+from sqlmodel import Session, select
+
+from src.domain.entity.pending_upload import PendingUpload
+from src.utils.logging import logging_default
+
+
+class PendingUploadService:
+    """
+    Service class for managing the PendingUpload records, the event uploads not delivered to the server yet.
+
+    The uploads are recorded from the outbox worker and replayed from the replay worker, so every
+    operation opens its own short-lived session instead of sharing one across threads.
+    """
+
+    def __init__(self, engine: Engine):
+        """
+        Initializes the service with the database engine.
+
+        Args:
+            engine (Engine): The SQLAlchemy engine to open the sessions from.
+        """
+        self.engine = engine
+
+    def add_upload(self, upload: PendingUpload) -> PendingUpload:
+        """
+        Records an upload to be replayed later. Recording the same upload twice keeps the first record.
+
+        Args:
+            upload (PendingUpload): The upload that could not be delivered.
+
+        Returns:
+            PendingUpload: The recorded upload.
+        """
+        try:
+            logging_default.info(f"Recording pending upload: ID: {upload.id}, Event Type: {upload.event_type}")
+            with Session(self.engine, expire_on_commit=False) as session:
+                existing = session.get(PendingUpload, upload.id)
+                if existing:
+                    return existing
+                session.add(upload)
+                session.commit()
+                return upload
+        except Exception as e:
+            logging_default.error(f"Error while recording PendingUpload: {str(e)}")
+            raise
+
+    def get_pending_batch(self, limit: int) -> List[PendingUpload]:
+        """
+        Retrieves the oldest pending uploads.
+
+        Args:
+            limit (int): The maximum number of uploads to retrieve.
+
+        Returns:
+            List[PendingUpload]: The pending uploads, oldest first.
+        """
+        with Session(self.engine, expire_on_commit=False) as session:
+            statement = select(PendingUpload).order_by(PendingUpload.created_at).limit(limit)
+            return list(session.exec(statement).all())
+
+    def count_pending(self) -> int:
+        with Session(self.engine) as session:
+            return session.exec(select(func.count()).select_from(PendingUpload)).one()
+
+    def delete_upload(self, upload_id: UUID) -> bool:
+        """
+        Deletes a pending upload once it's delivered.
+
+        Args:
+            upload_id (UUID): The ID of the delivered upload.
+
+        Returns:
+            bool: True if the upload was deleted, otherwise False.
+        """
+        with Session(self.engine) as session:
+            upload = session.get(PendingUpload, upload_id)
+            if not upload:
+                return False
+            session.delete(upload)
+            session.commit()
+            return True
+
+    def mark_failed(self, upload_id: UUID, error: str) -> None:
+        """
+        Records a failed replay attempt of a pending upload.
+
+        Args:
+            upload_id (UUID): The ID of the upload.
+            error (str): The error of the attempt.
+        """
+        with Session(self.engine) as session:
+            upload = session.get(PendingUpload, upload_id)
+            if not upload:
+                return
+            upload.attempts += 1
+            upload.last_attempt_at = datetime.datetime.now()
+            upload.last_error = error
+            session.add(upload)
+            session.commit()
@@ -4,6 +4,7 @@ import numpy as np
 from src.domain.dto.phone_detection_result import PhoneDetectionResult
 from src.lib.phone_detection import PhoneDetection
 from src.lib.socket_trigger import SocketTrigger
+from src.utils.frame_context import FrameContext
 from src.utils.logging import logging_default
 
 
@@ -14,7 +15,7 @@ class PhoneDetectionService:
         self.phone_detection = PhoneDetection("config/pose_detection_settings.json", inference_engine=inference_engine)
         self.socket_trigger = socket_trigger
     
-    def process_frame(self, frame : np.ndarray) -> PhoneDetectionResult:
+    def process_frame(self, frame : np.ndarray | FrameContext) -> PhoneDetectionResult:
         """
         This function is to process the frame and run models to achieve the
         phone detection. This class service will also hold the logic to count
@@ -30,8 +31,8 @@ class PhoneDetectionService:
 
         Parameters
         ----------
-        frame : np.ndarray
-            The image frame of which want to get phone detection service result
+        frame : np.ndarray | FrameContext
+            The image frame (or the shared context of it) of which want to get phone detection service result
         processed_frame : np.ndarray
             The image frame of which we want the draw happens
 
@@ -1,17 +1,58 @@
 import json
+from typing import Optional
 
 from pydantic import BaseModel
 
+from src.enum.backpressure_policy import BackpressurePolicy
+from src.enum.upload_protocol import UploadProtocol
+
+
+class ModelCadence(BaseModel):
+    every_n_frames : int = 1
+    target_hz : Optional[float] = None
+
+class EventDebounceRule(BaseModel):
+    min_gap_seconds : float = 30.0
+    rearm_seconds : float = 3.0
+    max_events_per_episode : int = 1
 
 class PipelineSettings(BaseModel):
     drowsiness_model_run: bool
     phone_detection_model_run: bool
     hands_detection_model_run: bool
     inference_engine : str
+    capture_buffer_size : int = 2
+    concurrent_inference : bool = False
+    drowsiness_service_timeout : float = 0.5
+    phone_detection_service_timeout : float = 0.5
+    hands_detection_service_timeout : float = 0.5
+    pipeline_queue_size : int = 1
+    pipeline_backpressure_policy : BackpressurePolicy = BackpressurePolicy.DROP_OLDEST
+    drowsiness_model_cadence : ModelCadence = ModelCadence()
+    phone_detection_model_cadence : ModelCadence = ModelCadence()
+    hands_detection_model_cadence : ModelCadence = ModelCadence()
+    drowsiness_event_debounce : EventDebounceRule = EventDebounceRule()
+    yawning_event_debounce : EventDebounceRule = EventDebounceRule()
 
 class ConnectionStrings(BaseModel):
     db_connections: str
 
+class DatabaseSettings(BaseModel):
+    journal_mode : str = "WAL"
+    synchronous : str = "NORMAL"
+    busy_timeout_ms : int = 5000
+    pool_size : int = 5
+    max_overflow : int = 10
+    pool_timeout : float = 30.0
+
+class RetentionSettings(BaseModel):
+    # Off unless the operator turns it on, it deletes the events and their images
+    enabled : bool = False
+    max_age_days : Optional[float] = 30
+    max_bytes : Optional[int] = 2_000_000_000
+    interval_seconds : float = 600
+    batch_size : int = 200
+
 class ApiSettings(BaseModel):
     vehicle_id: str
     server: str
@@ -19,11 +60,26 @@ class ApiSettings(BaseModel):
     static_dir : str
     image_event_dir : str
     send_to_server: bool
+    outbox_max_size : int = 16
+    ws_ping_interval : float = 20.0
+    ws_ping_timeout : float = 20.0
+    ws_ack_timeout : float = 10.0
+    ws_max_backoff : float = 30.0
+    upload_replay_batch_size : int = 10
+    upload_replay_batch_interval : float = 5.0
+    upload_replay_max_per_second : float = 2.0
+    upload_protocol : UploadProtocol = UploadProtocol.JSON_BASE64
+
+# Aliases for the optional sections, pydantic can't annotate a field with a default by a type of the same name
+DatabaseSection = DatabaseSettings
+RetentionSection = RetentionSettings
 
 class AppConfig(BaseModel):
     PipelineSettings: PipelineSettings
     ConnectionStrings: ConnectionStrings
+    DatabaseSettings: DatabaseSection = DatabaseSection()
     ApiSettings: ApiSettings
+    RetentionSettings: RetentionSection = RetentionSection()
 
     @classmethod
     def load(cls, path: str = "config/app_settings.json"):
@@ -1,31 +1,36 @@
-import time
-
-import cv2
-
+from src.streaming.mjpeg_encoder import MjpegStreamEncoder
 from src.utils.frame_buffer import FrameBuffer
 
 
-def stream_raw_camera_feed(frame_buffer : FrameBuffer):
+async def stream_mjpeg_parts(stream_encoder : MjpegStreamEncoder):
     """
-    This function special for the FastAPI backend controller to continuously captures frames from the camera
-    and return a stream for real-time display transmission
+    Yield the multipart part of every new frame of the stream exactly once, the parts are
+    encoded once by the shared encoder and the same bytes are sent to every client.
+
+    This is an async generator, the client awaits the new frame on the event loop instead of
+    holding one of the threadpool workers for as long as it's connected.
     """
+    last_sequence = 0
     while True:
-        frame = frame_buffer.get_raw()
-        if frame is None:
-            time.sleep(0.03)
+        # Wakes up exactly once per new frame, no polling interval
+        result = await stream_encoder.wait_for_part_async(last_sequence, timeout=1.0)
+        if result is None:
             continue
 
-        success, buffer = cv2.imencode('.jpg', frame)
-        if not success:
-            continue
+        last_sequence, part = result
+        if part is not None:
+            yield part
 
-        yield (b'--frame\r\n'
-               b'Content-Type: image/jpeg\r\n\r\n' + buffer.tobytes() + b'\r\n')
 
-        time.sleep(0.03)
-        
-def stream_processed_drowsiness_feed(frame_buffer : FrameBuffer):
+async def stream_raw_camera_feed(stream_encoder : MjpegStreamEncoder):
+    """
+    This function special for the FastAPI backend controller to continuously captures frames from the camera
+    and return a stream for real-time display transmission
+    """
+    async for part in stream_mjpeg_parts(stream_encoder):
+        yield part
+
+async def stream_processed_drowsiness_feed(frame_buffer : FrameBuffer, stream_encoder : MjpegStreamEncoder):
     """
     This function special for the FastAPI backend controller to continuously captures frames from the camera, processes them for drowsiness detection, 
     and generates back a video stream with annotated landmarks and detection results.
@@ -42,18 +47,10 @@ def stream_processed_drowsiness_feed(frame_buffer : FrameBuffer):
 
     The resulting frames are yielded as a stream for real-time display or transmission.
     """
-    while True:
-        # Capture the video stream
-        frame = frame_buffer.get_processed()
-        if frame is None:
-            time.sleep(0.03)
-            continue
-
-        success, buffer = cv2.imencode('.jpg', frame)
-        if not success:
-            continue
-
-        yield (b'--frame\r\n'
-               b'Content-Type: image/jpeg\r\n\r\n' + buffer.tobytes() + b'\r\n')
-
-        time.sleep(0.03)
+    # Rendering of the processed frame only happens while someone is subscribed
+    frame_buffer.add_processed_subscriber()
+    try:
+        async for part in stream_mjpeg_parts(stream_encoder):
+            yield part
+    finally:
+        frame_buffer.remove_processed_subscriber()
@@ -0,0 +1,90 @@
+import asyncio
+from threading import Lock
+
+import cv2
+
+from src.utils.frame_buffer import FrameBuffer
+
+MJPEG_PART_HEADER = b'--frame\r\nContent-Type: image/jpeg\r\n\r\n'
+MJPEG_PART_TRAILER = b'\r\n'
+
+
+class MjpegStreamEncoder:
+    """
+    Shared encoder of a single MJPEG stream. Every new version of the frame is encoded once,
+    and the complete multipart part is built once, then the same bytes are fanned out to
+    every client of the stream. N viewers cost a single JPEG encode per frame instead of N.
+
+    The stream reads a slot of the frame buffer. The slot either holds the raw frame to be
+    encoded here (`encode=True`), or holds the JPEG that was already encoded somewhere else,
+    e.g. by the encoding stage of the pipeline, in which case only the multipart framing is done here.
+    """
+    def __init__(self, frame_buffer : FrameBuffer, slot : str, encode : bool = True):
+        self.frame_buffer = frame_buffer
+        self.slot = slot
+        self.encode = encode
+
+        self.lock = Lock()
+        # (sequence, part) of the latest frame, swapped as a whole so it can be read without the lock
+        self.cached_part : tuple[int, bytes | None] = (0, None)
+        self.encoded_frames = 0
+
+    def build_part(self, sequence : int, item) -> bytes | None:
+        """
+        Get the multipart part of the frame with the given sequence number, encoding it only
+        if no client has asked for that frame yet.
+        """
+        with self.lock:
+            cached_sequence, cached_part = self.cached_part
+            if sequence == cached_sequence:
+                return cached_part
+
+            jpeg = item
+            if self.encode:
+                success, buffer = cv2.imencode('.jpg', item)
+                if not success:
+                    return None
+                jpeg = buffer.tobytes()
+                self.encoded_frames += 1
+
+            part = b''.join((MJPEG_PART_HEADER, jpeg, MJPEG_PART_TRAILER))
+
+            # An older frame is still served to a slow client, but never replace a newer part
+            if sequence > cached_sequence:
+                self.cached_part = (sequence, part)
+            return part
+
+    def wait_for_part(self, after_sequence : int, timeout : float = None) -> tuple[int, bytes | None] | None:
+        """
+        Wait for a frame newer than `after_sequence` and get its multipart part.
+
+        Return
+        ----------
+        tuple[int, bytes | None] | None
+            The sequence number of the frame and its part, or None if no new frame arrived before
+            the timeout. The part is None if the frame could not be encoded.
+        """
+        result = self.frame_buffer.wait_for_newer(self.slot, after_sequence, timeout)
+        if result is None:
+            return None
+
+        sequence, item = result
+        return sequence, self.build_part(sequence, item)
+
+    async def wait_for_part_async(self, after_sequence : int, timeout : float = None) -> tuple[int, bytes | None] | None:
+        """
+        Asyncio variant of `wait_for_part()`. The frame is awaited without holding a thread, and
+        when the frame still has to be encoded the encoding is run in a worker thread, so the event
+        loop is never blocked by `cv2.imencode`.
+        """
+        result = await self.frame_buffer.wait_for_newer_async(self.slot, after_sequence, timeout)
+        if result is None:
+            return None
+
+        sequence, item = result
+        cached_sequence, cached_part = self.cached_part
+        if sequence == cached_sequence:
+            return sequence, cached_part
+        if self.encode:
+            return sequence, await asyncio.to_thread(self.build_part, sequence, item)
+        return sequence, self.build_part(sequence, item)
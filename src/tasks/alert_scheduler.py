@@ -0,0 +1,254 @@
+import datetime
+import heapq
+import itertools
+import threading
+import time
+from collections import OrderedDict
+
+from src.domain.dto.alert_job import AlertJob
+from src.domain.dto.beep_pattern import BeepPattern
+from src.enum.alert_job_status import AlertJobStatus
+from src.enum.alert_priority import AlertPriority
+from src.hardware.buzzer.base_buzzer import BaseBuzzer
+from src.utils.logging import logging_default
+
+
+class AlertScheduler:
+    """
+    Plays the beep patterns on the buzzer from a single thread driven by a timer queue.
+
+    Every step of a pattern is two timers, turning the buzzer on then off, so the thread only wakes up
+    when the buzzer has to change and sleeps on a condition while there's nothing to play.
+
+    Each pattern played is an `AlertJob` with a priority. A job of a higher priority than the one playing
+    preempts it right away instead of waiting for the current beep to end, and a job of a lower priority
+    waits in the queue until the buzzer is free, so a manual beep never covers a drowsiness alarm. On an
+    equal priority, a job replaces an endless pattern (e.g. the alarm of the previous drowsiness stage)
+    and queues behind a finite one (e.g. another manual beep). At most `max_queued_jobs` jobs wait in the
+    queue, a job that would wait in a full queue is rejected.
+    """
+    def __init__(self, buzzer : BaseBuzzer, max_finished_jobs : int = 100, max_queued_jobs : int = 8):
+        self.buzzer = buzzer
+        self.max_finished_jobs = max_finished_jobs
+        self.max_queued_jobs = max_queued_jobs
+
+        # The timers are (due time, sequence, generation, pattern, action, step index, repetition)
+        self.timers = []
+        self.sequence = itertools.count()
+        self.generation = 0
+        self.current_job : AlertJob | None = None
+        # The jobs waiting for the buzzer are (-priority, sequence, job), highest priority then oldest first
+        self.queued_jobs = []
+        self.jobs : OrderedDict[str, AlertJob] = OrderedDict()
+        self.condition = threading.Condition()
+
+        self.scheduler_thread = None
+        self.stopped = False
+
+    @property
+    def is_playing(self) -> bool:
+        with self.condition:
+            return self.current_job is not None
+
+    def start(self):
+        """
+        Start the scheduler thread. Does nothing if it's already running.
+        """
+        with self.condition:
+            if self.scheduler_thread and self.scheduler_thread.is_alive():
+                return
+            self.stopped = False
+
+        logging_default.info("Starting alert scheduler")
+        self.scheduler_thread = threading.Thread(target=self.scheduler_loop, name="alert-scheduler", daemon=True)
+        self.scheduler_thread.start()
+
+    def stop(self, timeout : float = 1.0):
+        with self.condition:
+            self.stopped = True
+            for _, _, job in self.queued_jobs:
+                self.finish(job, AlertJobStatus.CANCELLED)
+            self.queued_jobs.clear()
+            if self.current_job is not None:
+                self.finish(self.current_job, AlertJobStatus.CANCELLED)
+            self.cancel_timers()
+            self.condition.notify()
+        if self.scheduler_thread:
+            self.scheduler_thread.join(timeout)
+        self.buzzer.off()
+
+    def play(self, pattern : BeepPattern, priority : AlertPriority = AlertPriority.DROWSINESS) -> AlertJob | None:
+        """
+        Play a pattern as a new job. If the same pattern is already playing with the same priority,
+        it keeps playing without restarting and its job is returned.
+
+        Parameters
+        ----------
+        pattern : BeepPattern
+            The pattern to play.
+        priority : AlertPriority
+            The priority of the job, see the class docstring for how it's ordered with the job playing.
+
+        Return
+        ----------
+        AlertJob | None
+            The job of the pattern, to follow its status or cancel it. None if the job would have to
+            wait and the queue is already full.
+        """
+        with self.condition:
+            current_job = self.current_job
+            if current_job is not None and current_job.pattern == pattern and current_job.priority == priority:
+                return current_job
+
+            job = AlertJob(pattern, priority)
+            if current_job is not None and self.should_wait(job, current_job):
+                if len(self.queued_jobs) >= self.max_queued_jobs:
+                    logging_default.warning(f"Alert queue is full, rejecting the {pattern.name} beep pattern")
+                    return None
+                self.jobs[job.id] = job
+                heapq.heappush(self.queued_jobs, (-priority, next(self.sequence), job))
+                return job
+
+            self.jobs[job.id] = job
+
+            if current_job is not None:
+                self.finish(current_job, AlertJobStatus.PREEMPTED)
+            self.start_job(job)
+            return job
+
+    @staticmethod
+    def should_wait(job : AlertJob, current_job : AlertJob) -> bool:
+        if job.priority != current_job.priority:
+            return job.priority < current_job.priority
+        return current_job.pattern.times is not None
+
+    def silence(self, priority : AlertPriority | None = None):
+        """
+        Stop the job currently playing and turn the buzzer off right away, then play the next queued job.
+
+        Parameters
+        ----------
+        priority : AlertPriority, optional
+            Only stop the job playing if it has this priority, e.g. the drowsiness alarm stops without
+            cutting a manual beep. Stops any job if None.
+        """
+        with self.condition:
+            current_job = self.current_job
+            if current_job is None:
+                return
+            if priority is not None and current_job.priority != priority:
+                return
+
+            self.finish(current_job, AlertJobStatus.CANCELLED)
+            self.start_next_job()
+
+    def cancel(self, job_id : str) -> AlertJob | None:
+        """
+        Cancel a job, removing it from the queue or stopping it right away if it's playing.
+
+        Return
+        ----------
+        AlertJob | None
+            The job, None if there's no job with this id. A job already finished is returned unchanged.
+        """
+        with self.condition:
+            job = self.jobs.get(job_id)
+            if job is None:
+                return None
+
+            if job.status == AlertJobStatus.QUEUED:
+                self.queued_jobs = [entry for entry in self.queued_jobs if entry[2] is not job]
+                heapq.heapify(self.queued_jobs)
+                self.finish(job, AlertJobStatus.CANCELLED)
+            elif job is self.current_job:
+                self.finish(job, AlertJobStatus.CANCELLED)
+                self.start_next_job()
+            return job
+
+    def get_job(self, job_id : str) -> AlertJob | None:
+        with self.condition:
+            return self.jobs.get(job_id)
+
+    def start_job(self, job : AlertJob):
+        self.cancel_timers()
+        self.buzzer.off()
+        self.current_job = job
+        job.status = AlertJobStatus.PLAYING
+        job.started_at = datetime.datetime.now()
+        self.schedule(time.monotonic(), job.pattern, "on", 0, 0)
+        self.condition.notify()
+
+    def start_next_job(self):
+        if self.queued_jobs:
+            _, _, job = heapq.heappop(self.queued_jobs)
+            self.start_job(job)
+            return
+
+        self.cancel_timers()
+        self.buzzer.off()
+        self.condition.notify()
+
+    def finish(self, job : AlertJob, status : AlertJobStatus):
+        job.status = status
+        job.finished_at = datetime.datetime.now()
+        if job is self.current_job:
+            self.current_job = None
+
+        # Keep the status of the last finished jobs only
+        finished_jobs = [job_id for job_id, job in self.jobs.items() if job.finished_at is not None]
+        for job_id in finished_jobs[:max(0, len(finished_jobs) - self.max_finished_jobs)]:
+            del self.jobs[job_id]
+
+    def cancel_timers(self):
+        # The timers of a previous generation are dropped instead of being searched in the heap
+        self.generation += 1
+        self.timers.clear()
+
+    def schedule(self, due : float, pattern : BeepPattern, action : str, step_index : int, repetition : int):
+        heapq.heappush(self.timers, (due, next(self.sequence), self.generation, pattern, action, step_index, repetition))
+
+    def scheduler_loop(self):
+        """
+        The loop firing the timers when they are due, intended to be run in a background thread, see `start()`
+        """
+        with self.condition:
+            while not self.stopped:
+                if not self.timers:
+                    self.condition.wait()
+                    continue
+
+                due = self.timers[0][0]
+                remaining = due - time.monotonic()
+                if remaining > 0:
+                    self.condition.wait(remaining)
+                    continue
+
+                _, _, generation, pattern, action, step_index, repetition = heapq.heappop(self.timers)
+                if generation != self.generation:
+                    continue
+                try:
+                    self.fire(due, pattern, action, step_index, repetition)
+                except Exception as e:
+                    logging_default.error(f"Error while playing the {pattern.name} beep pattern: {e}")
+                    if self.current_job is not None:
+                        self.finish(self.current_job, AlertJobStatus.CANCELLED)
+                    self.start_next_job()
+
+    def fire(self, due : float, pattern : BeepPattern, action : str, step_index : int, repetition : int):
+        step = pattern.steps[step_index]
+        if action == "on":
+            self.buzzer.tone(step.frequency, step.on_ms)
+            self.schedule(due + step.on_ms / 1000, pattern, "off", step_index, repetition)
+            return
+
+        self.buzzer.off()
+        step_index += 1
+        if step_index == len(pattern.steps):
+            step_index = 0
+            repetition += 1
+            if pattern.times is not None and repetition >= pattern.times:
+                self.finish(self.current_job, AlertJobStatus.COMPLETED)
+                self.start_next_job()
+                return
+        # Scheduled from the due time and not the current time, so the pattern doesn't drift
+        self.schedule(due + step.off_ms / 1000, pattern, "on", step_index, repetition)
@@ -0,0 +1,63 @@
+import threading
+import time
+
+from src.hardware.camera.base_camera import BaseCamera
+from src.pipeline.service_time_stats import ServiceTimeStats
+from src.utils.frame_ring_buffer import FrameRingBuffer
+from src.utils.logging import logging_default
+
+
+class CaptureTask:
+    def __init__(self, camera : BaseCamera, frame_ring_buffer : FrameRingBuffer):
+        self.camera = camera
+        self.frame_ring_buffer = frame_ring_buffer
+
+        self.capture_thread = None
+        self.stop_event = threading.Event()
+        self.service_time = ServiceTimeStats()
+
+    def start(self):
+        """
+        Start the capture loop in its own background thread. Does nothing if it's already running.
+        """
+        if self.capture_thread and self.capture_thread.is_alive():
+            return
+
+        logging_default.info("Starting camera capture thread")
+        self.stop_event.clear()
+        self.capture_thread = threading.Thread(target=self.capture_loop, daemon=True)
+        self.capture_thread.start()
+
+    def stop(self, timeout : float = 1.0):
+        """
+        Ask the capture loop to stop and wait for the thread to finish.
+        """
+        self.stop_event.set()
+        if self.capture_thread:
+            self.capture_thread.join(timeout)
+
+    def capture_loop(self):
+        """
+        This function continuously reads the camera as fast as the camera can provide frames
+        and pushes them into the ring buffer. Reading the camera in its own thread keeps
+        `cv2.VideoCapture`/`Picamera2` from queueing stale frames while the inference is busy.
+
+        Notes
+        ----------
+        - This method is intended to be run in a background thread, see `start()`.
+        """
+        while not self.stop_event.is_set():
+            started_at = time.perf_counter()
+            ret, frame = self.camera.get_capture()
+            if not ret:
+                time.sleep(0.01)
+                continue
+
+            self.frame_ring_buffer.put(frame)
+            self.service_time.record(time.perf_counter() - started_at)
+
+    def get_stats(self) -> dict:
+        stats = {"name": "capture"}
+        stats.update(self.service_time.as_dict())
+        stats["output_buffer"] = self.frame_ring_buffer.get_stats()
+        return stats
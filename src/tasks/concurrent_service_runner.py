@@ -0,0 +1,86 @@
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from concurrent.futures import TimeoutError as FutureTimeoutError
+from threading import Lock
+from typing import Any, Callable
+
+from src.utils.logging import logging_default
+
+
+class ConcurrentServiceRunner:
+    """
+    Run the detection services of a single frame concurrently on a worker pool and join
+    their results, so the latency of a frame approaches the slowest model instead of the
+    sum of all of them. MediaPipe release the GIL while the graph is running, so threads
+    are enough for the models to actually overlap.
+    """
+    def __init__(self, max_workers : int = 3):
+        self.executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="inference")
+
+        # A service that timed out is still running in the pool, and the models are not safe
+        # to be called concurrently, so the service will be skipped until it has finished
+        self.running_futures : dict[str, Future] = {}
+        self.timeout_counts : dict[str, int] = {}
+        self.skipped_counts : dict[str, int] = {}
+        self.lock = Lock()
+
+    def run(self, jobs : dict[str, tuple[Callable[[Any], Any], float]], frame : Any) -> dict[str, Any]:
+        """
+        Submit the frame to every service and wait for all of them, each within its own timeout.
+
+        Parameters
+        ----------
+        jobs : dict[str, tuple[Callable, float]]
+            Mapping of the service name to a tuple of (process function, timeout in seconds)
+        frame : Any
+            The frame that will be passed to every process function
+
+        Return
+        ----------
+        dict[str, Any]
+            Mapping of the service name to its result, the result is None if the service
+            timed out, failed, or was still busy with a previous frame
+        """
+        started_at = time.monotonic()
+        futures = {}
+        results = {}
+
+        with self.lock:
+            for name, (process_function, _) in jobs.items():
+                running_future = self.running_futures.get(name)
+                if running_future is not None and not running_future.done():
+                    self.skipped_counts[name] = self.skipped_counts.get(name, 0) + 1
+                    results[name] = None
+                    continue
+
+                future = self.executor.submit(process_function, frame)
+                self.running_futures[name] = future
+                futures[name] = future
+
+        for name, future in futures.items():
+            timeout = jobs[name][1]
+            remaining = max(0.0, started_at + timeout - time.monotonic())
+            try:
+                results[name] = future.result(timeout=remaining)
+            except FutureTimeoutError:
+                with self.lock:
+                    self.timeout_counts[name] = self.timeout_counts.get(name, 0) + 1
+                logging_default.warning(f"Service {name} did not finish within {timeout:.3f}s, skipping its result for this frame")
+                results[name] = None
+            except Exception as e:
+                logging_default.error(f"Service {name} failed while processing the frame. Error: {e}")
+                results[name] = None
+
+        return results
+
+    def get_stats(self) -> dict:
+        """Get how many times each service timed out or was skipped because it was still busy."""
+        with self.lock:
+            return {
+                "timeouts": dict(self.timeout_counts),
+                "skipped": dict(self.skipped_counts),
+            }
+
+    def shutdown(self):
+        """Stop the worker pool without waiting for the running services."""
+        self.executor.shutdown(wait=False, cancel_futures=True)
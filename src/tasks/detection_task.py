@@ -1,15 +1,24 @@
+import threading
 import time
 
 import cv2
 
+from src.domain.dto.captured_frame import CapturedFrame
 from src.domain.dto.drowsiness_detection_result import DrowsinessDetectionResult
 from src.domain.dto.hands_detection_result import HandsDetectionResult
 from src.domain.dto.phone_detection_result import PhoneDetectionResult
+from src.domain.dto.pipeline_frame import PipelineFrame
+from src.enum.backpressure_policy import BackpressurePolicy
 from src.hardware.camera.base_camera import BaseCamera
+from src.pipeline.model_scheduler import ModelCadenceScheduler
+from src.pipeline.pipeline_stage import PipelineStage
+from src.pipeline.stage_queue import StageQueue
 from src.services.drowsiness_detection_service import DrowsinessDetectionService
 from src.services.hand_detection_service import HandsDetectionService
 from src.services.phone_detection_service import PhoneDetectionService
 from src.settings.app_config import PipelineSettings
+from src.tasks.capture_task import CaptureTask
+from src.tasks.concurrent_service_runner import ConcurrentServiceRunner
 from src.utils.drawing_utils import (
     draw_face_bounding_box,
     draw_fps,
@@ -17,6 +26,8 @@ from src.utils.drawing_utils import (
     draw_landmarks,
 )
 from src.utils.frame_buffer import FrameBuffer
+from src.utils.frame_context import FrameContext
+from src.utils.frame_ring_buffer import FrameRingBuffer
 from src.utils.landmark_constants import (
     BODY_POSE_FACE_CONNECTIONS,
     HAND_CONNECTIONS,
@@ -34,24 +45,216 @@ class DetectionTask:
     def __init__(self, pipeline_config : PipelineSettings):
         self.load_configuration(pipeline_config)
 
+        self.frame_ring_buffer = FrameRingBuffer(self.capture_buffer_size)
+        self.capture_task = None
+        self.service_runner = ConcurrentServiceRunner() if self.concurrent_inference else None
+        self.model_scheduler = ModelCadenceScheduler(self.model_cadences)
+        self.stages : list[PipelineStage] = []
+        self.stop_event = threading.Event()
+
     def load_configuration(self, config : PipelineSettings):
         self.drowsiness_model_run = config.drowsiness_model_run
         self.phone_detection_model_run = config.phone_detection_model_run
         self.hands_detection_model_run = config.hands_detection_model_run
+        self.capture_buffer_size = config.capture_buffer_size
+        self.concurrent_inference = config.concurrent_inference
+        self.drowsiness_service_timeout = config.drowsiness_service_timeout
+        self.phone_detection_service_timeout = config.phone_detection_service_timeout
+        self.hands_detection_service_timeout = config.hands_detection_service_timeout
+        self.pipeline_queue_size = config.pipeline_queue_size
+        self.pipeline_backpressure_policy = config.pipeline_backpressure_policy
+
+        self.model_cadences = {}
+        if self.drowsiness_model_run:
+            self.model_cadences["drowsiness"] = config.drowsiness_model_cadence
+        if self.phone_detection_model_run:
+            self.model_cadences["phone"] = config.phone_detection_model_cadence
+        if self.hands_detection_model_run:
+            self.model_cadences["hands"] = config.hands_detection_model_cadence
 
         logging_default.info(
-            "Loaded config - drowsiness_model_run: {drowsiness_model_run}, phone_detection_model_run: {phone_detection_model_run}, hands_detection_model_run: {hands_detection_model_run}",
+            "Loaded config - drowsiness_model_run: {drowsiness_model_run}, phone_detection_model_run: {phone_detection_model_run}, hands_detection_model_run: {hands_detection_model_run}, capture_buffer_size: {capture_buffer_size}, concurrent_inference: {concurrent_inference}, pipeline_queue_size: {pipeline_queue_size}, pipeline_backpressure_policy: {pipeline_backpressure_policy}",
             drowsiness_model_run=self.drowsiness_model_run,
             phone_detection_model_run=self.phone_detection_model_run,
-            hands_detection_model_run=self.hands_detection_model_run
+            hands_detection_model_run=self.hands_detection_model_run,
+            capture_buffer_size=self.capture_buffer_size,
+            concurrent_inference=self.concurrent_inference,
+            pipeline_queue_size=self.pipeline_queue_size,
+            pipeline_backpressure_policy=self.pipeline_backpressure_policy.value
         )
 
+    def get_capture_stats(self) -> dict:
+        """
+        Get the counters of the capture ring buffer (captured, overwritten, skipped and dropped frames)
+        """
+        return self.frame_ring_buffer.get_stats()
+
+    def get_pipeline_stats(self) -> dict:
+        """
+        Get the runtime statistics of every stage of the pipeline, their input queue depth
+        and their service time, so the slowest stage can be spotted while the system is running.
+        """
+        stages = [self.capture_task.get_stats()] if self.capture_task else []
+        stages.extend(stage.get_stats() for stage in self.stages)
+
+        stats = {"stages": stages}
+        if self.service_runner:
+            stats["services"] = self.service_runner.get_stats()
+        return stats
+
+    def stop(self):
+        """
+        Stop every stage of the pipeline, so the camera can be released safely
+        """
+        self.stop_event.set()
+        if self.capture_task:
+            self.capture_task.stop()
+        for stage in self.stages:
+            stage.stop()
+        if self.service_runner:
+            self.service_runner.shutdown()
+
+    def run_services(self, pipeline_frame : PipelineFrame, drowsiness_service : DrowsinessDetectionService,
+                     phone_detection_service : PhoneDetectionService,
+                     hand_detection_service : HandsDetectionService) -> PipelineFrame:
+        """
+        Run the detection services that are due on this frame according to their cadence.
+        In the concurrent mode the services are run at the same time on a worker pool, each
+        bounded by its own timeout, otherwise they are run one after another. A service that
+        did not run on this frame reuse its last result, see `ModelCadenceScheduler`.
+
+        Return
+        ----------
+        PipelineFrame
+            The same frame with the (drowsiness, phone, hands) detection results filled, None for
+            a service that is disabled or has not produced any result yet
+        """
+        services = {
+            "drowsiness": (drowsiness_service.detect, self.drowsiness_service_timeout),
+            "phone": (phone_detection_service.process_frame, self.phone_detection_service_timeout),
+            "hands": (hand_detection_service.process_frame, self.hands_detection_service_timeout),
+        }
+        selected = self.model_scheduler.select(pipeline_frame.capture_timestamp)
+        jobs = {name: services[name] for name in self.model_cadences if name in selected}
+
+        # Every service share the same context, so the derived views are computed once per frame
+        context = pipeline_frame.context
+        if self.service_runner:
+            results = self.service_runner.run(jobs, context)
+        else:
+            results = {name: process_function(context) for name, (process_function, _) in jobs.items()}
+
+        results = {
+            name: self.model_scheduler.resolve(name, results.get(name), pipeline_frame.sequence, pipeline_frame.capture_timestamp)
+            for name in self.model_cadences
+        }
+
+        pipeline_frame.drowsiness_result = results.get("drowsiness")
+        pipeline_frame.phone_result = results.get("phone")
+        pipeline_frame.hands_result = results.get("hands")
+        return pipeline_frame
+
+    def build_pipeline(self, drowsiness_service : DrowsinessDetectionService,
+                       phone_detection_service : PhoneDetectionService,
+                       hand_detection_service : HandsDetectionService,
+                       camera : BaseCamera, frame_buffer : FrameBuffer) -> list[PipelineStage]:
+        """
+        Build the stages of the pipeline and the bounded queues between them
+
+        ```
+        capture --> preprocess --> inference --+--> alert
+                                               |
+                                               +--> render --> encode
+        ```
+
+        The main path (capture until alert) follows the configured backpressure policy.
+        The render and encode branch always drop their oldest frame when full, so a slow
+        rendering or encoding never holds back the inference and the alert stage. The render
+        stage only draws while a client is subscribed to the processed stream.
+        """
+        self.capture_task = CaptureTask(camera, self.frame_ring_buffer)
+        self.prev_time = time.time()
+
+        def new_queue(name : str, policy : BackpressurePolicy = self.pipeline_backpressure_policy):
+            return StageQueue(name, self.pipeline_queue_size, policy)
+
+        inference_queue = new_queue("inference")
+        alert_queue = new_queue("alert")
+        render_queue = new_queue("render", BackpressurePolicy.DROP_OLDEST)
+        encode_queue = new_queue("encode", BackpressurePolicy.DROP_OLDEST)
+
+        def preprocess(captured_frame : CapturedFrame) -> PipelineFrame:
+            frame = cv2.flip(captured_frame.frame, 1)
+
+            # Save the frame to the shared global instance
+            frame_buffer.update_raw(frame)
+            return PipelineFrame(
+                captured_frame.sequence, captured_frame.timestamp, frame,
+                context=FrameContext(frame, captured_frame.sequence, captured_frame.timestamp)
+            )
+
+        def inference(pipeline_frame : PipelineFrame) -> PipelineFrame:
+            self.run_services(pipeline_frame, drowsiness_service, phone_detection_service, hand_detection_service)
+
+            # FPS calculation, the throughput of the pipeline is the throughput of the inference
+            current_time = time.time()
+            pipeline_frame.fps = 1 / max(current_time - self.prev_time, 1e-6)
+            self.prev_time = current_time
+            return pipeline_frame
+
+        def alert(pipeline_frame : PipelineFrame) -> None:
+            # Only a fresh result moves the alert logic, a reused one was already handled
+            result = pipeline_frame.drowsiness_result
+            if result and result.age_frames == 0:
+                drowsiness_service.handle_alerts(pipeline_frame.frame, result)
+
+        def render(pipeline_frame : PipelineFrame) -> PipelineFrame | None:
+            # Nobody is watching the processed stream, skip the copy, the overlays and the encoding
+            if not frame_buffer.has_processed_subscribers():
+                return None
+
+            processed_frame = pipeline_frame.frame.copy()
+
+            # Draw the result
+            if pipeline_frame.drowsiness_result:
+                processed_frame = self.draw_drowsiness_result(processed_frame, pipeline_frame.drowsiness_result)
+            if pipeline_frame.phone_result:
+                processed_frame = self.draw_phone_detection_result(processed_frame, pipeline_frame.phone_result)
+            if pipeline_frame.hands_result:
+                processed_frame = self.draw_hands_detection_result(processed_frame, pipeline_frame.hands_result)
+
+            # Draw the FPS
+            draw_fps(processed_frame, f"FPS : {pipeline_frame.fps:.2f}")
+
+            pipeline_frame.processed_frame = processed_frame
+            return pipeline_frame
+
+        def encode(pipeline_frame : PipelineFrame) -> None:
+            success, buffer = cv2.imencode('.jpg', pipeline_frame.processed_frame)
+            if not success:
+                return
+
+            # Save the processed
+            pipeline_frame.jpeg = buffer.tobytes()
+            frame_buffer.update_processed(pipeline_frame.processed_frame)
+            frame_buffer.update_processed_jpeg(pipeline_frame.jpeg)
+
+        return [
+            PipelineStage("preprocess", preprocess, self.frame_ring_buffer, [inference_queue]),
+            PipelineStage("inference", inference, inference_queue, [alert_queue, render_queue]),
+            PipelineStage("alert", alert, alert_queue),
+            PipelineStage("render", render, render_queue, [encode_queue]),
+            PipelineStage("encode", encode, encode_queue),
+        ]
+
     def detection_loop(self, drowsiness_service : DrowsinessDetectionService, 
                    phone_detection_service : PhoneDetectionService,
                    hand_detection_service : HandsDetectionService,
                    camera : BaseCamera, frame_buffer : FrameBuffer):
         """
         This function serves as the main inference of the loop of the machine learning models.
+        It builds the staged pipeline (capture, preprocess, inference, alert, render and encode),
+        starts every stage on its own thread, and waits until the task is stopped.
 
         Parameters
         ----------
@@ -71,59 +274,23 @@ class DetectionTask:
         ----------
         - This method is intended to be run in a background thread.
         - Detection modules are only invoked if enabled in the config (pipeline_settings.json).
-        - To prevent CPU overload, the loop includes a short sleep (~10ms) between iterations.
+        - The stages overlap across frames, so the throughput is set by the slowest stage
+          instead of the sum of all of them. See `get_pipeline_stats()` to find that stage.
         """
-    
-        self.prev_time = time.time()
-
-        while True:
-            ret, original_frame = camera.get_capture()
-            if not ret:
-                time.sleep(0.01)
-                continue
-            
-            original_frame = cv2.flip(original_frame, 1)
-            processed_frame = original_frame.copy()
-
-            # Save the frame to the shared global instance
-            frame_buffer.update_raw(original_frame)
-
-            # Run them into detection service
-            drowsiness_detection_result = None
-            phone_detection_result = None
-            hands_detection_result = None
-
-            if self.drowsiness_model_run:
-                drowsiness_detection_result = drowsiness_service.process_frame(original_frame)
-            if self.phone_detection_model_run:
-                phone_detection_result = phone_detection_service.process_frame(original_frame)
-            if self.hands_detection_model_run:
-                hands_detection_result = hand_detection_service.process_frame(original_frame)
-
-            # Draw the result
-            if drowsiness_detection_result:
-                processed_frame = self.draw_drowsiness_result(processed_frame, drowsiness_detection_result)
-            if phone_detection_result:
-                processed_frame = self.draw_phone_detection_result(processed_frame, phone_detection_result)
-            if hands_detection_result:
-                processed_frame = self.draw_hands_detection_result(processed_frame, hands_detection_result)
-
-            # Draw the FPS
-            # FPS calculation
-            current_time = time.time()
-            fps = 1 / (current_time - self.prev_time)
-            self.prev_time = current_time
-            draw_fps(processed_frame, f"FPS : {fps:.2f}")
+        self.stages = self.build_pipeline(
+            drowsiness_service, phone_detection_service, hand_detection_service, camera, frame_buffer
+        )
 
-            # Save the processed 
-            frame_buffer.update_processed(processed_frame)
+        self.capture_task.start()
+        for stage in self.stages:
+            stage.start()
 
-            time.sleep(0.01)
+        self.stop_event.wait()
 
     def draw_drowsiness_result(self, processed_frame, result : DrowsinessDetectionResult):
         for face in result.faces:
             landmark = face.face_landmark
-            if not landmark:
+            if landmark is None or len(landmark) == 0:
                 continue  # skip faces with no landmarks
 
             # Draw bounding box (you must have your own method for this)
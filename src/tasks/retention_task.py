@@ -0,0 +1,200 @@
+import datetime
+import os
+import threading
+import time
+from uuid import UUID
+
+from sqlalchemy import Engine
+from sqlmodel import Session
+
+from src.services.drowsiness_event_service import DrowsinessEventService
+from src.settings.app_config import RetentionSettings
+from src.utils.logging import logging_default
+
+
+class RetentionTask:
+    """
+    Background job keeping the event images and rows within the configured retention.
+
+    Every run evicts the events older than `max_age_days`, then the oldest images until the image
+    directory is under `max_bytes`. The rows of an evicted image are deleted with it, in bulk
+    transactions of `batch_size` events, and the rollups are updated in the same transaction.
+    The images without a row, from failed writes or older versions, are evicted by the quota as well.
+
+    It's disabled by default, `RetentionSettings.enabled` has to be turned on for it to delete anything.
+    """
+    def __init__(self, engine : Engine, image_event_path : str, retention_settings : RetentionSettings):
+        self.engine = engine
+        self.image_event_path = image_event_path
+        self.enabled = retention_settings.enabled
+        self.max_age_days = retention_settings.max_age_days
+        self.max_bytes = retention_settings.max_bytes
+        self.interval = retention_settings.interval_seconds
+        self.batch_size = retention_settings.batch_size
+
+        self.lock = threading.Lock()
+        self.runs = 0
+        self.evicted_events = 0
+        self.evicted_images = 0
+        self.evicted_bytes = 0
+        self.image_bytes = 0
+        self.last_run_at = None
+
+        self.retention_thread = None
+        self.stop_event = threading.Event()
+
+    def start(self):
+        """
+        Start the retention loop in a background thread. Does nothing if it's disabled or already running.
+        """
+        if not self.enabled:
+            return
+        if self.retention_thread and self.retention_thread.is_alive():
+            return
+
+        logging_default.info("Starting event retention thread")
+        self.stop_event.clear()
+        self.retention_thread = threading.Thread(target=self.retention_loop, name="event-retention", daemon=True)
+        self.retention_thread.start()
+
+    def stop(self, timeout : float = 1.0):
+        self.stop_event.set()
+        if self.retention_thread:
+            self.retention_thread.join(timeout)
+
+    def retention_loop(self):
+        """
+        The loop applying the retention every `interval` seconds, intended to be run in a background thread, see `start()`
+        """
+        while not self.stop_event.is_set():
+            try:
+                self.run_once()
+            except Exception as e:
+                logging_default.error(f"Error while applying the event retention: {e}")
+            self.stop_event.wait(self.interval)
+
+    def run_once(self):
+        """
+        Apply the retention once, evicting the expired events then the oldest images over the quota.
+        """
+        started_at = time.monotonic()
+        with Session(self.engine) as session:
+            event_service = DrowsinessEventService(session)
+            if self.max_age_days is not None:
+                self.evict_expired(event_service)
+            if self.max_bytes is not None:
+                self.evict_over_quota(event_service)
+            else:
+                self.image_bytes = sum(size for _, size, _ in self.list_images())
+
+        with self.lock:
+            self.runs += 1
+            self.last_run_at = datetime.datetime.now()
+        logging_default.info(f"Event retention applied in {time.monotonic() - started_at:.2f}s, "
+                             f"images now take {self.image_bytes} bytes")
+
+    def evict_expired(self, event_service : DrowsinessEventService):
+        older_than = datetime.datetime.now() - datetime.timedelta(days=self.max_age_days)
+        while not self.stop_event.is_set():
+            events = event_service.get_expired_events(older_than, self.batch_size)
+            if not events:
+                return
+            deleted_events = event_service.delete_events([event.id for event in events])
+            # The rows store the image path as served, relative to the working directory like the image event path
+            self.remove_images([event.image for event in deleted_events])
+            with self.lock:
+                self.evicted_events += len(deleted_events)
+
+    def evict_over_quota(self, event_service : DrowsinessEventService):
+        images = self.list_images()
+        total_bytes = sum(size for _, size, _ in images)
+
+        # Oldest first, evicted in batches until the images fit in the quota
+        images.sort()
+        index = 0
+        while total_bytes > self.max_bytes and index < len(images) and not self.stop_event.is_set():
+            batch = []
+            while total_bytes > self.max_bytes and index < len(images) and len(batch) < self.batch_size:
+                batch.append(images[index])
+                total_bytes -= images[index][1]
+                index += 1
+
+            deleted_events = event_service.delete_events([
+                event_id for event_id in (get_image_event_id(path) for _, _, path in batch) if event_id is not None
+            ])
+            self.remove_images([path for _, _, path in batch])
+            with self.lock:
+                self.evicted_events += len(deleted_events)
+
+        self.image_bytes = total_bytes
+
+    def list_images(self) -> list[tuple[float, int, str]]:
+        """
+        List the images of the image event directory and its shard directories.
+
+        Return
+        ----------
+        list[tuple[float, int, str]]
+            The modification time, the size and the path of every image.
+        """
+        images = []
+        for directory, _, file_names in os.walk(self.image_event_path):
+            for file_name in file_names:
+                if not file_name.endswith(".jpg"):
+                    continue
+                path = os.path.join(directory, file_name)
+                try:
+                    stat = os.stat(path)
+                except FileNotFoundError:
+                    continue
+                images.append((stat.st_mtime, stat.st_size, path))
+        return images
+
+    def remove_images(self, paths : list[str]):
+        image_event_path = os.path.abspath(self.image_event_path)
+        for path in paths:
+            # Never remove a file outside of the image event directory, whatever path a row holds
+            if os.path.commonpath([os.path.abspath(path), image_event_path]) != image_event_path:
+                continue
+            try:
+                size = os.path.getsize(path)
+                os.remove(path)
+            except FileNotFoundError:
+                continue
+            except OSError as e:
+                logging_default.warning(f"Could not remove event image {path}: {e}")
+                continue
+
+            with self.lock:
+                self.evicted_images += 1
+                self.evicted_bytes += size
+
+            # Remove the shard directories left empty, up to the image event directory
+            directory = os.path.dirname(path)
+            while os.path.abspath(directory) != image_event_path:
+                try:
+                    os.rmdir(directory)
+                except OSError:
+                    break
+                directory = os.path.dirname(directory)
+
+    def get_stats(self) -> dict:
+        with self.lock:
+            return {
+                "enabled": self.enabled,
+                "max_age_days": self.max_age_days,
+                "max_bytes": self.max_bytes,
+                "image_bytes": self.image_bytes,
+                "runs": self.runs,
+                "last_run_at": self.last_run_at,
+                "evicted_events": self.evicted_events,
+                "evicted_images": self.evicted_images,
+                "evicted_bytes": self.evicted_bytes,
+            }
+
+
+def get_image_event_id(path : str) -> UUID | None:
+    try:
+        return UUID(os.path.splitext(os.path.basename(path))[0])
+    except ValueError:
+        return None
@@ -1,13 +1,29 @@
 import cv2
+import numpy as np
 
 
+def to_pixel_points(landmarks, indexes, width, height) -> list:
+    """
+    Scale the normalized (x, y) of the landmarks at the given indexes to pixel positions, truncated like `int()`.
+
+    Parameters:
+        landmarks (ndarray): The (N, 3) normalized landmark coordinates of one object, or a list of (x, y, z).
+        indexes (array-like): The indexes of the landmarks, of any shape.
+
+    return:
+        list
+            The nested lists of (x, y) int pixel positions, with the shape of the indexes.
+    """
+    points = np.asarray(landmarks)[np.asarray(indexes, dtype=np.intp), :2]
+    return (points.astype(np.float64) * (width, height)).astype(np.int64).tolist()
+
 def draw_landmarks(image, landmarks, connections, color_lines=(0, 255, 0), color_points=(0, 255, 0), size=1):
     """
     Draws lines between specified pairs of normalized landmarks.
 
     Parameters:
         image (ndarray): The image to draw on.
-        landmarks (list of (x, y, z)): Normalized landmark coordinates.
+        landmarks (ndarray): The (N, 3) normalized landmark coordinates, or a list of (x, y, z).
         connections (list of (start_idx, end_idx)): List of index pairs to connect.
         color_lines (tuple): BGR color for drawing lines.
         color_points (tuple): BGR color for drawing each point circle.
@@ -15,13 +31,8 @@ def draw_landmarks(image, landmarks, connections, color_lines=(0, 255, 0), color
     """
     height, width = image.shape[:2]
 
-    for start_idx, end_idx in connections:
-        x0, y0, _ = landmarks[start_idx]
-        x1, y1, _ = landmarks[end_idx]
-
-        pt1 = int(x0 * width), int(y0 * height)
-        pt2 = int(x1 * width), int(y1 * height)
-
+    for pt1, pt2 in to_pixel_points(landmarks, connections, width, height):
+        pt1, pt2 = tuple(pt1), tuple(pt2)
         cv2.line(image, pt1, pt2, color_lines, thickness=size)
         cv2.circle(image, pt2, size + 1, color_points, -1)
 
@@ -31,7 +42,7 @@ def draw_face_bounding_box(frame, face_landmark, face_index):
 
     Parameters:
         frame (ndarray): Image on which to draw.
-        face_landmark (list): List of face landmark coordinates [(x, y, z)].
+        face_landmark (ndarray): The (N, 3) normalized face landmark coordinates, or a list of (x, y, z).
         face_index (int): Index which to draw
         color (tuple): Color of the arrow (default red).
 
@@ -40,13 +51,12 @@ def draw_face_bounding_box(frame, face_landmark, face_index):
             Coordinates of the bounding box in the format (x_min, y_min, x_max, y_max).
     """
     h, w = frame.shape[:2]
-    coords = [(int(lm[0] * w), int(lm[1] * h)) for lm in face_landmark]
+    face_landmark = np.asarray(face_landmark)
+    coords = (face_landmark[:, :2].astype(np.float64) * (w, h)).astype(np.int64)
+    (min_x, min_y), (max_x, max_y) = coords.min(axis=0).tolist(), coords.max(axis=0).tolist()
 
-    x_coords = [p[0] for p in coords]
-    y_coords = [p[1] for p in coords]
-
-    x_min, y_min = max(min(x_coords) - 10, 0), max(min(y_coords) - 10, 0)
-    x_max, y_max = min(max(x_coords) + 10, w), min(max(y_coords) + 10, h)
+    x_min, y_min = max(min_x - 10, 0), max(min_y - 10, 0)
+    x_max, y_max = min(max_x + 10, w), min(max_y + 10, h)
 
     cv2.rectangle(frame, (x_min, y_min), (x_max, y_max), (0, 255, 0), 2)
     cv2.putText(frame, f"Face #{face_index}", (x_min, y_min - 10),
@@ -59,16 +69,13 @@ def draw_head_pose_direction(image, face_landmark, x_angle, y_angle, color=(0, 0
 
     Parameters:
         image (ndarray): Image on which to draw.
-        face_landmark (list): List of face landmark coordinates [(x, y, z)].
+        face_landmark (ndarray): The (N, 3) normalized face landmark coordinates, or a list of (x, y, z).
         x_angle (float): Pitch angle (up/down).
         y_angle (float): Yaw angle (left/right).
         color (tuple): Color of the arrow (default red).
     """
     # Starting point: center of the face (e.g., nose tip or landmark index 1)
-    p1 = (
-        int(face_landmark[1][0] * image.shape[1]),
-        int(face_landmark[1][1] * image.shape[0])
-    )
+    p1 = tuple(to_pixel_points(face_landmark, 1, image.shape[1], image.shape[0]))
     
     # Ending point determined by the rotation angles
     p2 = (
@@ -0,0 +1,30 @@
+import datetime
+from uuid import UUID
+
+
+def get_event_image_name(image_uuid : UUID | str) -> str:
+    """
+    Get the sharded relative path of an event image, `YYYY/MM/DD/<hh>/<uuid>.jpg`.
+
+    The date comes from the timestamp embedded in the uuid7, so the path can be computed again from
+    the id alone, and `hh` is the last byte of the id, spreading one day of images over up to 256
+    directories instead of a single flat one.
+
+    Parameters
+    ----------
+    image_uuid : UUID | str
+        The id of the event image.
+
+    Return
+    ----------
+    str
+        The path of the image, relative to the image event directory.
+    """
+    image_uuid = image_uuid if isinstance(image_uuid, UUID) else UUID(str(image_uuid))
+    shard = image_uuid.hex[-2:]
+    if image_uuid.version != 7:
+        return f"{shard}/{image_uuid}.jpg"
+
+    # The first 48 bits of a uuid7 are the unix timestamp in milliseconds
+    created_at = datetime.datetime.fromtimestamp((image_uuid.int >> 80) / 1000)
+    return f"{created_at:%Y/%m/%d}/{shard}/{image_uuid}.jpg"
@@ -1,28 +1,174 @@
-from threading import Lock
+import asyncio
+from threading import Condition, Lock
+from typing import Any
+
+
+class FrameSlot:
+    """
+    A single versioned slot of the frame buffer. Every update bumps the sequence number and
+    wakes the consumers waiting for a newer frame, both the threads and the asyncio tasks.
+    """
+    def __init__(self, name : str):
+        self.name = name
+        self.value = None
+        self.sequence = 0
+        self.condition = Condition()
+        self.async_waiters : set[tuple[asyncio.AbstractEventLoop, asyncio.Future]] = set()
+
+    def update(self, value : Any) -> int:
+        with self.condition:
+            self.value = value
+            self.sequence += 1
+            self.condition.notify_all()
+
+            for loop, future in self.async_waiters:
+                try:
+                    loop.call_soon_threadsafe(self.resolve_waiter, future)
+                except RuntimeError:
+                    # The event loop of the waiter was already closed
+                    pass
+            self.async_waiters.clear()
+            return self.sequence
+
+    @staticmethod
+    def resolve_waiter(future : asyncio.Future):
+        if not future.done():
+            future.set_result(None)
+
+    def clear(self):
+        """Drop the value, without bumping the sequence, the consumers simply wait for the next update."""
+        with self.condition:
+            self.value = None
+
+    def get(self) -> tuple[int, Any]:
+        with self.condition:
+            return self.sequence, self.value
+
+    def has_newer(self, sequence : int) -> bool:
+        return self.sequence > sequence and self.value is not None
+
+    def wait_for_newer(self, sequence : int, timeout : float = None) -> tuple[int, Any] | None:
+        with self.condition:
+            if not self.condition.wait_for(lambda: self.has_newer(sequence), timeout):
+                return None
+            return self.sequence, self.value
+
+    async def wait_for_newer_async(self, sequence : int, timeout : float = None) -> tuple[int, Any] | None:
+        loop = asyncio.get_running_loop()
+        deadline = None if timeout is None else loop.time() + timeout
+
+        while True:
+            with self.condition:
+                if self.has_newer(sequence):
+                    return self.sequence, self.value
+
+                waiter = (loop, loop.create_future())
+                self.async_waiters.add(waiter)
+
+            remaining = None if deadline is None else deadline - loop.time()
+            try:
+                if remaining is not None and remaining <= 0:
+                    return None
+                await asyncio.wait_for(waiter[1], remaining)
+            except asyncio.TimeoutError:
+                return None
+            finally:
+                with self.condition:
+                    self.async_waiters.discard(waiter)
 
 
 class FrameBuffer:
+    RAW = "raw"
+    PROCESSED = "processed"
+    PROCESSED_JPEG = "processed_jpeg"
+
     def __init__(self):
-        self.raw_frame = None
-        self.processed_frame = None
+        self.slots = {name: FrameSlot(name) for name in (self.RAW, self.PROCESSED, self.PROCESSED_JPEG)}
+        self.processed_subscribers = 0
         self.lock = Lock()
 
+    def update(self, slot : str, value : Any) -> int:
+        """
+        Update the value of a slot.
+
+        Return
+        ----------
+        int
+            The new sequence number of the slot
+        """
+        return self.slots[slot].update(value)
+
+    def get(self, slot : str) -> tuple[int, Any]:
+        """Get the (sequence, value) of a slot."""
+        return self.slots[slot].get()
+
+    def wait_for_newer(self, slot : str, sequence : int, timeout : float = None) -> tuple[int, Any] | None:
+        """
+        Block until the slot holds a frame newer than `sequence`.
+
+        Parameters
+        ----------
+        slot : str
+            The name of the slot (`FrameBuffer.RAW`, `FrameBuffer.PROCESSED` or `FrameBuffer.PROCESSED_JPEG`)
+        sequence : int
+            The sequence number of the last frame the consumer has got, 0 to get any frame
+        timeout : float, optional
+            Maximum time in seconds to wait, None means wait forever
+
+        Return
+        ----------
+        tuple[int, Any] | None
+            The (sequence, value) of the newer frame, or None if it timed out
+        """
+        return self.slots[slot].wait_for_newer(sequence, timeout)
+
+    async def wait_for_newer_async(self, slot : str, sequence : int, timeout : float = None) -> tuple[int, Any] | None:
+        """
+        Asyncio variant of `wait_for_newer()`, it awaits the new frame without holding a thread.
+        """
+        return await self.slots[slot].wait_for_newer_async(sequence, timeout)
+
     def update_raw(self, frame):
         """Update the raw frame."""
-        with self.lock:
-            self.raw_frame = frame
+        self.update(self.RAW, frame)
 
     def get_raw(self):
         """Get the raw frame."""
-        with self.lock:
-            return self.raw_frame
+        return self.get(self.RAW)[1]
 
     def update_processed(self, frame):
         """Update the processed frame."""
-        with self.lock:
-            self.processed_frame = frame
+        self.update(self.PROCESSED, frame)
 
     def get_processed(self):
         """Get the processed frame."""
+        return self.get(self.PROCESSED)[1]
+
+    def update_processed_jpeg(self, jpeg : bytes):
+        """Update the JPEG encoded processed frame."""
+        self.update(self.PROCESSED_JPEG, jpeg)
+
+    def get_processed_jpeg(self):
+        """Get the JPEG encoded processed frame."""
+        return self.get(self.PROCESSED_JPEG)[1]
+
+    def add_processed_subscriber(self):
+        """Register a client watching the processed frames."""
+        with self.lock:
+            self.processed_subscribers += 1
+
+    def remove_processed_subscriber(self):
+        """
+        Unregister a client watching the processed frames. Once nobody is watching anymore
+        the last processed frame is dropped, so the next client never gets a stale frame.
+        """
+        with self.lock:
+            self.processed_subscribers = max(0, self.processed_subscribers - 1)
+            if self.processed_subscribers == 0:
+                self.slots[self.PROCESSED].clear()
+                self.slots[self.PROCESSED_JPEG].clear()
+
+    def has_processed_subscribers(self) -> bool:
+        """Check if any client is watching the processed frames."""
         with self.lock:
-            return self.processed_frame
\ No newline at end of file
+            return self.processed_subscribers > 0
@@ -0,0 +1,118 @@
+from threading import RLock
+from typing import Any, Callable
+
+import cv2
+import numpy as np
+
+
+def letterbox_image(image : np.ndarray, width : int, height : int) -> tuple[np.ndarray, float, tuple[int, int]]:
+    """
+    Resize and pad an image to the given size while maintaining the aspect ratio
+
+    Parameters
+    ----------
+    image : np.ndarray
+        The image of the frame to be resized and padded
+    width : int
+        The width of the target image
+    height : int
+        The height of the target image
+
+    Returns
+    ----------
+    img : np.ndarray
+        The resized and padded image of shape (height, width, C)
+    scale : float
+        scale factor between original image and the target image
+    pad : tuple[int, int]
+        pixels of padding (height, width) in the original image
+    """
+    size = image.shape
+    if size[0] >= size[1]:
+        h1 = int(height)
+        w1 = int(width * size[1] // size[0])
+        padh = 0
+        padw = int(width - w1)
+        scale = size[1] / w1
+    else:
+        h1 = int(height * size[0] // size[1])
+        w1 = int(width)
+        padh = int(height - h1)
+        padw = 0
+        scale = size[0] / h1
+
+    padh1 = padh//2
+    padh2 = padh//2 + padh % 2
+    padw1 = padw//2
+    padw2 = padw//2 + padw % 2
+    image = cv2.resize(image, (w1, h1))
+    image = np.pad(image, ((padh1, padh2), (padw1, padw2), (0, 0)), mode='constant')
+    pad = (int(padh1 * scale), int(padw1 * scale))
+    return image, scale, pad
+
+
+class FrameContext:
+    """
+    Per-frame context that is passed through the services. It lazily computes and caches the
+    derived views of the frame (RGB, grayscale, detector-sized letterbox), so every conversion
+    happens at most once per frame no matter how many models consume it.
+
+    The context may be shared by services running concurrently, the views are computed under
+    a lock so two models asking the same view at the same time do not convert it twice.
+    """
+    def __init__(self, frame : np.ndarray, sequence : int = 0, timestamp : float = None):
+        self.frame = frame
+        self.sequence = sequence
+        self.timestamp = timestamp
+
+        self.views : dict[Any, Any] = {}
+        self.lock = RLock()
+
+    @classmethod
+    def of(cls, frame : "FrameContext | np.ndarray") -> "FrameContext":
+        """Wrap a BGR frame into a context, a context is returned as is."""
+        if isinstance(frame, FrameContext):
+            return frame
+        return cls(frame)
+
+    @property
+    def shape(self) -> tuple:
+        return self.frame.shape
+
+    def get_view(self, key : Any, factory : Callable[[], Any]) -> Any:
+        """
+        Get a derived view of the frame, computing it with `factory` on the first request
+
+        Parameters
+        ----------
+        key : Any
+            The hashable key of the view
+        factory : Callable
+            The function that computes the view from the frame
+        """
+        with self.lock:
+            if key not in self.views:
+                self.views[key] = factory()
+            return self.views[key]
+
+    @property
+    def bgr(self) -> np.ndarray:
+        """The original frame, in BGR format."""
+        return self.frame
+
+    @property
+    def rgb(self) -> np.ndarray:
+        """The frame converted to RGB format."""
+        return self.get_view("rgb", lambda: cv2.cvtColor(self.frame, cv2.COLOR_BGR2RGB))
+
+    @property
+    def gray(self) -> np.ndarray:
+        """The frame converted to grayscale."""
+        return self.get_view("gray", lambda: cv2.cvtColor(self.frame, cv2.COLOR_BGR2GRAY))
+
+    def letterbox(self, width : int, height : int) -> tuple[np.ndarray, float, tuple[int, int]]:
+        """
+        The RGB view resized and padded to the detector input size, see `letterbox_image()`
+        """
+        width, height = int(width), int(height)
+        return self.get_view(("letterbox", width, height), lambda: letterbox_image(self.rgb, width, height))
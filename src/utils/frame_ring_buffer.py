@@ -0,0 +1,106 @@
+import time
+from collections import deque
+from threading import Condition
+
+import numpy as np
+
+from src.domain.dto.captured_frame import CapturedFrame
+
+
+class FrameRingBuffer:
+    """
+    Small ring buffer that sits between the capture thread and the consumers of the frames.
+    It always keeps the newest frames, older frames are dropped once the buffer is full or
+    once a consumer has taken a newer frame, so the consumer never works on a stale frame.
+    """
+    def __init__(self, capacity : int = 2):
+        self.capacity = max(1, capacity)
+        self.frames = deque(maxlen=self.capacity)
+        self.condition = Condition()
+
+        self.sequence = 0
+        self.captured_frames = 0
+        self.overwritten_frames = 0
+        self.skipped_frames = 0
+
+    def put(self, frame : np.ndarray) -> CapturedFrame:
+        """
+        Push a new frame into the buffer, stamping it with a monotonic sequence number
+        and the capture timestamp (`time.monotonic()`).
+
+        Parameters
+        ----------
+        frame : np.ndarray
+            The frame that was just captured by the camera
+
+        Return
+        ----------
+        CapturedFrame
+            The stamped frame that was stored in the buffer
+        """
+        with self.condition:
+            self.sequence += 1
+            captured_frame = CapturedFrame(self.sequence, time.monotonic(), frame)
+
+            if len(self.frames) == self.capacity:
+                self.overwritten_frames += 1
+            self.frames.append(captured_frame)
+            self.captured_frames += 1
+
+            self.condition.notify_all()
+            return captured_frame
+
+    def get_latest(self, after_sequence : int = 0, timeout : float = None) -> CapturedFrame | None:
+        """
+        Get the freshest frame that is newer than `after_sequence`, waiting for it if needed.
+        Every older frame still in the buffer is dropped, since it will never be processed.
+
+        Parameters
+        ----------
+        after_sequence : int, optional
+            The sequence number of the last frame the consumer has processed (default is 0)
+        timeout : float, optional
+            Maximum time in seconds to wait for a new frame, None means wait forever
+
+        Return
+        ----------
+        CapturedFrame | None
+            The newest frame, or None if no new frame arrived before the timeout
+        """
+        with self.condition:
+            has_new_frame = self.condition.wait_for(
+                lambda: self.frames and self.frames[-1].sequence > after_sequence,
+                timeout
+            )
+            if not has_new_frame:
+                return None
+
+            latest_frame = self.frames[-1]
+            self.skipped_frames += len(self.frames) - 1
+            self.frames.clear()
+            return latest_frame
+
+    def get(self, timeout : float = None) -> CapturedFrame | None:
+        """
+        Queue-like access to the freshest frame, so the buffer can be the input of a pipeline stage.
+        """
+        return self.get_latest(0, timeout)
+
+    @property
+    def dropped_frames(self) -> int:
+        """Total frames that were captured but will never be processed."""
+        with self.condition:
+            return self.overwritten_frames + self.skipped_frames
+
+    def get_stats(self) -> dict:
+        """Get the counters of the buffer."""
+        with self.condition:
+            return {
+                "capacity": self.capacity,
+                "depth": len(self.frames),
+                "last_sequence": self.sequence,
+                "captured_frames": self.captured_frames,
+                "overwritten_frames": self.overwritten_frames,
+                "skipped_frames": self.skipped_frames,
+                "dropped_frames": self.overwritten_frames + self.skipped_frames,
+            }
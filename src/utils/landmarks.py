@@ -0,0 +1,97 @@
+from typing import Iterator
+
+import numpy as np
+
+
+class Landmarks:
+    """
+    The landmarks of every object (face, hand, body) detected in a frame, kept as a single float32
+    array of shape (F, N, 3) of normalized (x, y, z) coordinates instead of lists of tuples.
+
+    It behaves like the list of objects it replaces: `len()` is the number of objects, indexing or
+    iterating gives the (N, 3) array of one object, which is a view and not a copy, and it's falsy
+    when nothing is detected. The whole array is `points`, for computations over every object at once.
+    """
+    __slots__ = ("points", "image_size", "scores")
+
+    def __init__(self, points : np.ndarray, image_size : tuple[int, int] | None = None, scores : np.ndarray | None = None):
+        """
+        Parameters
+        ----------
+        points : np.ndarray
+            The landmarks of shape (F, N, 3), or (N, 3) for a single object.
+        image_size : tuple[int, int], optional
+            The (width, height) of the image the landmarks were detected on.
+        scores : np.ndarray, optional
+            The confidence of each object of shape (F,), when the model gives one.
+        """
+        points = np.asarray(points, dtype=np.float32)
+        if points.ndim == 2:
+            points = points[np.newaxis]
+        if points.ndim != 3 or points.shape[-1] != 3:
+            raise ValueError(f"Expected landmarks of shape (F, N, 3), got {points.shape}")
+
+        self.points = points
+        self.image_size = image_size
+        self.scores = None if scores is None else np.asarray(scores, dtype=np.float32).reshape(len(points))
+
+    @classmethod
+    def empty(cls, num_points : int = 0, image_size : tuple[int, int] | None = None) -> "Landmarks":
+        return cls(np.empty((0, num_points, 3), dtype=np.float32), image_size)
+
+    @classmethod
+    def from_mediapipe(cls, landmark_lists : list, image_size : tuple[int, int] | None = None) -> "Landmarks":
+        """
+        Copy the landmark lists of a Mediapipe solution result (e.g. `multi_face_landmarks`) into one array.
+
+        The protobuf messages can only be read point by point, reading the coordinates is most of the
+        cost, so the points are simply gathered into a list of tuples and converted once.
+
+        Parameters
+        ----------
+        landmark_lists : list
+            The `NormalizedLandmarkList` of every object, all with the same number of points.
+        """
+        if not landmark_lists:
+            return cls.empty(image_size=image_size)
+
+        points = [[(lm.x, lm.y, lm.z) for lm in landmark_list.landmark] for landmark_list in landmark_lists]
+        return cls(np.array(points, dtype=np.float32), image_size)
+
+    @property
+    def num_points(self) -> int:
+        return self.points.shape[1]
+
+    def bounding_boxes(self) -> np.ndarray:
+        """
+        The normalized (x_min, y_min, x_max, y_max) box around the landmarks of every object.
+
+        Return
+        ----------
+        np.ndarray
+            A float32 array of shape (F, 4).
+        """
+        xy = self.points[:, :, :2]
+        if xy.size == 0:
+            return np.empty((len(self.points), 4), dtype=np.float32)
+        return np.concatenate([xy.min(axis=1), xy.max(axis=1)], axis=1)
+
+    def __len__(self) -> int:
+        return len(self.points)
+
+    def __bool__(self) -> bool:
+        return len(self.points) > 0
+
+    def __getitem__(self, index) -> np.ndarray:
+        return self.points[index]
+
+    def __iter__(self) -> Iterator[np.ndarray]:
+        return iter(self.points)
+
+    def __array__(self, dtype=None, copy=None) -> np.ndarray:
+        if dtype is None or dtype == self.points.dtype:
+            return self.points.copy() if copy else self.points
+        return self.points.astype(dtype)
+
+    def __repr__(self) -> str:
+        return f"Landmarks(objects={len(self)}, points={self.num_points}, image_size={self.image_size})"
@@ -0,0 +1,164 @@
+import time
+import unittest
+
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from gpiozero.pins.mock import MockFactory
+
+from src.domain.dto.beep_pattern import BeepPattern, BeepStep
+from src.enum.alert_job_status import AlertJobStatus
+from src.enum.alert_priority import AlertPriority
+from src.hardware.buzzer.rpi_buzzer import RaspberryBuzzer
+from src.routers.buzzer_router import buzzer_router
+from src.tasks.alert_scheduler import AlertScheduler
+
+
+class AlertSchedulerTest(unittest.TestCase):
+    def setUp(self):
+        """
+        Setup a buzzer on gpiozero's mock pins and a running alert scheduler driving it.
+        """
+        self.pin_factory = MockFactory()
+        self.buzzer = RaspberryBuzzer(pin=23, pin_factory=self.pin_factory)
+        self.pin = self.pin_factory.pin(23)
+        self.alert_scheduler = AlertScheduler(self.buzzer, max_queued_jobs=2)
+        self.alert_scheduler.start()
+
+    def tearDown(self):
+        self.alert_scheduler.stop()
+        self.buzzer.buzzer.close()
+        self.pin_factory.reset()
+
+    def wait_for_state(self, state : bool, timeout : float = 1.0) -> bool:
+        deadline = time.monotonic() + timeout
+        while time.monotonic() < deadline:
+            if self.pin.state == state:
+                return True
+            time.sleep(0.001)
+        return False
+
+    def test_plays_the_pattern_steps(self):
+        """
+        Test if a pattern turns the buzzer on and off for its steps and stops after its repetitions.
+        """
+        self.pin.clear_states()
+        self.alert_scheduler.play(BeepPattern("test", (BeepStep(30, 20),), times=3))
+
+        time.sleep(0.3)
+        self.assertFalse(self.alert_scheduler.is_playing)
+        self.pin.assert_states([False, True, False, True, False, True, False])
+
+    def test_preempts_the_current_beep(self):
+        """
+        Test if another drowsiness stage takes effect right away instead of waiting for the current beep to end.
+        """
+        self.alert_scheduler.play(BeepPattern("slow", (BeepStep(1000, 1000),)))
+        self.assertTrue(self.wait_for_state(True))
+
+        started_at = time.monotonic()
+        self.alert_scheduler.play(BeepPattern("fast", (BeepStep(20, 200),)))
+        # The new pattern turns the buzzer off after its 20ms beep, long before the 1s beep would end
+        self.assertTrue(self.wait_for_state(False, timeout=0.5))
+        self.assertLess(time.monotonic() - started_at, 0.2)
+
+    def test_silence_turns_the_buzzer_off_and_idles(self):
+        """
+        Test if silencing turns the buzzer off right away and leaves no timer pending.
+        """
+        self.alert_scheduler.play(BeepPattern("endless", (BeepStep(1000, 100),)))
+        self.assertTrue(self.wait_for_state(True))
+
+        self.alert_scheduler.silence()
+        self.assertFalse(self.pin.state)
+        self.assertFalse(self.alert_scheduler.is_playing)
+        self.assertEqual(self.alert_scheduler.timers, [])
+
+        # Nothing plays while idle
+        time.sleep(0.1)
+        self.assertFalse(self.pin.state)
+
+    def test_manual_beep_waits_for_the_drowsiness_alarm(self):
+        """
+        Test if a manual beep is queued while the drowsiness alarm plays and plays once it's silenced.
+        """
+        alarm = self.alert_scheduler.play(BeepPattern("alarm", (BeepStep(1000, 100),)), AlertPriority.DROWSINESS)
+        manual = self.alert_scheduler.play(BeepPattern("manual", (BeepStep(20, 20),), times=2), AlertPriority.MANUAL)
+        self.assertEqual(manual.status, AlertJobStatus.QUEUED)
+
+        # Silencing the manual priority leaves the alarm playing
+        self.alert_scheduler.silence(AlertPriority.MANUAL)
+        self.assertEqual(alarm.status, AlertJobStatus.PLAYING)
+
+        self.alert_scheduler.silence(AlertPriority.DROWSINESS)
+        self.assertEqual(alarm.status, AlertJobStatus.CANCELLED)
+        self.assertEqual(manual.status, AlertJobStatus.PLAYING)
+
+        time.sleep(0.2)
+        self.assertEqual(manual.status, AlertJobStatus.COMPLETED)
+        self.assertFalse(self.alert_scheduler.is_playing)
+
+    def test_drowsiness_alarm_preempts_manual_beep(self):
+        """
+        Test if the drowsiness alarm cuts a manual beep right away.
+        """
+        manual = self.alert_scheduler.play(BeepPattern("manual", (BeepStep(1000, 1000),), times=20), AlertPriority.MANUAL)
+        alarm = self.alert_scheduler.play(BeepPattern("alarm", (BeepStep(1000, 100),)), AlertPriority.DROWSINESS)
+
+        self.assertEqual(manual.status, AlertJobStatus.PREEMPTED)
+        self.assertEqual(alarm.status, AlertJobStatus.PLAYING)
+        self.assertIs(self.alert_scheduler.get_job(manual.id), manual)
+
+    def test_cancel_jobs(self):
+        """
+        Test if a queued job is removed from the queue and a playing job stops when cancelled.
+        """
+        playing = self.alert_scheduler.play(BeepPattern("first", (BeepStep(1000, 100),), times=5), AlertPriority.MANUAL)
+        queued = self.alert_scheduler.play(BeepPattern("second", (BeepStep(1000, 100),), times=5), AlertPriority.MANUAL)
+        self.assertEqual(queued.status, AlertJobStatus.QUEUED)
+        self.assertTrue(self.wait_for_state(True))
+
+        self.alert_scheduler.cancel(queued.id)
+        self.assertEqual(queued.status, AlertJobStatus.CANCELLED)
+        self.assertEqual(playing.status, AlertJobStatus.PLAYING)
+
+        self.alert_scheduler.cancel(playing.id)
+        self.assertEqual(playing.status, AlertJobStatus.CANCELLED)
+        self.assertFalse(self.pin.state)
+        self.assertFalse(self.alert_scheduler.is_playing)
+        self.assertIsNone(self.alert_scheduler.cancel("unknown"))
+
+    def test_full_queue_rejects_jobs(self):
+        """
+        Test if a job that would wait in a full queue is rejected and not tracked, while a preempting job still plays.
+        """
+        playing = self.alert_scheduler.play(BeepPattern("first", (BeepStep(1000, 100),), times=5), AlertPriority.MANUAL)
+        for index in range(2):
+            queued = self.alert_scheduler.play(BeepPattern(f"queued{index}", (BeepStep(1000, 100),)), AlertPriority.MANUAL)
+            self.assertEqual(queued.status, AlertJobStatus.QUEUED)
+
+        jobs_count = len(self.alert_scheduler.jobs)
+        self.assertIsNone(self.alert_scheduler.play(BeepPattern("rejected", (BeepStep(1000, 100),)), AlertPriority.MANUAL))
+        self.assertEqual(len(self.alert_scheduler.queued_jobs), 2)
+        self.assertEqual(len(self.alert_scheduler.jobs), jobs_count)
+
+        alarm = self.alert_scheduler.play(BeepPattern("alarm", (BeepStep(1000, 100),)), AlertPriority.DROWSINESS)
+        self.assertEqual(alarm.status, AlertJobStatus.PLAYING)
+        self.assertEqual(playing.status, AlertJobStatus.PREEMPTED)
+
+    def test_router_rejects_beeps_when_the_queue_is_full(self):
+        """
+        Test if the beep endpoint answers 429 once the queue is full.
+        """
+        app = FastAPI()
+        app.include_router(buzzer_router(self.alert_scheduler), prefix="/buzzer")
+        client = TestClient(app)
+
+        status_codes = [
+            client.post("/buzzer/beep", json={"times": 5, "duration": 1000 + index, "pause": 0.1}).status_code
+            for index in range(4)
+        ]
+        self.assertEqual(status_codes, [200, 200, 200, 429])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,124 @@
+import datetime
+import unittest
+
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from sqlalchemy.pool import StaticPool
+from sqlmodel import Session, SQLModel, create_engine
+from uuid6 import uuid7
+
+from src.domain.entity.drowsiness_event import DrowsinessEvent
+from src.routers import drowsiness_event_router
+from src.services.dependencies import get_drowsiness_event_service
+from src.services.drowsiness_event_service import DrowsinessEventService
+
+
+class DrowsinessEventPaginationTest(unittest.TestCase):
+    def setUp(self):
+        """
+        Store 7 events in an in-memory database: 4 DROWSINESS and 3 YAWNING across two vehicles.
+        """
+        self.engine = create_engine("sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool)
+        SQLModel.metadata.create_all(self.engine)
+        self.session = Session(self.engine)
+
+        start = datetime.datetime(2026, 1, 1, 8, 0, 0)
+        self.events = []
+        for index in range(7):
+            self.events.append(DrowsinessEvent(
+                id=uuid7(),
+                vehicle_identification="B1234XYZ" if index % 2 == 0 else "B5678XYZ",
+                timestamp=start + datetime.timedelta(minutes=index),
+                image=f"{index}.jpg",
+                ear=0.2,
+                mar=0.5,
+                event_type="DROWSINESS" if index < 4 else "YAWNING",
+            ))
+        self.session.add_all(self.events)
+        self.session.commit()
+
+        app = FastAPI()
+        app.include_router(drowsiness_event_router.router, prefix="/drowsinessevent")
+        app.dependency_overrides[get_drowsiness_event_service] = lambda: DrowsinessEventService(self.session)
+        self.app = app
+        self.client = TestClient(app)
+
+    def tearDown(self):
+        self.session.close()
+        self.engine.dispose()
+
+    def get_all_pages(self, **params) -> list[dict]:
+        pages = []
+        cursor = None
+        while True:
+            query = dict(params, **({"cursor": cursor} if cursor else {}))
+            response = self.client.get("/drowsinessevent/", params=query)
+            self.assertEqual(response.status_code, 200, response.text)
+            pages.append(response.json())
+            cursor = pages[-1]["next_cursor"]
+            if cursor is None:
+                return pages
+
+    def expected_ids(self, events : list[DrowsinessEvent]) -> list[str]:
+        return [str(event.id) for event in sorted(events, key=lambda event: event.id, reverse=True)]
+
+    def test_pages_cover_every_event_once(self):
+        """
+        Test that the pages are most recent first, don't overlap at their boundaries and that the
+        last page has no cursor.
+        """
+        pages = self.get_all_pages(limit=3)
+        self.assertEqual([len(page["items"]) for page in pages], [3, 3, 1])
+        self.assertEqual(pages[0]["next_cursor"], pages[0]["items"][-1]["id"])
+        self.assertIsNone(pages[-1]["next_cursor"])
+
+        ids = [item["id"] for page in pages for item in page["items"]]
+        self.assertEqual(ids, self.expected_ids(self.events))
+
+    def test_exact_last_page_has_no_cursor(self):
+        """
+        Test that a page ending exactly on the last event doesn't give a cursor to an empty page.
+        """
+        pages = self.get_all_pages(limit=7)
+        self.assertEqual(len(pages), 1)
+        self.assertEqual(len(pages[0]["items"]), 7)
+        self.assertIsNone(pages[0]["next_cursor"])
+
+    def test_filters_with_cursor(self):
+        """
+        Test that the filters still apply on the pages after the first one.
+        """
+        pages = self.get_all_pages(limit=1, event_type="DROWSINESS", vehicle_identification="B1234XYZ")
+        ids = [item["id"] for page in pages for item in page["items"]]
+        expected_events = [
+            event for event in self.events
+            if event.event_type == "DROWSINESS" and event.vehicle_identification == "B1234XYZ"
+        ]
+        self.assertEqual(ids, self.expected_ids(expected_events))
+        self.assertEqual(len(ids), 2)
+
+        pages = self.get_all_pages(limit=2, start_time="2026-01-01T08:02:00", end_time="2026-01-01T08:06:00")
+        ids = [item["id"] for page in pages for item in page["items"]]
+        self.assertEqual(ids, self.expected_ids(self.events[2:6]))
+
+    def test_invalid_cursor(self):
+        response = self.client.get("/drowsinessevent/", params={"cursor": "not-an-id"})
+        self.assertEqual(response.status_code, 400)
+        self.assertIn("Invalid cursor", response.json()["detail"])
+
+    def test_other_errors_are_not_reported_as_invalid_cursor(self):
+        """
+        Test that a ValueError raised by the service is an internal error, not a bad cursor.
+        """
+        class FailingService:
+            def get_events_page(self, *args):
+                raise ValueError("database error")
+
+        self.app.dependency_overrides[get_drowsiness_event_service] = lambda: FailingService()
+        response = self.client.get("/drowsinessevent/", params={"cursor": self.expected_ids(self.events)[0]})
+        self.assertEqual(response.status_code, 500)
+        self.assertNotIn("Invalid cursor", response.json()["detail"])
+
+
+if __name__ == '__main__':
+    unittest.main()
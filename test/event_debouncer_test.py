@@ -0,0 +1,55 @@
+import unittest
+
+from src.lib.event_debouncer import EventDebouncer
+from src.settings.app_config import EventDebounceRule
+
+
+class EventDebouncerTest(unittest.TestCase):
+    def setUp(self):
+        self.event_debouncer = EventDebouncer({
+            "DROWSINESS": EventDebounceRule(min_gap_seconds=30, rearm_seconds=3, max_events_per_episode=2),
+            "YAWNING": EventDebounceRule(min_gap_seconds=30, rearm_seconds=3, max_events_per_episode=1),
+        })
+
+    def emitted_at(self, event_type : str, frames : list[tuple[float, bool]]) -> list[float]:
+        return [now for now, active in frames if self.event_debouncer.update(event_type, active, now=now)]
+
+    def test_flickering_episode(self):
+        """
+        Test if a flickering 60 s drowsy episode at 10 fps emits an event at its start and one after
+        the minimum gap, instead of one on every flicker.
+        """
+        # Active for 0.8 s then inactive for 0.2 s, shorter than the re-arm time
+        frames = [(index / 10, index % 10 < 8) for index in range(600)]
+        self.assertEqual(self.emitted_at("DROWSINESS", frames), [0.0, 30.0])
+        self.assertEqual(self.event_debouncer.get_stats()["DROWSINESS"]["episodes"], 1)
+
+    def test_max_events_per_episode(self):
+        """
+        Test if an episode stops emitting once it reached `max_events_per_episode`, however long it lasts.
+        """
+        frames = [(float(second), True) for second in range(0, 120)]
+        self.assertEqual(self.emitted_at("YAWNING", frames), [0.0])
+        self.assertEqual(self.emitted_at("DROWSINESS", frames), [0.0, 30.0])
+
+    def test_rearm_and_min_gap(self):
+        """
+        Test if the state has to stay inactive for `rearm_seconds` to end the episode, and if the next
+        episode is only emitted once `min_gap_seconds` passed since the last event.
+        """
+        self.assertTrue(self.event_debouncer.update("YAWNING", True, now=0.0))
+        self.assertFalse(self.event_debouncer.update("YAWNING", False, now=1.0))
+        self.assertFalse(self.event_debouncer.update("YAWNING", True, now=2.9))
+        self.assertFalse(self.event_debouncer.update("YAWNING", False, now=5.8))
+        self.assertTrue(self.event_debouncer.get_stats()["YAWNING"]["active"])
+
+        self.assertFalse(self.event_debouncer.update("YAWNING", False, now=6.0))
+        self.assertFalse(self.event_debouncer.get_stats()["YAWNING"]["active"])
+
+        frames = [(10 + index / 10, True) for index in range(250)]
+        self.assertEqual(self.emitted_at("YAWNING", frames), [30.0])
+        self.assertEqual(self.event_debouncer.get_stats()["YAWNING"]["episodes"], 2)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,122 @@
+import datetime
+import os
+import tempfile
+import time
+import unittest
+
+import numpy as np
+from sqlalchemy.pool import StaticPool
+from sqlmodel import Session, SQLModel, create_engine, select
+from uuid6 import uuid7
+
+from src.domain.entity.drowsiness_event import DrowsinessEvent
+from src.lib.event_outbox import EventOutbox
+from src.lib.socket_trigger import SocketTrigger, unpack_binary_frame
+from src.services.drowsiness_event_writer import DrowsinessEventWriter
+from src.services.pending_upload_service import PendingUploadService
+from src.settings.app_config import ApiSettings
+from src.utils.event_image_path import get_event_image_name
+from test.websocket_connection_test import WebSocketServerStandIn
+
+
+class EventOutboxTest(unittest.TestCase):
+    def setUp(self):
+        """
+        Setup an outbox of 2 events saving the images in a temporary directory, and writing the
+        event records and the pending uploads in an in-memory database.
+        """
+        self.static_dir = tempfile.TemporaryDirectory()
+        self.engine = create_engine("sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool)
+        SQLModel.metadata.create_all(self.engine)
+        self.pending_upload_service = PendingUploadService(self.engine)
+        self.drowsiness_event_writer = DrowsinessEventWriter(self.engine)
+        self.drowsiness_event_writer.start()
+        self.server = WebSocketServerStandIn()
+
+        self.socket_trigger = SocketTrigger(ApiSettings(
+            vehicle_id="B1234XYZ",
+            server=f"127.0.0.1:{self.server.port}",
+            device="test",
+            static_dir=self.static_dir.name,
+            image_event_dir="events",
+            send_to_server=True,
+            ws_ack_timeout=2.0,
+            upload_protocol="binary",
+        ), self.pending_upload_service)
+        self.event_outbox = EventOutbox(self.socket_trigger, max_size=2, drowsiness_event_writer=self.drowsiness_event_writer)
+        self.image = np.zeros((8, 8, 3), dtype=np.uint8)
+
+    def tearDown(self):
+        self.event_outbox.stop()
+        self.drowsiness_event_writer.stop()
+        self.socket_trigger.close()
+        self.server.shutdown()
+        self.engine.dispose()
+        self.static_dir.cleanup()
+
+    def publish_events(self, count : int) -> list:
+        image_uuids = [uuid7() for _ in range(count)]
+        for image_uuid in image_uuids:
+            record = DrowsinessEvent(
+                id=image_uuid,
+                vehicle_identification="B1234XYZ",
+                timestamp=datetime.datetime.now(),
+                image=f"{self.static_dir.name}/events/{get_event_image_name(image_uuid)}",
+                ear=0.2,
+                mar=0.5,
+                event_type="DROWSINESS",
+            )
+            self.event_outbox.publish(self.image, image_uuid, "DROWSINESS", '', 'UPLOAD_IMAGE', record=record)
+        return image_uuids
+
+    def assert_every_event_is_kept(self, image_uuids : list):
+        """
+        Check that every event has a record pointing to its saved image, and is either delivered or pending.
+        """
+        self.drowsiness_event_writer.stop()
+        with Session(self.engine) as session:
+            records = session.exec(select(DrowsinessEvent)).all()
+        self.assertEqual({record.id for record in records}, set(image_uuids))
+        for record in records:
+            self.assertTrue(os.path.isfile(record.image), record.image)
+
+        delivered_ids = {unpack_binary_frame(message)[0]["data"]["image_id"] for message in self.server.received}
+        pending_ids = {str(upload.id) for upload in self.pending_upload_service.get_pending_batch(100)}
+        self.assertEqual(delivered_ids | pending_ids, {str(image_uuid) for image_uuid in image_uuids})
+        self.assertEqual(delivered_ids & pending_ids, set())
+
+    def test_overflow_and_stop_spill_to_pending_uploads(self):
+        """
+        Test that the queued events are saved by the worker and not the caller, and that the events
+        overflowing the queue or still queued at stop are saved with their uploads recorded as pending.
+        """
+        image_uuids = self.publish_events(5)
+        self.assertEqual(self.event_outbox.get_metrics()["spilled_events"], 3)
+        saved_images = [name for _, _, names in os.walk(self.static_dir.name) for name in names]
+        self.assertEqual(len(saved_images), 3)
+
+        self.event_outbox.stop()
+        self.assertEqual(self.event_outbox.get_metrics()["spilled_events"], 5)
+        self.assert_every_event_is_kept(image_uuids)
+
+    def test_burst_is_delivered_or_pending(self):
+        """
+        Test that a burst of events larger than the queue is either delivered by the worker or pending.
+        """
+        self.socket_trigger.start()
+        self.event_outbox.start()
+        image_uuids = self.publish_events(10)
+
+        deadline = time.monotonic() + 5
+        while self.event_outbox.get_metrics()["depth"] and time.monotonic() < deadline:
+            time.sleep(0.01)
+        self.event_outbox.stop(timeout=5)
+
+        metrics = self.event_outbox.get_metrics()
+        self.assertEqual(metrics["failed_events"], 0)
+        self.assertEqual(len(self.server.received), 10 - metrics["spilled_events"])
+        self.assert_every_event_is_kept(image_uuids)
+
+
+if __name__ == '__main__':
+    unittest.main()
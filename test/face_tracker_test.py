@@ -0,0 +1,125 @@
+import json
+import os
+import tempfile
+import unittest
+
+import numpy as np
+
+from src.domain.dto.face_track import FaceTrack
+from src.lib.drowsiness_detection import DrowsinessDetection
+from src.lib.face_tracker import FaceTracker, box_iou
+
+
+class FaceTrackerTest(unittest.TestCase):
+    def setUp(self):
+        self.face_tracker = FaceTracker(iou_threshold=0.3, max_centroid_distance=0.1, max_missed_frames=2)
+        self.driver = np.array([0.1, 0.2, 0.4, 0.6])
+        self.passenger = np.array([0.6, 0.2, 0.85, 0.55])
+
+    def test_box_iou(self):
+        """
+        Test the IoU of identical, disjoint and half overlapping boxes.
+        """
+        boxes = np.array([[0, 0, 2, 2]], dtype=np.float64)
+        other_boxes = np.array([[0, 0, 2, 2], [3, 3, 4, 4], [1, 0, 3, 2]], dtype=np.float64)
+        np.testing.assert_allclose(box_iou(boxes, other_boxes), [[1.0, 0.0, 1 / 3]])
+
+    def test_ids_are_stable_when_the_order_changes(self):
+        """
+        Test that every face keeps its id when the model returns the faces in another order.
+        """
+        driver_track, passenger_track = self.face_tracker.update(np.stack([self.driver, self.passenger]))
+        self.assertEqual((driver_track.track_id, passenger_track.track_id), (1, 2))
+
+        tracks = self.face_tracker.update(np.stack([self.passenger + 0.01, self.driver - 0.01]))
+        self.assertEqual([track.track_id for track in tracks], [2, 1])
+        self.assertIs(tracks[1], driver_track)
+
+    def test_counters_are_per_face(self):
+        """
+        Test that the counters of a face are not changed by another face.
+        """
+        driver_track, passenger_track = self.face_tracker.update(np.stack([self.driver, self.passenger]))
+        driver_track.drowsiness_frame_counter = 10
+
+        tracks = self.face_tracker.update(np.stack([self.passenger, self.driver]))
+        self.assertEqual(tracks[1].drowsiness_frame_counter, 10)
+        self.assertEqual(tracks[0].drowsiness_frame_counter, 0)
+
+    def test_match_by_centroid_without_overlap(self):
+        """
+        Test that a face moving too fast to overlap its previous box is matched by its centroid.
+        """
+        small_face = np.array([0.10, 0.10, 0.14, 0.14])
+        (track,) = self.face_tracker.update(small_face[None])
+        (moved_track,) = self.face_tracker.update((small_face + 0.05)[None])
+        self.assertIs(moved_track, track)
+        self.assertEqual(track.hits, 2)
+
+    def test_lost_track_is_kept_then_dropped(self):
+        """
+        Test that a face lost for a few frames keeps its track, and gets a new one once it's dropped.
+        """
+        (track,) = self.face_tracker.update(self.driver[None])
+        self.face_tracker.update(np.empty((0, 4)))
+        self.face_tracker.update(np.empty((0, 4)))
+        (same_track,) = self.face_tracker.update(self.driver[None])
+        self.assertIs(same_track, track)
+        self.assertEqual(same_track.missed_frames, 0)
+
+        for _ in range(3):
+            self.face_tracker.update(np.empty((0, 4)))
+        self.assertEqual(self.face_tracker.tracks, [])
+        (new_track,) = self.face_tracker.update(self.driver[None])
+        self.assertEqual(new_track.track_id, 2)
+
+
+class FaceTrackCountersTest(unittest.TestCase):
+    def setUp(self):
+        """
+        Load a configuration without the tracker settings, like the ones written before the tracker,
+        the model isn't needed so the detector is created without loading it.
+        """
+        with open("config/drowsiness_detection_settings.json") as f:
+            config = json.load(f)
+        for key in ("face_tracker_iou_threshold", "face_tracker_max_centroid_distance", "face_tracker_max_missed_frames"):
+            config.pop(key)
+        config["mouth_aspect_ration_threshold"] = 1.5
+        config["mouth_aspect_ration_consec_frames"] = 4
+
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "drowsiness_detection_settings.json")
+            with open(path, "w") as f:
+                json.dump(config, f)
+            self.drowsiness_detector = DrowsinessDetection.__new__(DrowsinessDetection)
+            self.drowsiness_detector.load_configuration(path)
+
+    def test_older_configuration_uses_the_tracker_defaults(self):
+        """
+        Test that a configuration without the tracker settings loads with the defaults of the tracker.
+        """
+        self.assertEqual(self.drowsiness_detector.face_tracker_iou_threshold, 0.3)
+        self.assertEqual(self.drowsiness_detector.face_tracker_max_centroid_distance, 0.1)
+        self.assertEqual(self.drowsiness_detector.face_tracker_max_missed_frames, 15)
+
+    def test_yawning_needs_the_consecutive_frames(self):
+        """
+        Test that yawning is only detected after `mouth_aspect_ration_consec_frames` frames above the threshold,
+        and that a closed mouth resets the count of the face only.
+        """
+        track = FaceTrack(1, np.zeros(4))
+        other_track = FaceTrack(2, np.zeros(4))
+
+        results = [self.drowsiness_detector.check_yawning(2.0, track) for _ in range(4)]
+        self.assertEqual(results, [False, False, False, True])
+
+        self.assertFalse(self.drowsiness_detector.check_yawning(0.5, other_track))
+        self.assertTrue(self.drowsiness_detector.check_yawning(2.0, track))
+
+        self.assertFalse(self.drowsiness_detector.check_yawning(0.5, track))
+        self.assertEqual(track.yawn_frame_counter, 0)
+        self.assertFalse(self.drowsiness_detector.check_yawning(2.0, track))
+
+
+if __name__ == '__main__':
+    unittest.main()
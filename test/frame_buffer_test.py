@@ -0,0 +1,38 @@
+import asyncio
+import threading
+import unittest
+
+from src.utils.frame_buffer import FrameSlot
+
+
+class FrameSlotTest(unittest.TestCase):
+    def setUp(self):
+        self.frame_slot = FrameSlot("test")
+
+    def test_wait_for_newer(self):
+        """
+        Test if a consumer times out without a newer value, wakes up on the next update and never gets a cleared value.
+        """
+        sequence = self.frame_slot.update("first")
+        self.assertIsNone(self.frame_slot.wait_for_newer(sequence, timeout=0.05))
+
+        threading.Timer(0.05, self.frame_slot.update, args=("second",)).start()
+        self.assertEqual(self.frame_slot.wait_for_newer(sequence, timeout=2), (2, "second"))
+
+        self.frame_slot.clear()
+        self.assertIsNone(self.frame_slot.wait_for_newer(0, timeout=0.05))
+
+    def test_wait_for_newer_async(self):
+        """
+        Test if an asyncio consumer is woken up by an update from another thread.
+        """
+        async def wait():
+            threading.Timer(0.05, self.frame_slot.update, args=("frame",)).start()
+            return await self.frame_slot.wait_for_newer_async(0, timeout=2)
+
+        self.assertEqual(asyncio.run(wait()), (1, "frame"))
+        self.assertEqual(self.frame_slot.async_waiters, set())
+
+
+if __name__ == '__main__':
+    unittest.main()
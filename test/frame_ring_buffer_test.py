@@ -0,0 +1,38 @@
+import threading
+import unittest
+
+import numpy as np
+
+from src.utils.frame_ring_buffer import FrameRingBuffer
+
+
+class FrameRingBufferTest(unittest.TestCase):
+    def setUp(self):
+        self.frame_ring_buffer = FrameRingBuffer(capacity=2)
+        self.frame = np.zeros((4, 4, 3), dtype=np.uint8)
+
+    def test_overflow_keeps_the_newest_frames(self):
+        """
+        Test if the frames beyond the capacity overwrite the oldest ones and only the newest frame is returned.
+        """
+        for _ in range(5):
+            self.frame_ring_buffer.put(self.frame)
+
+        self.assertEqual(self.frame_ring_buffer.get_latest(timeout=0).sequence, 5)
+        stats = self.frame_ring_buffer.get_stats()
+        self.assertEqual((stats["overwritten_frames"], stats["skipped_frames"]), (3, 1))
+        self.assertEqual(self.frame_ring_buffer.dropped_frames, 4)
+
+    def test_get_latest_waits_for_a_newer_frame(self):
+        """
+        Test if a consumer times out without a newer frame and wakes up as soon as the capture thread puts one.
+        """
+        captured_frame = self.frame_ring_buffer.put(self.frame)
+        self.assertIsNone(self.frame_ring_buffer.get_latest(captured_frame.sequence, timeout=0.05))
+
+        threading.Timer(0.05, self.frame_ring_buffer.put, args=(self.frame,)).start()
+        self.assertEqual(self.frame_ring_buffer.get_latest(captured_frame.sequence, timeout=2).sequence, 2)
+
+
+if __name__ == '__main__':
+    unittest.main()
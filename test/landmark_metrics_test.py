@@ -0,0 +1,78 @@
+import unittest
+
+import numpy as np
+
+from src.lib.drowsiness_detection import DrowsinessDetection
+from src.lib.landmark_metrics import compute_face_metrics
+from src.utils.landmark_constants import (
+    HEAD_POSE_POINTS,
+    LEFT_EYE_POINTS,
+    OUTER_LIPS_POINTS,
+    RIGHT_EYE_POINTS,
+)
+
+
+class LandmarkMetricsTest(unittest.TestCase):
+    def setUp(self):
+        """
+        The scalar functions don't use the model, so the detector is created without loading it.
+        """
+        self.drowsiness_detector = DrowsinessDetection.__new__(DrowsinessDetection)
+        self.frame = np.zeros((480, 640, 3), dtype=np.uint8)
+
+        # Slightly outside of the frame too, where int() truncates toward zero
+        rng = np.random.default_rng(7)
+        self.landmarks = rng.uniform(-0.05, 1.05, size=(4, 478, 3))
+
+    def assert_matches_scalar(self, landmarks : np.ndarray):
+        height, width = self.frame.shape[:2]
+        metrics = compute_face_metrics(landmarks, width, height)
+        self.assertEqual(len(metrics), len(landmarks))
+
+        for index, face_landmark in enumerate(landmarks.tolist()):
+            left_eye, right_eye = self.drowsiness_detector.extract_eye_landmark(face_landmark, LEFT_EYE_POINTS, RIGHT_EYE_POINTS, width, height)
+            mouth = self.drowsiness_detector.extract_mouth_landmark(face_landmark, OUTER_LIPS_POINTS, width, height)
+            self.assertEqual(metrics.left_eye[index].tolist(), [list(point) for point in left_eye])
+            self.assertEqual(metrics.right_eye[index].tolist(), [list(point) for point in right_eye])
+            self.assertEqual(metrics.mouth[index].tolist(), [list(point) for point in mouth])
+
+            ear = (self.drowsiness_detector.calculate_ear(left_eye) + self.drowsiness_detector.calculate_ear(right_eye)) / 2.0
+            self.assertEqual(float(metrics.ear[index]), ear)
+            self.assertEqual(float(metrics.mar[index]), self.drowsiness_detector.calculate_mar(mouth))
+
+            angles = self.drowsiness_detector.estimate_head_pose(self.frame, face_landmark, HEAD_POSE_POINTS)
+            vectorized_angles = self.drowsiness_detector.solve_head_pose(metrics.pose_2d[index], metrics.pose_3d[index], width, height)
+            self.assertEqual(vectorized_angles, angles)
+
+    def test_matches_scalar_functions(self):
+        """
+        Test that the vectorized metrics are exactly the ones computed face by face.
+        """
+        self.assert_matches_scalar(self.landmarks)
+
+    def test_matches_scalar_functions_on_float32_landmarks(self):
+        """
+        Test that float32 landmarks give the same pixel positions as the float values they hold.
+        """
+        self.assert_matches_scalar(self.landmarks.astype(np.float32))
+
+    def test_no_face(self):
+        """
+        Test that no face gives empty metrics instead of failing.
+        """
+        metrics = compute_face_metrics(np.empty((0, 478, 3)), 640, 480)
+        self.assertEqual(len(metrics), 0)
+        self.assertEqual(metrics.pose_3d.shape, (0, len(HEAD_POSE_POINTS), 3))
+
+    def test_degenerate_eye(self):
+        """
+        Test that an eye with no width gives inf instead of raising like the scalar function.
+        """
+        landmarks = self.landmarks[:1].copy()
+        landmarks[0, LEFT_EYE_POINTS[3], :2] = landmarks[0, LEFT_EYE_POINTS[0], :2]
+        metrics = compute_face_metrics(landmarks, 640, 480)
+        self.assertTrue(np.isinf(metrics.left_ear[0]) or np.isnan(metrics.left_ear[0]))
+
+
+if __name__ == '__main__':
+    unittest.main()
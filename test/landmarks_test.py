@@ -0,0 +1,71 @@
+import unittest
+from types import SimpleNamespace
+
+import numpy as np
+
+from src.utils.drawing_utils import draw_face_bounding_box, draw_landmarks
+from src.utils.landmark_constants import LEFT_EYE_CONNECTIONS
+from src.utils.landmarks import Landmarks
+
+
+def landmark_list(points : np.ndarray) -> SimpleNamespace:
+    """
+    A stand-in of a Mediapipe `NormalizedLandmarkList`.
+    """
+    return SimpleNamespace(landmark=[SimpleNamespace(x=x, y=y, z=z) for x, y, z in points.tolist()])
+
+
+class LandmarksTest(unittest.TestCase):
+    def setUp(self):
+        rng = np.random.default_rng(3)
+        self.points = rng.uniform(0.1, 0.9, size=(2, 478, 3)).astype(np.float32)
+
+    def test_behaves_like_a_list_of_objects(self):
+        """
+        Test that the landmarks can be used like the list of faces they replace.
+        """
+        landmarks = Landmarks(self.points, (640, 480))
+        self.assertTrue(landmarks)
+        self.assertEqual(len(landmarks), 2)
+        self.assertEqual(landmarks.num_points, 478)
+        self.assertEqual(landmarks[1].shape, (478, 3))
+        self.assertTrue(np.shares_memory(landmarks[1], landmarks.points))
+        self.assertEqual([face.shape for face in landmarks], [(478, 3), (478, 3)])
+        self.assertIs(np.asarray(landmarks), landmarks.points)
+
+        self.assertFalse(Landmarks.empty())
+        self.assertEqual(len(Landmarks(self.points[0])), 1)
+        with self.assertRaises(ValueError):
+            Landmarks(np.zeros((2, 478)))
+
+    def test_from_mediapipe(self):
+        """
+        Test that the Mediapipe landmark lists are copied into one float32 array.
+        """
+        landmarks = Landmarks.from_mediapipe([landmark_list(face) for face in self.points], (640, 480))
+        self.assertEqual(landmarks.points.dtype, np.float32)
+        np.testing.assert_array_equal(landmarks.points, self.points)
+        self.assertEqual(landmarks.image_size, (640, 480))
+
+        self.assertFalse(Landmarks.from_mediapipe(None))
+
+    def test_drawing_matches_tuple_landmarks(self):
+        """
+        Test that drawing from the array gives the same image as drawing from the list of tuples.
+        """
+        face = Landmarks(self.points)[0]
+        face_tuples = [tuple(point) for point in face.tolist()]
+
+        image_from_array = np.zeros((480, 640, 3), dtype=np.uint8)
+        image_from_tuples = np.zeros((480, 640, 3), dtype=np.uint8)
+        box = draw_face_bounding_box(image_from_array, face, 1)
+        self.assertEqual(box, draw_face_bounding_box(image_from_tuples, face_tuples, 1))
+        self.assertTrue(all(type(value) is int for value in box))
+
+        draw_landmarks(image_from_array, face, LEFT_EYE_CONNECTIONS)
+        draw_landmarks(image_from_tuples, face_tuples, LEFT_EYE_CONNECTIONS)
+        np.testing.assert_array_equal(image_from_array, image_from_tuples)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,44 @@
+import unittest
+
+from src.domain.dto.drowsiness_detection_result import DrowsinessDetectionResult
+from src.pipeline.model_scheduler import ModelCadenceScheduler
+from src.settings.app_config import ModelCadence
+
+
+class ModelCadenceSchedulerTest(unittest.TestCase):
+    def test_heavy_models_are_staggered(self):
+        """
+        Test if the heavy models with the same divisor run on different frames, and the light one on every frame.
+        """
+        scheduler = ModelCadenceScheduler({
+            "drowsiness": ModelCadence(),
+            "phone": ModelCadence(every_n_frames=2),
+            "hands": ModelCadence(every_n_frames=2),
+        })
+        selections = [scheduler.select(now=index / 30) for index in range(6)]
+
+        self.assertTrue(all("drowsiness" in selected for selected in selections))
+        self.assertEqual([index for index, selected in enumerate(selections) if "phone" in selected], [0, 2, 4])
+        self.assertEqual([index for index, selected in enumerate(selections) if "hands" in selected], [1, 3, 5])
+
+    def test_target_hz(self):
+        """
+        Test if a model with a target rate runs on the first frame due after each period.
+        """
+        scheduler = ModelCadenceScheduler({"phone": ModelCadence(target_hz=2)})
+        self.assertEqual([index for index in range(20) if scheduler.select(now=index / 8)], [0, 4, 8, 12, 16])
+
+    def test_resolve_reuses_the_last_result_with_its_age(self):
+        """
+        Test if a skipped frame gets the last result of the model with its age.
+        """
+        scheduler = ModelCadenceScheduler({"drowsiness": ModelCadence(every_n_frames=3)})
+        result = DrowsinessDetectionResult()
+        self.assertIs(scheduler.resolve("drowsiness", result, 2, 2.0), result)
+
+        reused_result = scheduler.resolve("drowsiness", None, 4, 2.5)
+        self.assertEqual((reused_result.age_frames, reused_result.age_seconds), (2, 0.5))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,36 @@
+import json
+import unittest
+
+from src.lib.socket_trigger import (
+    BINARY_HEADER_LENGTH,
+    pack_binary_frame,
+    unpack_binary_frame,
+)
+
+
+class BinaryFrameTest(unittest.TestCase):
+    def test_round_trip(self):
+        """
+        Test if the metadata and the payload come back unchanged, whatever bytes the payload starts or ends with.
+        """
+        metadata = {"event": "UPLOAD_IMAGE", "data": {"image_id": "0192", "behavior_type": "DROWSINESS"}}
+        for payload in [b"", b"\xff\xd8\xff\xe0jpeg\xff\xd9", b'{"not": "metadata"}', b"\x00" * 4]:
+            with self.subTest(payload=payload):
+                self.assertEqual(unpack_binary_frame(pack_binary_frame(metadata, payload)), (metadata, payload))
+
+    def test_header_length_counts_bytes(self):
+        """
+        Test if the header length is the length of the encoded JSON in bytes, so non-ASCII metadata
+        doesn't shift the start of the payload.
+        """
+        metadata = {"target": "Pengemudi mengantuk éè ☃"}
+        frame = pack_binary_frame(metadata, b"payload")
+
+        header = json.dumps(metadata).encode("utf-8")
+        (header_length,) = BINARY_HEADER_LENGTH.unpack_from(frame)
+        self.assertEqual(header_length, len(header))
+        self.assertEqual(frame[BINARY_HEADER_LENGTH.size + header_length:], b"payload")
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,35 @@
+import threading
+import unittest
+
+from src.enum.backpressure_policy import BackpressurePolicy
+from src.pipeline.stage_queue import StageQueue
+
+
+class StageQueueTest(unittest.TestCase):
+    def test_drop_oldest_on_overflow(self):
+        """
+        Test if the DROP_OLDEST policy keeps the newest items and counts the dropped ones.
+        """
+        stage_queue = StageQueue("test", maxsize=2, policy=BackpressurePolicy.DROP_OLDEST)
+        for item in range(5):
+            self.assertTrue(stage_queue.put(item))
+
+        self.assertEqual(stage_queue.get_stats()["dropped_items"], 3)
+        self.assertEqual([stage_queue.get(timeout=0), stage_queue.get(timeout=0)], [3, 4])
+
+    def test_block_waits_for_a_free_slot(self):
+        """
+        Test if the BLOCK policy gives up after the timeout on a full queue, and resumes once the consumer takes an item.
+        """
+        stage_queue = StageQueue("test", maxsize=1, policy=BackpressurePolicy.BLOCK)
+        stage_queue.put("first")
+        self.assertFalse(stage_queue.put("second", timeout=0.05))
+
+        threading.Timer(0.05, stage_queue.get).start()
+        self.assertTrue(stage_queue.put("second", timeout=2))
+        self.assertEqual(stage_queue.get(timeout=0), "second")
+        self.assertEqual(stage_queue.get_stats()["dropped_items"], 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,128 @@
+import threading
+import time
+import unittest
+
+from websockets.sync.server import serve
+
+from src.lib.websocket_connection import WebSocketConnection
+
+
+class WebSocketServerStandIn:
+    """
+    Local stand-in of the event server, answering every message with an acknowledgement
+    and counting the connections it accepted.
+    """
+    def __init__(self, port : int = 0):
+        self.connections = 0
+        self.received = []
+        self.close_after = None
+        self.server = serve(self.handler, "127.0.0.1", port)
+        self.port = self.server.socket.getsockname()[1]
+        self.thread = threading.Thread(target=self.server.serve_forever, daemon=True)
+        self.thread.start()
+
+    def handler(self, websocket):
+        self.connections += 1
+        for message in websocket:
+            self.received.append(message)
+            if self.close_after is not None and len(self.received) >= self.close_after:
+                self.close_after = None
+                websocket.close()
+                return
+            websocket.send(f"ack {message}")
+
+    def shutdown(self):
+        self.server.shutdown()
+        self.thread.join(1)
+
+
+class WebSocketConnectionTest(unittest.TestCase):
+    def setUp(self):
+        """
+        Start a local server stand-in and a connection to it.
+        """
+        self.server = WebSocketServerStandIn()
+        self.connection = WebSocketConnection(
+            f"ws://127.0.0.1:{self.server.port}", min_backoff=0.05, max_backoff=0.2
+        )
+
+    def tearDown(self):
+        self.connection.stop()
+        self.server.shutdown()
+
+    def test_uploads_share_one_connection(self):
+        """
+        Test if every message is sent over the same connection and gets its own acknowledgement.
+        """
+        futures = [self.connection.send(f"event-{i}", timeout=2) for i in range(10)]
+        acknowledgements = [future.result(2) for future in futures]
+
+        self.assertEqual(acknowledgements, [f"ack event-{i}" for i in range(10)])
+        self.assertEqual(self.server.connections, 1)
+        self.assertEqual(self.connection.get_stats()["acknowledged_messages"], 10)
+        self.assertEqual(self.connection.get_stats()["in_flight"], 0)
+
+    def test_blocked_send_does_not_hold_the_state(self):
+        """
+        Test if the stats stay readable while a send is blocked on a slow link, and if the concurrent
+        senders still get their own acknowledgement.
+        """
+        self.assertEqual(self.connection.request("first", timeout=2), "ack first")
+        websocket = self.connection.websocket
+        websocket_send = websocket.send
+        released = threading.Event()
+        websocket.send = lambda message: (released.wait(2), websocket_send(message))
+
+        results = {}
+        senders = [
+            threading.Thread(target=lambda i=i: results.update({i: self.connection.request(f"event-{i}", timeout=5)}))
+            for i in range(3)
+        ]
+        for sender in senders:
+            sender.start()
+        time.sleep(0.05)
+
+        stats_reader = threading.Thread(target=self.connection.get_stats)
+        stats_reader.start()
+        stats_reader.join(0.5)
+        self.assertFalse(stats_reader.is_alive())
+        self.assertEqual(self.connection.get_stats()["in_flight"], 1)
+
+        released.set()
+        for sender in senders:
+            sender.join(5)
+        self.assertEqual(results, {i: f"ack event-{i}" for i in range(3)})
+
+    def test_reconnects_after_the_connection_drops(self):
+        """
+        Test if the in-flight message fails when the server drops the connection and the next one
+        is sent over a new connection.
+        """
+        self.assertEqual(self.connection.request("first", timeout=2), "ack first")
+
+        self.server.close_after = 2
+        with self.assertRaises(ConnectionError):
+            self.connection.request("dropped", timeout=2)
+
+        self.assertEqual(self.connection.request("after reconnect", timeout=2), "ack after reconnect")
+        self.assertEqual(self.server.connections, 2)
+        self.assertEqual(self.connection.get_stats()["failed_messages"], 1)
+
+    def test_connects_once_the_server_is_up(self):
+        """
+        Test if the connection keeps retrying with a backoff until the server is reachable.
+        """
+        port = self.server.port
+        self.server.shutdown()
+
+        self.connection.start()
+        self.assertFalse(self.connection.connected_event.wait(0.3))
+        with self.assertRaises(ConnectionError):
+            self.connection.send("unreachable", timeout=0.1).result(1)
+
+        self.server = WebSocketServerStandIn(port)
+        self.assertEqual(self.connection.request("late", timeout=2), "ack late")
+
+
+if __name__ == '__main__':
+    unittest.main()